@@ -0,0 +1,220 @@
+using System.Globalization;
+using System.Text.Json;
+using System.Text.Json.Nodes;
+
+namespace MjCuadrado.NetSdk.Benchmarks;
+
+/// <summary>
+/// Resultado de un benchmark: tiempo medio por operación y bytes asignados por operación
+/// </summary>
+public sealed record BenchmarkMeasurement(string Name, double MeanNanoseconds, long AllocatedBytes);
+
+/// <summary>
+/// Baseline versionado en el repo (baseline.json) con los umbrales de regresión permitidos
+/// </summary>
+public sealed class Baseline
+{
+    /// <summary>
+    /// Porcentaje máximo que puede empeorar el tiempo medio antes de considerarse regresión
+    /// </summary>
+    public double MeanThresholdPercent { get; init; } = 15;
+
+    /// <summary>
+    /// Porcentaje máximo que pueden crecer los bytes asignados antes de considerarse regresión
+    /// </summary>
+    public double AllocatedThresholdPercent { get; init; } = 5;
+
+    /// <summary>
+    /// Mediciones de referencia indexadas por nombre completo del benchmark
+    /// </summary>
+    public Dictionary<string, BenchmarkMeasurement> Benchmarks { get; init; } = new(StringComparer.Ordinal);
+
+    /// <summary>
+    /// Carga el baseline; si el archivo no existe devuelve uno vacío con los umbrales por defecto
+    /// </summary>
+    public static Baseline Load(string path)
+    {
+        if (!File.Exists(path))
+        {
+            return new Baseline();
+        }
+
+        var root = JsonNode.Parse(File.ReadAllText(path))
+            ?? throw new InvalidDataException($"Baseline vacío: {path}");
+
+        var baseline = new Baseline
+        {
+            MeanThresholdPercent = root["thresholds"]?["meanPercent"]?.GetValue<double>() ?? 15,
+            AllocatedThresholdPercent = root["thresholds"]?["allocatedPercent"]?.GetValue<double>() ?? 5
+        };
+
+        if (root["benchmarks"] is JsonObject benchmarks)
+        {
+            foreach (var (name, node) in benchmarks)
+            {
+                if (node == null)
+                {
+                    continue;
+                }
+
+                baseline.Benchmarks[name] = new BenchmarkMeasurement(
+                    name,
+                    node["meanNs"]?.GetValue<double>() ?? 0,
+                    node["allocatedBytes"]?.GetValue<long>() ?? 0);
+            }
+        }
+
+        return baseline;
+    }
+
+    /// <summary>
+    /// Guarda el baseline con las mediciones dadas, conservando los umbrales actuales
+    /// </summary>
+    public void Save(string path, IEnumerable<BenchmarkMeasurement> measurements)
+    {
+        var benchmarks = new JsonObject();
+        foreach (var measurement in measurements.OrderBy(m => m.Name, StringComparer.Ordinal))
+        {
+            benchmarks[measurement.Name] = new JsonObject
+            {
+                ["meanNs"] = Math.Round(measurement.MeanNanoseconds, 1),
+                ["allocatedBytes"] = measurement.AllocatedBytes
+            };
+        }
+
+        var root = new JsonObject
+        {
+            ["thresholds"] = new JsonObject
+            {
+                ["meanPercent"] = MeanThresholdPercent,
+                ["allocatedPercent"] = AllocatedThresholdPercent
+            },
+            ["benchmarks"] = benchmarks
+        };
+
+        File.WriteAllText(path, root.ToJsonString(new JsonSerializerOptions { WriteIndented = true }) + Environment.NewLine);
+    }
+
+    /// <summary>
+    /// Lee los reportes <c>*-report-full.json</c> que genera el JsonExporter de BenchmarkDotNet
+    /// </summary>
+    public static List<BenchmarkMeasurement> ReadResults(string resultsDirectory)
+    {
+        var measurements = new List<BenchmarkMeasurement>();
+        if (!Directory.Exists(resultsDirectory))
+        {
+            return measurements;
+        }
+
+        foreach (var file in Directory.EnumerateFiles(resultsDirectory, "*-report-full.json"))
+        {
+            using var document = JsonDocument.Parse(File.ReadAllText(file));
+            foreach (var benchmark in document.RootElement.GetProperty("Benchmarks").EnumerateArray())
+            {
+                // Un benchmark que falló no tiene estadísticas
+                if (!benchmark.TryGetProperty("Statistics", out var statistics) || statistics.ValueKind != JsonValueKind.Object)
+                {
+                    continue;
+                }
+
+                var allocated = benchmark.TryGetProperty("Memory", out var memory)
+                    && memory.TryGetProperty("BytesAllocatedPerOperation", out var bytes)
+                    && bytes.ValueKind == JsonValueKind.Number
+                        ? bytes.GetInt64()
+                        : 0;
+
+                measurements.Add(new BenchmarkMeasurement(
+                    benchmark.GetProperty("FullName").GetString()!,
+                    statistics.GetProperty("Mean").GetDouble(),
+                    allocated));
+            }
+        }
+
+        return measurements;
+    }
+
+    /// <summary>
+    /// Compara las mediciones actuales con el baseline e imprime una fila por benchmark.
+    /// Un benchmark sin medición de referencia cuenta como fallo, salvo que el baseline todavía no tenga
+    /// ninguna medición registrada: en ese caso solo se avisa, para no bloquear hasta grabar el primero.
+    /// </summary>
+    /// <returns>Número de benchmarks que superan algún umbral o no tienen baseline</returns>
+    public int Compare(IEnumerable<BenchmarkMeasurement> current, TextWriter output)
+    {
+        var failures = 0;
+        var missingIsFailure = Benchmarks.Count > 0;
+
+        output.WriteLine();
+        output.WriteLine($"Comparación con baseline (umbrales: tiempo +{MeanThresholdPercent}%, allocations +{AllocatedThresholdPercent}%)");
+        output.WriteLine();
+
+        foreach (var measurement in current.OrderBy(m => m.Name, StringComparer.Ordinal))
+        {
+            if (!Benchmarks.TryGetValue(measurement.Name, out var reference))
+            {
+                if (missingIsFailure)
+                {
+                    failures++;
+                }
+
+                output.WriteLine($"  SIN BASE  {measurement.Name}: {FormatTime(measurement.MeanNanoseconds)}, {measurement.AllocatedBytes} B (regístralo con --update-baseline)");
+                continue;
+            }
+
+            var meanDelta = PercentChange(reference.MeanNanoseconds, measurement.MeanNanoseconds);
+            var allocatedDelta = PercentChange(reference.AllocatedBytes, measurement.AllocatedBytes);
+            var regressed = meanDelta > MeanThresholdPercent || allocatedDelta > AllocatedThresholdPercent;
+
+            if (regressed)
+            {
+                failures++;
+            }
+
+            output.WriteLine(
+                $"  {(regressed ? "REGRESIÓN" : "OK       ")} {measurement.Name}: " +
+                $"{FormatTime(reference.MeanNanoseconds)} → {FormatTime(measurement.MeanNanoseconds)} ({FormatPercent(meanDelta)}), " +
+                $"{reference.AllocatedBytes} B → {measurement.AllocatedBytes} B ({FormatPercent(allocatedDelta)})");
+        }
+
+        if (!missingIsFailure)
+        {
+            output.WriteLine();
+            output.WriteLine("  Aviso: el baseline no tiene mediciones; regístralas con --update-baseline en la máquina de referencia");
+        }
+
+        output.WriteLine();
+        return failures;
+    }
+
+    #region Helper Methods
+
+    private static double PercentChange(double reference, double current)
+    {
+        if (reference == 0)
+        {
+            // Pasar de 0 a algo es una regresión infinita; de 0 a 0, ningún cambio
+            return current == 0 ? 0 : double.PositiveInfinity;
+        }
+
+        return (current - reference) / reference * 100;
+    }
+
+    private static string FormatPercent(double value)
+    {
+        return double.IsPositiveInfinity(value)
+            ? "+∞"
+            : value.ToString("+0.0;-0.0;0.0", CultureInfo.InvariantCulture) + "%";
+    }
+
+    private static string FormatTime(double nanoseconds)
+    {
+        return nanoseconds switch
+        {
+            >= 1_000_000 => (nanoseconds / 1_000_000).ToString("0.00", CultureInfo.InvariantCulture) + " ms",
+            >= 1_000 => (nanoseconds / 1_000).ToString("0.00", CultureInfo.InvariantCulture) + " μs",
+            _ => nanoseconds.ToString("0.0", CultureInfo.InvariantCulture) + " ns"
+        };
+    }
+
+    #endregion
+}
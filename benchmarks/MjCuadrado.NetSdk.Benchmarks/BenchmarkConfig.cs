@@ -0,0 +1,19 @@
+using BenchmarkDotNet.Configs;
+using BenchmarkDotNet.Diagnosers;
+using BenchmarkDotNet.Exporters.Json;
+
+namespace MjCuadrado.NetSdk.Benchmarks;
+
+/// <summary>
+/// Configuración común: medición de allocations y export JSON completo para comparar con el baseline
+/// </summary>
+public static class BenchmarkConfig
+{
+    public static IConfig Create(string artifactsPath)
+    {
+        return DefaultConfig.Instance
+            .WithArtifactsPath(artifactsPath)
+            .AddDiagnoser(MemoryDiagnoser.Default)
+            .AddExporter(JsonExporter.Full);
+    }
+}
@@ -0,0 +1,55 @@
+using MjCuadrado.NetSdk.Models;
+using MjCuadrado.NetSdk.Services;
+
+namespace MjCuadrado.NetSdk.Benchmarks;
+
+/// <summary>
+/// Carpeta temporal aislada para los benchmarks que tocan disco; se elimina al hacer Dispose
+/// </summary>
+public sealed class BenchmarkWorkspace : IDisposable
+{
+    public BenchmarkWorkspace()
+    {
+        Root = Path.Combine(Path.GetTempPath(), $"mjcuadrado-bench-{Guid.NewGuid():N}");
+        Directory.CreateDirectory(Root);
+    }
+
+    /// <summary>
+    /// Ruta absoluta de la carpeta temporal
+    /// </summary>
+    public string Root { get; }
+
+    /// <summary>
+    /// Crea el ProjectInfo de un proyecto dentro del workspace (sin generar nada en disco)
+    /// </summary>
+    public ProjectInfo CreateProjectInfo(string name)
+    {
+        return new ProjectInfo
+        {
+            Name = name,
+            BasePath = Path.Combine(Root, name),
+            Author = "@bench",
+            Framework = "net10.0",
+            SdkVersion = "0.1.0",
+            CreatedDate = "2025-01-01"
+        };
+    }
+
+    /// <summary>
+    /// Genera un proyecto completo (estructura + config.json + READMEs) como lo haría init
+    /// </summary>
+    public ProjectInfo GenerateProject(string name)
+    {
+        var projectInfo = CreateProjectInfo(name);
+        new TemplateService(new FileSystemService()).GenerateProjectStructure(projectInfo);
+        return projectInfo;
+    }
+
+    public void Dispose()
+    {
+        if (Directory.Exists(Root))
+        {
+            Directory.Delete(Root, recursive: true);
+        }
+    }
+}
@@ -0,0 +1,54 @@
+using BenchmarkDotNet.Attributes;
+using MjCuadrado.NetSdk.Models;
+using MjCuadrado.NetSdk.Services;
+
+namespace MjCuadrado.NetSdk.Benchmarks;
+
+/// <summary>
+/// Benchmarks de carga, merge y validación de config.json
+/// </summary>
+public class ConfigurationServiceBenchmarks
+{
+    private BenchmarkWorkspace _workspace = null!;
+    private ConfigurationService _cachedService = null!;
+    private string _configPath = null!;
+    private SdkConfiguration _config = null!;
+    private SdkConfiguration _overrides = null!;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _workspace = new BenchmarkWorkspace();
+        var projectInfo = _workspace.GenerateProject("config");
+        _configPath = Path.Combine(projectInfo.BasePath, ".mjcuadrado-net-sdk", "config.json");
+
+        _cachedService = new ConfigurationService(new ConfigurationCache());
+        _config = _cachedService.LoadConfiguration(_configPath);
+
+        _overrides = _cachedService.CreateDefaultConfiguration(projectInfo);
+        _overrides.Project.Name = "overridden";
+        _overrides.Project.Author = "@override";
+    }
+
+    [GlobalCleanup]
+    public void Cleanup() => _workspace.Dispose();
+
+    /// <summary>
+    /// Carga con el archivo sin cambios: la resuelve la caché (stat + clon)
+    /// </summary>
+    [Benchmark]
+    public SdkConfiguration LoadConfiguration_Cached() => _cachedService.LoadConfiguration(_configPath);
+
+    /// <summary>
+    /// Primera carga del proceso: lectura y deserialización completa
+    /// </summary>
+    [Benchmark]
+    public SdkConfiguration LoadConfiguration_Uncached() =>
+        new ConfigurationService(new ConfigurationCache()).LoadConfiguration(_configPath);
+
+    [Benchmark]
+    public SdkConfiguration MergeConfigurations() => _cachedService.MergeConfigurations(_config, _overrides);
+
+    [Benchmark]
+    public ValidationResult ValidateConfiguration() => _cachedService.ValidateConfiguration(_config);
+}
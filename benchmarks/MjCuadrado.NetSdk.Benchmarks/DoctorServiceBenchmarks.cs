@@ -0,0 +1,37 @@
+using BenchmarkDotNet.Attributes;
+using MjCuadrado.NetSdk.Services;
+
+namespace MjCuadrado.NetSdk.Benchmarks;
+
+/// <summary>
+/// Benchmarks del check de estructura de doctor sobre un proyecto recién inicializado
+/// </summary>
+public class DoctorServiceBenchmarks
+{
+    private BenchmarkWorkspace _workspace = null!;
+    private DoctorService _doctorService = null!;
+    private string _originalDirectory = null!;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _workspace = new BenchmarkWorkspace();
+        var projectInfo = _workspace.GenerateProject("doctor");
+
+        // CheckProjectStructure inspecciona el directorio actual
+        _originalDirectory = Directory.GetCurrentDirectory();
+        Directory.SetCurrentDirectory(projectInfo.BasePath);
+
+        _doctorService = new DoctorService(new FileSystemService(), new ConfigurationService(new ConfigurationCache()));
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        Directory.SetCurrentDirectory(_originalDirectory);
+        _workspace.Dispose();
+    }
+
+    [Benchmark]
+    public (bool Success, List<string> MissingItems) CheckProjectStructure() => _doctorService.CheckProjectStructure();
+}
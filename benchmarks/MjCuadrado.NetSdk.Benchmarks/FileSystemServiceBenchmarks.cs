@@ -0,0 +1,35 @@
+using BenchmarkDotNet.Attributes;
+using MjCuadrado.NetSdk.Services;
+
+namespace MjCuadrado.NetSdk.Benchmarks;
+
+/// <summary>
+/// Benchmarks de las operaciones de disco más usadas por init y doctor
+/// </summary>
+public class FileSystemServiceBenchmarks
+{
+    private BenchmarkWorkspace _workspace = null!;
+    private FileSystemService _fileSystemService = null!;
+    private string _filePath = null!;
+    private string _content = null!;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _workspace = new BenchmarkWorkspace();
+        _fileSystemService = new FileSystemService();
+        _filePath = Path.Combine(_workspace.Root, "docs", "README.md");
+
+        // Tamaño similar al de los READMEs generados por init
+        _content = string.Join('\n', Enumerable.Range(0, 100).Select(i => $"- Línea {i} del documento generado"));
+    }
+
+    [GlobalCleanup]
+    public void Cleanup() => _workspace.Dispose();
+
+    [Benchmark]
+    public bool WriteTextFile() => _fileSystemService.WriteTextFile(_filePath, _content);
+
+    [Benchmark]
+    public bool HasWritePermissions() => _fileSystemService.HasWritePermissions(_workspace.Root);
+}
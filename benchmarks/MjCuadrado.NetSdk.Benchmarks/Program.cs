@@ -0,0 +1,83 @@
+using BenchmarkDotNet.Running;
+using MjCuadrado.NetSdk.Benchmarks;
+
+// Uso:
+//   dotnet run -c Release --project benchmarks/MjCuadrado.NetSdk.Benchmarks -- [--baseline <ruta>] [--update-baseline] [argumentos de BenchmarkDotNet]
+//
+// --baseline <ruta>    compara con el baseline y devuelve 1 si algún benchmark supera los umbrales
+// --update-baseline    reescribe el baseline con los resultados de esta ejecución
+
+string? baselinePath = null;
+var updateBaseline = false;
+var benchmarkArgs = new List<string>();
+
+for (var i = 0; i < args.Length; i++)
+{
+    switch (args[i])
+    {
+        case "--baseline" when i + 1 < args.Length:
+            baselinePath = args[++i];
+            break;
+        case "--update-baseline":
+            updateBaseline = true;
+            break;
+        default:
+            benchmarkArgs.Add(args[i]);
+            break;
+    }
+}
+
+if (updateBaseline && baselinePath == null)
+{
+    Console.Error.WriteLine("--update-baseline requiere --baseline <ruta>");
+    return 2;
+}
+
+// Artefactos limpios en cada ejecución para no mezclar reportes de corridas anteriores
+var artifactsPath = Path.Combine(Directory.GetCurrentDirectory(), "BenchmarkDotNet.Artifacts");
+var resultsPath = Path.Combine(artifactsPath, "results");
+if (Directory.Exists(resultsPath))
+{
+    Directory.Delete(resultsPath, recursive: true);
+}
+
+BenchmarkSwitcher
+    .FromAssembly(typeof(BenchmarkConfig).Assembly)
+    .Run(benchmarkArgs.ToArray(), BenchmarkConfig.Create(artifactsPath));
+
+if (baselinePath == null)
+{
+    return 0;
+}
+
+var measurements = Baseline.ReadResults(resultsPath);
+if (measurements.Count == 0)
+{
+    Console.Error.WriteLine($"No se encontraron resultados en {resultsPath}");
+    return 2;
+}
+
+var baseline = Baseline.Load(baselinePath);
+
+if (updateBaseline)
+{
+    // Conserva las mediciones de benchmarks que no se ejecutaron en esta corrida (ej: con --filter)
+    foreach (var measurement in measurements)
+    {
+        baseline.Benchmarks[measurement.Name] = measurement;
+    }
+
+    baseline.Save(baselinePath, baseline.Benchmarks.Values);
+    Console.WriteLine($"Baseline actualizado: {baselinePath} ({baseline.Benchmarks.Count} benchmarks)");
+    return 0;
+}
+
+var failures = baseline.Compare(measurements, Console.Out);
+if (failures > 0)
+{
+    Console.Error.WriteLine($"{failures} benchmark(s) superan los umbrales o no tienen baseline (usa --update-baseline para registrarlos)");
+    return 1;
+}
+
+Console.WriteLine("Sin regresiones respecto al baseline");
+return 0;
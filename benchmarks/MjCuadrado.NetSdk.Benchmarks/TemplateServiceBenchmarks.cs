@@ -0,0 +1,59 @@
+using BenchmarkDotNet.Attributes;
+using MjCuadrado.NetSdk.Models;
+using MjCuadrado.NetSdk.Services;
+
+namespace MjCuadrado.NetSdk.Benchmarks;
+
+/// <summary>
+/// Benchmarks de renderizado de templates y generación de la estructura de proyecto
+/// </summary>
+public class TemplateServiceBenchmarks
+{
+    private BenchmarkWorkspace _workspace = null!;
+    private TemplateService _templateService = null!;
+    private ProjectInfo _existingProject = null!;
+    private ProjectInfo _freshProject = null!;
+    private Dictionary<string, string> _variables = null!;
+    private string _content = null!;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _workspace = new BenchmarkWorkspace();
+        _templateService = new TemplateService(new FileSystemService());
+
+        _existingProject = _workspace.GenerateProject("existing");
+        _existingProject.Force = true;
+
+        _variables = _templateService.CreateVariablesDictionary(_existingProject);
+        _content = _templateService.GetTemplateContent("config.json.template");
+    }
+
+    [GlobalCleanup]
+    public void Cleanup() => _workspace.Dispose();
+
+    [Benchmark]
+    public string ReplaceVariables() => _templateService.ReplaceVariables(_content, _variables);
+
+    [IterationSetup(Target = nameof(GenerateProjectStructure_Fresh))]
+    public void ResetFreshProject()
+    {
+        _freshProject = _workspace.CreateProjectInfo("fresh");
+        if (Directory.Exists(_freshProject.BasePath))
+        {
+            Directory.Delete(_freshProject.BasePath, recursive: true);
+        }
+    }
+
+    /// <summary>
+    /// init sobre una carpeta vacía: crea todas las carpetas y escribe todos los archivos
+    /// </summary>
+    [Benchmark]
+    public bool GenerateProjectStructure_Fresh() => _templateService.GenerateProjectStructure(_freshProject);
+
+    /// <summary>
+    /// init --force sobre un proyecto sin cambios: solo hashea y compara, sin escribir
+    /// </summary>
+    [Benchmark]
+    public bool GenerateProjectStructure_Unchanged() => _templateService.GenerateProjectStructure(_existingProject);
+}
@@ -0,0 +1,23 @@
+#!/usr/bin/env bash
+#
+# Ejecuta los benchmarks y los compara con el baseline versionado.
+# Devuelve 1 si algún benchmark empeora más que los umbrales de baseline.json.
+#
+# Uso:
+#   scripts/bench.sh                      # todos los benchmarks, compara con el baseline
+#   scripts/bench.sh '*Template*'         # solo los que coinciden con el filtro
+#   UPDATE_BASELINE=1 scripts/bench.sh    # registra los resultados como nuevo baseline
+
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "$0")/.." && pwd)"
+PROJECT="$ROOT/benchmarks/MjCuadrado.NetSdk.Benchmarks"
+FILTER="${1:-*}"
+
+ARGS=(--baseline "$PROJECT/baseline.json" --filter "$FILTER")
+if [[ "${UPDATE_BASELINE:-0}" == "1" ]]; then
+    ARGS+=(--update-baseline)
+fi
+
+cd "$ROOT"
+dotnet run -c Release --project "$PROJECT" -- "${ARGS[@]}"
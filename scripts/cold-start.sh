@@ -0,0 +1,132 @@
+#!/usr/bin/env bash
+#
+# Publica mjcuadrado-net-sdk y mide el arranque en frío (proceso nuevo en cada ejecución)
+# de `version`, `doctor` e `init`. Falla si la mediana de algún comando supera su presupuesto.
+#
+# Uso:
+#   scripts/cold-start.sh [single-file|aot]
+#
+# Variables de entorno:
+#   RUNS=15                  ejecuciones medidas por comando (más 1 de calentamiento)
+#   BUDGET_VERSION_MS=60     presupuesto de `version`
+#   BUDGET_DOCTOR_MS=1000    presupuesto de `doctor` (incluye lanzar `dotnet --version` y `git`)
+#   BUDGET_INIT_MS=150       presupuesto de `init` en una carpeta vacía
+#   SKIP_PUBLISH=1           reutiliza el binario ya publicado
+#   MEASURE_ONLY=1           solo mide y reporta, sin fallar por presupuesto
+#
+# Los presupuestos son provisionales hasta fijarlos con las medianas que publica CI: el script añade
+# una tabla con las mediciones al resumen del job ($GITHUB_STEP_SUMMARY) para registrarlas.
+
+set -euo pipefail
+
+PROFILE="${1:-single-file}"
+RUNS="${RUNS:-15}"
+BUDGET_VERSION_MS="${BUDGET_VERSION_MS:-60}"
+BUDGET_DOCTOR_MS="${BUDGET_DOCTOR_MS:-1000}"
+BUDGET_INIT_MS="${BUDGET_INIT_MS:-150}"
+
+ROOT="$(cd "$(dirname "$0")/.." && pwd)"
+PROJECT="$ROOT/src/MjCuadrado.NetSdk"
+
+case "$(uname -s)-$(uname -m)" in
+    Linux-x86_64) RID=linux-x64 ;;
+    Linux-aarch64) RID=linux-arm64 ;;
+    Darwin-x86_64) RID=osx-x64 ;;
+    Darwin-arm64) RID=osx-arm64 ;;
+    *) echo "Plataforma no soportada: $(uname -s)-$(uname -m)" >&2; exit 2 ;;
+esac
+
+BIN="$PROJECT/bin/publish/$PROFILE/$RID/mjcuadrado-net-sdk"
+
+if [[ "${SKIP_PUBLISH:-0}" != "1" ]]; then
+    echo "Publicando perfil '$PROFILE' para $RID..."
+    dotnet publish "$PROJECT" -r "$RID" -p:PublishProfile="$PROFILE" --nologo -v quiet
+fi
+
+if [[ ! -x "$BIN" ]]; then
+    echo "No se encontró el binario publicado: $BIN" >&2
+    exit 2
+fi
+
+WORK="$(mktemp -d)"
+trap 'rm -rf "$WORK"' EXIT
+
+now_ns() {
+    date +%s%N
+}
+
+# Mediana en milisegundos de RUNS ejecuciones del comando (la primera se descarta como calentamiento)
+measure() {
+    local samples=()
+    local i start end
+    for ((i = 0; i <= RUNS; i++)); do
+        start=$(now_ns)
+        "$@" > /dev/null 2>&1 || true
+        end=$(now_ns)
+        if ((i > 0)); then
+            samples+=($(((end - start) / 1000000)))
+        fi
+    done
+    printf '%s\n' "${samples[@]}" | sort -n | awk '{ v[NR] = $1 } END { print (NR % 2) ? v[(NR + 1) / 2] : int((v[NR / 2] + v[NR / 2 + 1]) / 2) }'
+}
+
+init_in_fresh_dir() {
+    local dir
+    dir="$(mktemp -d "$WORK/init.XXXXXX")"
+    (cd "$dir" && "$BIN" init cold-start)
+}
+
+# Smoke test: las mediciones ignoran el código de salida, así que antes se comprueba que el binario
+# publicado enlaza opciones y argumentos (lo que rompe el trimming si se pierde la reflexión de Spectre)
+smoke() {
+    local dir
+    dir="$(mktemp -d "$WORK/smoke.XXXXXX")"
+    local status=0
+    "$BIN" version --verbose > /dev/null || return 1
+    # doctor devuelve 1 si algún check falla (ej: carpeta sin proyecto); cualquier otro código es un error
+    "$BIN" doctor --timeout 5 > /dev/null 2>&1 || status=$?
+    ((status <= 1)) || return 1
+    (cd "$dir" && "$BIN" init smoke --author @ci > /dev/null) || return 1
+    grep -q '"@ci"' "$dir/smoke/.mjcuadrado-net-sdk/config.json"
+}
+
+if ! smoke; then
+    echo "Smoke test fallido: el binario publicado no funciona ($BIN)" >&2
+    exit 1
+fi
+
+failed=0
+SUMMARY="${GITHUB_STEP_SUMMARY:-/dev/null}"
+
+check() {
+    local name="$1" budget="$2" median="$3"
+    local status="OK"
+    if ((median > budget)); then
+        status="EXCEDIDO"
+        failed=1
+    fi
+    printf '%-10s %6d ms  (presupuesto %5d ms)  %s\n' "$name" "$median" "$budget" "$status"
+    printf '| `%s` | %d ms | %d ms | %s |\n' "$name" "$median" "$budget" "$status" >> "$SUMMARY"
+}
+
+echo "Binario: $BIN ($(du -h "$BIN" | cut -f1))"
+echo "Mediana de $RUNS ejecuciones:"
+
+{
+    echo "### Arranque en frío: perfil \`$PROFILE\` ($RID, $(du -h "$BIN" | cut -f1))"
+    echo
+    echo "Mediana de $RUNS ejecuciones"
+    echo
+    echo "| Comando | Mediana | Presupuesto | Estado |"
+    echo "|---------|---------|-------------|--------|"
+} >> "$SUMMARY"
+
+check "version" "$BUDGET_VERSION_MS" "$(measure "$BIN" version)"
+check "doctor" "$BUDGET_DOCTOR_MS" "$(cd "$WORK" && measure "$BIN" doctor)"
+check "init" "$BUDGET_INIT_MS" "$(measure init_in_fresh_dir)"
+
+if [[ "${MEASURE_ONLY:-0}" == "1" ]]; then
+    exit 0
+fi
+
+exit $failed
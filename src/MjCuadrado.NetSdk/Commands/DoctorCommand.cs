@@ -1,4 +1,7 @@
 using System.ComponentModel;
+using System.Diagnostics.CodeAnalysis;
+using System.Text.Json;
+using MjCuadrado.NetSdk.Models;
 using MjCuadrado.NetSdk.Services;
 using Spectre.Console;
 using Spectre.Console.Cli;
@@ -12,22 +15,83 @@ public class DoctorCommand : Command<DoctorCommand.Settings>
 {
     private readonly IDoctorService _doctorService;
 
+    // Spectre.Console.Cli enlaza los settings por reflexión: conservarlos al recortar (trimming/AOT)
+    [DynamicDependency(DynamicallyAccessedMemberTypes.PublicConstructors | DynamicallyAccessedMemberTypes.PublicProperties, typeof(Settings))]
     public DoctorCommand(IDoctorService doctorService)
     {
         _doctorService = doctorService ?? throw new ArgumentNullException(nameof(doctorService));
     }
 
-    public class Settings : CommandSettings
+    public class Settings : GlobalSettings
     {
         [CommandOption("--verbose")]
         [Description("Muestra información detallada del diagnóstico")]
         public bool Verbose { get; set; }
+
+        [CommandOption("--timeout <SEGUNDOS>")]
+        [Description("Tiempo máximo por check en segundos (default: 10)")]
+        public int? Timeout { get; set; }
+
+        [CommandOption("--no-cache")]
+        [Description("Ignora la caché de sondas y vuelve a ejecutar dotnet y git")]
+        public bool NoCache { get; set; }
+
+        [CommandOption("--recursive <RAIZ>")]
+        [Description("Busca todos los proyectos bajo RAIZ y valida su estructura y config.json en paralelo")]
+        public string? Recursive { get; set; }
+
+        [CommandOption("--json")]
+        [Description("Con --recursive, imprime el reporte en JSON en lugar de una tabla")]
+        public bool Json { get; set; }
+
+        public override Spectre.Console.ValidationResult Validate()
+        {
+            if (Timeout is <= 0)
+            {
+                return Spectre.Console.ValidationResult.Error("--timeout debe ser mayor que cero");
+            }
+
+            if (Recursive != null && string.IsNullOrWhiteSpace(Recursive))
+            {
+                return Spectre.Console.ValidationResult.Error("--recursive requiere una ruta");
+            }
+
+            if (Json && Recursive == null)
+            {
+                return Spectre.Console.ValidationResult.Error("--json solo se puede usar junto con --recursive");
+            }
+
+            // El modo workspace no ejecuta sondas: estas opciones no tendrían efecto
+            if (Recursive != null && Timeout.HasValue)
+            {
+                return Spectre.Console.ValidationResult.Error("--timeout no se puede usar con --recursive");
+            }
+
+            if (Recursive != null && NoCache)
+            {
+                return Spectre.Console.ValidationResult.Error("--no-cache no se puede usar con --recursive");
+            }
+
+            return Spectre.Console.ValidationResult.Success();
+        }
     }
 
     public override int Execute(CommandContext context, Settings settings)
     {
         try
         {
+            if (settings.Recursive != null)
+            {
+                return ExecuteRecursive(settings);
+            }
+
+            if (settings.Timeout.HasValue)
+            {
+                _doctorService.CheckTimeout = TimeSpan.FromSeconds(settings.Timeout.Value);
+            }
+
+            _doctorService.BypassProbeCache = settings.NoCache;
+
             // Header
             var panel = new Panel(
                 Align.Center(
@@ -40,10 +104,14 @@ public class DoctorCommand : Command<DoctorCommand.Settings>
             AnsiConsole.Write(panel);
             AnsiConsole.WriteLine();
 
-            // Ejecutar diagnóstico con spinner
-            var result = AnsiConsole.Status()
-                .Spinner(Spinner.Known.Dots)
-                .Start("[yellow]Ejecutando verificaciones...[/]", ctx => _doctorService.RunFullDiagnostic());
+            // Ejecutar diagnóstico con spinner (los checks corren en paralelo)
+            DiagnosticResult result;
+            using (SdkTelemetry.StartActivity("doctor.diagnostic"))
+            {
+                result = AnsiConsole.Status()
+                    .Spinner(Spinner.Known.Dots)
+                    .Start("[yellow]Ejecutando verificaciones...[/]", ctx => _doctorService.RunFullDiagnostic());
+            }
 
             // Mostrar tabla de resultados
             DisplayResults(result, settings.Verbose);
@@ -122,6 +190,7 @@ public class DoctorCommand : Command<DoctorCommand.Settings>
         table.AddColumn(new TableColumn("[bold]Check[/]"));
         table.AddColumn(new TableColumn("[bold]Status[/]"));
         table.AddColumn(new TableColumn("[bold]Details[/]"));
+        table.AddColumn(new TableColumn("[bold]Time[/]").RightAligned());
 
         foreach (var check in result.Checks)
         {
@@ -136,10 +205,96 @@ public class DoctorCommand : Command<DoctorCommand.Settings>
             table.AddRow(
                 check.Name,
                 statusMarkup,
-                details
+                Markup.Escape(details),
+                $"{check.Duration.TotalMilliseconds:F0} ms"
             );
         }
 
         AnsiConsole.Write(table);
+
+        if (verbose)
+        {
+            AnsiConsole.MarkupLine($"[dim]Tiempo total: {result.Duration.TotalMilliseconds:F0} ms[/]");
+        }
+    }
+
+    #region Recursive
+
+    private int ExecuteRecursive(Settings settings)
+    {
+        WorkspaceDiagnosticResult result;
+        try
+        {
+            result = settings.Json
+                ? _doctorService.CheckWorkspace(settings.Recursive!)
+                : AnsiConsole.Status()
+                    .Spinner(Spinner.Known.Dots)
+                    .Start("[yellow]Buscando proyectos...[/]", _ => _doctorService.CheckWorkspace(settings.Recursive!));
+        }
+        catch (DirectoryNotFoundException)
+        {
+            AnsiConsole.MarkupLine($"[red]✗ El directorio no existe: {Markup.Escape(settings.Recursive!)}[/]");
+            return 1;
+        }
+
+        if (settings.Json)
+        {
+            // Console directo: el JSON no debe pasar por el wrapping ni el markup de Spectre
+            Console.WriteLine(JsonSerializer.Serialize(result, SdkJsonContext.Default.WorkspaceDiagnosticResult));
+        }
+        else
+        {
+            DisplayWorkspaceResults(result, settings.Verbose);
+        }
+
+        return result.AllProjectsHealthy ? 0 : 1;
+    }
+
+    private static void DisplayWorkspaceResults(WorkspaceDiagnosticResult result, bool verbose)
+    {
+        if (result.Projects.Count == 0)
+        {
+            AnsiConsole.MarkupLine($"[yellow]⚠ No se encontraron proyectos en {Markup.Escape(result.RootPath)}[/]");
+            return;
+        }
+
+        var table = new Table();
+        table.Border(TableBorder.Rounded);
+        table.AddColumn(new TableColumn("[bold]Proyecto[/]"));
+        table.AddColumn(new TableColumn("[bold]Estado[/]"));
+        table.AddColumn(new TableColumn("[bold]Detalle[/]"));
+        table.AddColumn(new TableColumn("[bold]Tiempo[/]").RightAligned());
+
+        foreach (var project in result.Projects)
+        {
+            // Con muchos proyectos, por defecto solo se listan los que tienen problemas
+            if (project.Success && !verbose)
+            {
+                continue;
+            }
+
+            var problems = project.MissingItems.Concat(project.ConfigErrors).ToList();
+            var name = project.Name != null ? $" [dim]({Markup.Escape(project.Name)})[/]" : string.Empty;
+
+            table.AddRow(
+                Markup.Escape(project.Path) + name,
+                project.Success ? "[green]✓ OK[/]" : $"[red]✗ {problems.Count} problema(s)[/]",
+                Markup.Escape(problems.Count > 0 ? string.Join(", ", problems) : "OK"),
+                $"{project.Duration.TotalMilliseconds:F0} ms");
+        }
+
+        if (table.Rows.Count > 0)
+        {
+            AnsiConsole.Write(table);
+        }
+
+        var failedCount = result.Projects.Count(p => !p.Success);
+        var summary = $"{result.Projects.Count} proyecto(s) en {result.Duration.TotalMilliseconds:F0} ms";
+
+        AnsiConsole.MarkupLine(failedCount == 0
+            ? $"[green]✓ {summary}, todos correctos[/]"
+            : $"[red]✗ {summary}, {failedCount} con problemas[/]");
     }
+
+    #endregion
 }
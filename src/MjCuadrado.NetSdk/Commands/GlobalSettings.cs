@@ -0,0 +1,18 @@
+using System.ComponentModel;
+using Spectre.Console.Cli;
+
+namespace MjCuadrado.NetSdk.Commands;
+
+/// <summary>
+/// Opciones comunes a todos los comandos
+/// </summary>
+public class GlobalSettings : CommandSettings
+{
+    [CommandOption("--timings")]
+    [Description("Muestra el desglose de tiempos por fase")]
+    public bool Timings { get; set; }
+
+    [CommandOption("--timings-file <RUTA>")]
+    [Description("Como --timings y además escribe un trace JSON en RUTA (chrome://tracing, Perfetto)")]
+    public string? TimingsFile { get; set; }
+}
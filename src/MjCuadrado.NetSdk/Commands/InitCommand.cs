@@ -1,4 +1,6 @@
 using System.ComponentModel;
+using System.Diagnostics;
+using System.Diagnostics.CodeAnalysis;
 using System.Text.RegularExpressions;
 using MjCuadrado.NetSdk.Models;
 using MjCuadrado.NetSdk.Services;
@@ -12,10 +14,14 @@ namespace MjCuadrado.NetSdk.Commands;
 /// </summary>
 public class InitCommand : Command<InitCommand.Settings>
 {
+    private const long MinimumDiskSpace = 10 * 1024 * 1024; // 10 MB por proyecto
+
     private readonly IFileSystemService _fileSystemService;
     private readonly IConfigurationService _configurationService;
     private readonly ITemplateService _templateService;
 
+    // Spectre.Console.Cli enlaza los settings por reflexión: conservarlos al recortar (trimming/AOT)
+    [DynamicDependency(DynamicallyAccessedMemberTypes.PublicConstructors | DynamicallyAccessedMemberTypes.PublicProperties, typeof(Settings))]
     public InitCommand(
         IFileSystemService fileSystemService,
         IConfigurationService configurationService,
@@ -26,16 +32,24 @@ public class InitCommand : Command<InitCommand.Settings>
         _templateService = templateService ?? throw new ArgumentNullException(nameof(templateService));
     }
 
-    public class Settings : CommandSettings
+    public class Settings : GlobalSettings
     {
         [CommandArgument(0, "[nombre-proyecto]")]
         [Description("Nombre del proyecto a crear. Si se omite, inicializa en el directorio actual.")]
         public string? ProjectName { get; set; }
 
         [CommandOption("--force")]
-        [Description("Sobrescribe archivos existentes si el proyecto ya existe")]
+        [Description("Re-sincroniza un proyecto existente: solo reescribe los archivos generados que cambiaron y no editaste")]
         public bool Force { get; set; }
 
+        [CommandOption("--overwrite-modified")]
+        [Description("Con --force, sobrescribe también los archivos generados que hayas editado")]
+        public bool OverwriteModified { get; set; }
+
+        [CommandOption("--dry-run")]
+        [Description("Muestra las escrituras planificadas sin modificar nada")]
+        public bool DryRun { get; set; }
+
         [CommandOption("--author")]
         [Description("Autor del proyecto (default: @user)")]
         public string Author { get; set; } = "@user";
@@ -43,70 +57,120 @@ public class InitCommand : Command<InitCommand.Settings>
         [CommandOption("--framework")]
         [Description("Framework target (default: net10.0)")]
         public string Framework { get; set; } = "net10.0";
+
+        [CommandOption("--manifest <RUTA>")]
+        [Description("Manifiesto JSON de workspace para crear varios proyectos en un solo proceso")]
+        public string? Manifest { get; set; }
+
+        [CommandOption("--parallel <N>")]
+        [Description("Máximo de proyectos creados en paralelo con --manifest (default: nº de CPUs)")]
+        public int Parallel { get; set; } = Environment.ProcessorCount;
+
+        public override Spectre.Console.ValidationResult Validate()
+        {
+            if (!string.IsNullOrWhiteSpace(Manifest) && !string.IsNullOrWhiteSpace(ProjectName))
+            {
+                return Spectre.Console.ValidationResult.Error("No se puede usar [nombre-proyecto] junto con --manifest");
+            }
+
+            if (Parallel <= 0)
+            {
+                return Spectre.Console.ValidationResult.Error("--parallel debe ser mayor que cero");
+            }
+
+            if (OverwriteModified && !Force)
+            {
+                return Spectre.Console.ValidationResult.Error("--overwrite-modified solo se puede usar junto con --force");
+            }
+
+            return Spectre.Console.ValidationResult.Success();
+        }
     }
 
     public override int Execute(CommandContext context, Settings settings)
     {
         try
         {
+            if (!string.IsNullOrWhiteSpace(settings.Manifest))
+            {
+                return ExecuteBatch(settings);
+            }
+
             // 1. Determinar ruta y nombre del proyecto
             var (projectPath, projectName) = DetermineProjectPath(settings);
 
-            // 2. Validar nombre del proyecto
-            if (!IsValidProjectName(projectName))
+            // 2-5. Validaciones previas (nombre, existencia, permisos, espacio)
+            using (SdkTelemetry.StartActivity("init.preflight"))
             {
-                AnsiConsole.MarkupLine("[red]✗ Error: Nombre de proyecto inválido[/]");
-                AnsiConsole.MarkupLine($"[yellow]El nombre '{projectName}' contiene caracteres no permitidos.[/]");
-                AnsiConsole.MarkupLine("[dim]Caracteres permitidos: letras, números, guiones, puntos y underscores[/]");
-                return 1;
-            }
+                // 2. Validar nombre del proyecto
+                if (!IsValidProjectName(projectName))
+                {
+                    AnsiConsole.MarkupLine("[red]✗ Error: Nombre de proyecto inválido[/]");
+                    AnsiConsole.MarkupLine($"[yellow]El nombre '{projectName}' contiene caracteres no permitidos.[/]");
+                    AnsiConsole.MarkupLine("[dim]Caracteres permitidos: letras, números, guiones, puntos y underscores[/]");
+                    return 1;
+                }
 
-            // 3. Validar que el directorio no exista (o usar --force)
-            if (!settings.Force && _fileSystemService.DirectoryExists(projectPath))
-            {
-                var configPath = Path.Combine(projectPath, ".mjcuadrado-net-sdk", "config.json");
-                if (_fileSystemService.FileExists(configPath))
+                // 3. Validar que el directorio no exista (o usar --force)
+                if (!settings.Force && _fileSystemService.DirectoryExists(projectPath))
+                {
+                    var configPath = Path.Combine(projectPath, ".mjcuadrado-net-sdk", "config.json");
+                    if (_fileSystemService.FileExists(configPath))
+                    {
+                        AnsiConsole.MarkupLine("[red]✗ Error: El proyecto ya existe en esta ubicación[/]");
+                        AnsiConsole.MarkupLine($"[yellow]Ubicación: {projectPath}[/]");
+                        AnsiConsole.MarkupLine("[dim]Usa --force para sobrescribir[/]");
+                        return 1;
+                    }
+                }
+
+                // 4. Validar permisos de escritura
+                if (!_fileSystemService.HasWritePermissions(projectPath))
                 {
-                    AnsiConsole.MarkupLine("[red]✗ Error: El proyecto ya existe en esta ubicación[/]");
-                    AnsiConsole.MarkupLine($"[yellow]Ubicación: {projectPath}[/]");
-                    AnsiConsole.MarkupLine("[dim]Usa --force para sobrescribir[/]");
+                    AnsiConsole.MarkupLine("[red]✗ Error: Sin permisos de escritura[/]");
+                    AnsiConsole.MarkupLine($"[yellow]No tienes permisos para escribir en: {projectPath}[/]");
+                    return 1;
+                }
+
+                // 5. Validar espacio en disco (mínimo 10MB)
+                var availableSpace = _fileSystemService.GetAvailableDiskSpace(projectPath);
+                if (availableSpace < MinimumDiskSpace)
+                {
+                    AnsiConsole.MarkupLine("[red]✗ Error: Espacio en disco insuficiente[/]");
+                    AnsiConsole.MarkupLine($"[yellow]Disponible: {availableSpace / (1024 * 1024)} MB, Requerido: 10 MB[/]");
                     return 1;
                 }
             }
 
-            // 4. Validar permisos de escritura
-            if (!_fileSystemService.HasWritePermissions(projectPath))
+            // 6. Dry run: mostrar el plan sin escribir
+            if (settings.DryRun)
             {
-                AnsiConsole.MarkupLine("[red]✗ Error: Sin permisos de escritura[/]");
-                AnsiConsole.MarkupLine($"[yellow]No tienes permisos para escribir en: {projectPath}[/]");
-                return 1;
+                var plan = _templateService.PlanProjectStructure(
+                    CreateProjectInfo(projectPath, projectName, settings.Author, settings.Framework, settings.Force, settings.OverwriteModified));
+                DisplayGenerationPlan(plan);
+                return 0;
             }
 
-            // 5. Validar espacio en disco (mínimo 10MB)
-            var availableSpace = _fileSystemService.GetAvailableDiskSpace(projectPath);
-            if (availableSpace < 10 * 1024 * 1024) // 10 MB
+            // 7. Crear proyecto con spinner
+            GenerationPlan? appliedPlan;
+            using (SdkTelemetry.StartActivity("init.generate"))
             {
-                AnsiConsole.MarkupLine("[red]✗ Error: Espacio en disco insuficiente[/]");
-                AnsiConsole.MarkupLine($"[yellow]Disponible: {availableSpace / (1024 * 1024)} MB, Requerido: 10 MB[/]");
-                return 1;
+                appliedPlan = AnsiConsole.Status()
+                    .Spinner(Spinner.Known.Dots)
+                    .Start("[yellow]Inicializando proyecto...[/]", ctx =>
+                    {
+                        return CreateProject(projectPath, projectName, settings, ctx);
+                    });
             }
 
-            // 6. Crear proyecto con spinner
-            var success = AnsiConsole.Status()
-                .Spinner(Spinner.Known.Dots)
-                .Start("[yellow]Inicializando proyecto...[/]", ctx =>
-                {
-                    return CreateProject(projectPath, projectName, settings, ctx);
-                });
-
-            if (!success)
+            if (appliedPlan == null)
             {
                 AnsiConsole.MarkupLine("[red]✗ Error al crear el proyecto[/]");
                 return 1;
             }
 
-            // 7. Mostrar resumen de éxito
-            DisplaySuccessSummary(projectPath, projectName);
+            // 8. Mostrar resumen de éxito (incluye los archivos editados que se conservaron)
+            DisplaySuccessSummary(projectPath, projectName, appliedPlan);
 
             return 0;
         }
@@ -147,43 +211,334 @@ public class InitCommand : Command<InitCommand.Settings>
         return !name.Any(c => invalidChars.Contains(c));
     }
 
-    private bool CreateProject(string projectPath, string projectName, Settings settings, StatusContext ctx)
+    /// <summary>
+    /// Planifica y aplica la estructura del proyecto; devuelve el plan aplicado o null si falló
+    /// </summary>
+    private GenerationPlan? CreateProject(string projectPath, string projectName, Settings settings, StatusContext ctx)
     {
         try
         {
             // Crear ProjectInfo
-            var projectInfo = new ProjectInfo
-            {
-                Name = projectName,
-                BasePath = projectPath,
-                Author = settings.Author,
-                Framework = settings.Framework,
-                SdkVersion = "0.1.0",
-                CreatedDate = DateTime.UtcNow.ToString("yyyy-MM-dd"),
-                Force = settings.Force
-            };
+            var projectInfo = CreateProjectInfo(projectPath, projectName, settings.Author, settings.Framework, settings.Force, settings.OverwriteModified);
+
+            // Paso 1: Calcular qué archivos crear, actualizar o conservar
+            ctx.Status("[yellow]Planificando estructura...[/]");
+            var plan = _templateService.PlanProjectStructure(projectInfo);
 
-            // Paso 1: Crear estructura de carpetas
+            // Paso 2: Crear carpetas, escribir archivos y actualizar el manifiesto
             ctx.Status("[yellow]Creando estructura de carpetas...[/]");
-            var success = _templateService.GenerateProjectStructure(projectInfo);
+            _templateService.ApplyGenerationPlan(plan);
+
+            ctx.Status("[yellow]Configuración completada...[/]");
 
-            if (!success)
+            return plan;
+        }
+        catch (Exception)
+        {
+            return null;
+        }
+    }
+
+    private static ProjectInfo CreateProjectInfo(string projectPath, string projectName, string author, string framework, bool force, bool overwriteModified)
+    {
+        return new ProjectInfo
+        {
+            Name = projectName,
+            BasePath = projectPath,
+            Author = author,
+            Framework = framework,
+            SdkVersion = "0.1.0",
+            CreatedDate = DateTime.UtcNow.ToString("yyyy-MM-dd"),
+            Force = force,
+            OverwriteModified = overwriteModified
+        };
+    }
+
+    private static void DisplayGenerationPlan(GenerationPlan plan)
+    {
+        AnsiConsole.MarkupLine($"[bold]Dry run:[/] {Markup.Escape(plan.BasePath)}");
+        AnsiConsole.WriteLine();
+
+        var table = new Table();
+        table.Border(TableBorder.Rounded);
+        table.AddColumn("[bold]Archivo[/]");
+        table.AddColumn("[bold]Acción[/]");
+
+        foreach (var file in plan.Files)
+        {
+            table.AddRow($"[cyan]{Markup.Escape(file.RelativePath)}[/]", FormatAction(file.Action));
+        }
+
+        AnsiConsole.Write(table);
+        AnsiConsole.WriteLine();
+        AnsiConsole.MarkupLine($"[dim]{FormatPlanSummary(plan)}. No se escribió ningún archivo.[/]");
+        DisplayMissingManifestWarning(plan);
+    }
+
+    private static void DisplayMissingManifestWarning(GenerationPlan plan)
+    {
+        var overwritten = plan.Count(PlannedFileAction.Overwrite);
+        if (plan.PreviousManifest != null || overwritten == 0)
+        {
+            return;
+        }
+
+        AnsiConsole.MarkupLine(
+            $"[yellow]⚠ No existe {TemplateService.GenerationManifestPath}: no se pueden detectar ediciones " +
+            $"y --force sobrescribe {overwritten} archivo(s) que difieren del template[/]");
+    }
+
+    private static string FormatAction(PlannedFileAction action) => action switch
+    {
+        PlannedFileAction.Create => "[green]crear[/]",
+        PlannedFileAction.Update => "[yellow]actualizar[/]",
+        PlannedFileAction.Overwrite => "[red]sobrescribir (editado)[/]",
+        PlannedFileAction.KeepModified => "[blue]conservar (editado)[/]",
+        _ => "[dim]sin cambios[/]"
+    };
+
+    private static string FormatPlanSummary(GenerationPlan plan)
+    {
+        return $"{plan.Count(PlannedFileAction.Create)} a crear, " +
+               $"{plan.Count(PlannedFileAction.Update) + plan.Count(PlannedFileAction.Overwrite)} a actualizar, " +
+               $"{plan.Count(PlannedFileAction.Unchanged)} sin cambios, " +
+               $"{plan.Count(PlannedFileAction.KeepModified)} editados conservados";
+    }
+
+    #region Batch (--manifest)
+
+    private int ExecuteBatch(Settings settings)
+    {
+        // 1. Cargar y validar el manifiesto
+        var currentDir = _fileSystemService.GetCurrentDirectory();
+        var manifestPath = Path.GetFullPath(Path.Combine(currentDir, settings.Manifest!));
+        var manifest = _configurationService.LoadWorkspaceManifest(manifestPath);
+        var manifestDir = Path.GetDirectoryName(manifestPath) ?? currentDir;
+
+        var validation = _configurationService.ValidateWorkspaceManifest(manifest, manifestDir);
+        if (!validation.IsValid)
+        {
+            AnsiConsole.MarkupLine("[red]✗ Error: Manifiesto de workspace inválido[/]");
+            foreach (var error in validation.Errors)
             {
-                return false;
+                AnsiConsole.MarkupLine($"[yellow]  • {Markup.Escape(error.ToString())}[/]");
             }
+            return 1;
+        }
 
-            // Paso 2: Generar config.json ya se hace en GenerateProjectStructure
-            ctx.Status("[yellow]Configuración completada...[/]");
+        // 2. Resolver rutas y valores por defecto de cada proyecto
+        var workspaceRoot = Path.GetFullPath(Path.Combine(manifestDir, manifest.Root ?? string.Empty));
+        var projects = manifest.Projects
+            .Select(p => new BatchProject(
+                p.Name,
+                Path.GetFullPath(Path.Combine(workspaceRoot, p.Path ?? p.Name)),
+                p.Author ?? manifest.Author ?? settings.Author,
+                p.Framework ?? manifest.Framework ?? settings.Framework))
+            .ToList();
+
+        // 3. Preflight compartido: un solo probe de permisos y disco por carpeta padre
+        var preflightErrors = RunSharedPreflight(projects);
+
+        // 4. Crear proyectos en paralelo (los templates compilados se comparten vía ITemplateService)
+        var results = new BatchResult[projects.Count];
+        var stopwatch = Stopwatch.StartNew();
+
+        AnsiConsole.Status()
+            .Spinner(Spinner.Known.Dots)
+            .Start($"[yellow]Inicializando {projects.Count} proyectos...[/]", ctx =>
+            {
+                var completed = 0;
+                var options = new ParallelOptions { MaxDegreeOfParallelism = settings.Parallel };
+
+                Parallel.For(0, projects.Count, options, i =>
+                {
+                    results[i] = InitializeBatchProject(projects[i], preflightErrors, settings);
 
-            return true;
+                    var done = Interlocked.Increment(ref completed);
+                    lock (ctx)
+                    {
+                        ctx.Status($"[yellow]Inicializando proyectos... {done}/{projects.Count}[/]");
+                    }
+                });
+            });
+
+        stopwatch.Stop();
+
+        // 5. Resumen agregado
+        DisplayBatchSummary(results, stopwatch.Elapsed);
+
+        return results.Any(r => r.Status == BatchStatus.Failed) ? 1 : 0;
+    }
+
+    private Dictionary<string, string?> RunSharedPreflight(List<BatchProject> projects)
+    {
+        using var activity = SdkTelemetry.StartActivity("init.preflight");
+        // Mismo comparador que ValidateWorkspaceManifest: rutas que solo difieren en mayúsculas son la misma carpeta
+        var errors = new Dictionary<string, string?>(ConfigurationCache.PathComparer);
+
+        foreach (var group in projects.GroupBy(p => GetParentDirectory(p.Path), ConfigurationCache.PathComparer))
+        {
+            string? error = null;
+
+            if (!_fileSystemService.HasWritePermissions(group.Key))
+            {
+                error = $"Sin permisos de escritura en: {group.Key}";
+            }
+            else
+            {
+                var availableSpace = _fileSystemService.GetAvailableDiskSpace(group.Key);
+                var requiredSpace = MinimumDiskSpace * group.Count();
+                if (availableSpace < requiredSpace)
+                {
+                    error = $"Espacio en disco insuficiente: {availableSpace / (1024 * 1024)} MB disponibles, {requiredSpace / (1024 * 1024)} MB requeridos";
+                }
+            }
+
+            errors[group.Key] = error;
         }
-        catch (Exception)
+
+        return errors;
+    }
+
+    private BatchResult InitializeBatchProject(BatchProject project, Dictionary<string, string?> preflightErrors, Settings settings)
+    {
+        using var activity = SdkTelemetry.StartActivity("init.project");
+        activity?.SetTag("project.name", project.Name);
+
+        var stopwatch = Stopwatch.StartNew();
+
+        try
         {
-            return false;
+            if (!IsValidProjectName(project.Name))
+            {
+                return new BatchResult(project, BatchStatus.Failed, "Nombre de proyecto inválido", stopwatch.Elapsed);
+            }
+
+            var preflightError = preflightErrors[GetParentDirectory(project.Path)];
+            if (preflightError != null)
+            {
+                return new BatchResult(project, BatchStatus.Failed, preflightError, stopwatch.Elapsed);
+            }
+
+            if (!settings.Force && _fileSystemService.DirectoryExists(project.Path))
+            {
+                var configPath = Path.Combine(project.Path, ".mjcuadrado-net-sdk", "config.json");
+                if (_fileSystemService.FileExists(configPath))
+                {
+                    return new BatchResult(project, BatchStatus.Skipped, "Ya existe (usa --force para sobrescribir)", stopwatch.Elapsed);
+                }
+            }
+
+            var projectInfo = CreateProjectInfo(project.Path, project.Name, project.Author, project.Framework, settings.Force, settings.OverwriteModified);
+
+            if (settings.DryRun)
+            {
+                var plan = _templateService.PlanProjectStructure(projectInfo);
+                return new BatchResult(project, BatchStatus.Planned, FormatPlanSummary(plan), stopwatch.Elapsed);
+            }
+
+            var success = _templateService.GenerateProjectStructure(projectInfo);
+
+            return success
+                ? new BatchResult(project, BatchStatus.Created, project.Path, stopwatch.Elapsed)
+                : new BatchResult(project, BatchStatus.Failed, "Error al crear el proyecto", stopwatch.Elapsed);
+        }
+        catch (Exception ex)
+        {
+            return new BatchResult(project, BatchStatus.Failed, ex.Message, stopwatch.Elapsed);
+        }
+    }
+
+    private static string GetParentDirectory(string projectPath)
+    {
+        return Path.GetDirectoryName(projectPath) ?? projectPath;
+    }
+
+    private static void DisplayBatchSummary(IReadOnlyCollection<BatchResult> results, TimeSpan elapsed)
+    {
+        AnsiConsole.WriteLine();
+
+        var table = new Table();
+        table.Border(TableBorder.Rounded);
+        table.AddColumn("[bold]Proyecto[/]");
+        table.AddColumn("[bold]Estado[/]");
+        table.AddColumn(new TableColumn("[bold]Tiempo[/]").RightAligned());
+        table.AddColumn("[bold]Detalle[/]");
+
+        foreach (var result in results)
+        {
+            var status = result.Status switch
+            {
+                BatchStatus.Created => "[green]✓ Creado[/]",
+                BatchStatus.Skipped => "[yellow]↷ Omitido[/]",
+                BatchStatus.Planned => "[blue]• Dry run[/]",
+                _ => "[red]✗ Error[/]"
+            };
+
+            table.AddRow(
+                $"[cyan]{Markup.Escape(result.Project.Name)}[/]",
+                status,
+                $"{result.Elapsed.TotalMilliseconds:F0} ms",
+                Markup.Escape(result.Message));
+        }
+
+        AnsiConsole.Write(table);
+        AnsiConsole.WriteLine();
+
+        var created = results.Count(r => r.Status == BatchStatus.Created);
+        var skipped = results.Count(r => r.Status == BatchStatus.Skipped);
+        var planned = results.Count(r => r.Status == BatchStatus.Planned);
+        var failed = results.Count(r => r.Status == BatchStatus.Failed);
+        var color = failed > 0 ? "red" : "green";
+        var plannedText = planned > 0 ? $", {planned} en dry run" : string.Empty;
+
+        AnsiConsole.MarkupLine(
+            $"[{color}]{created} creado(s), {skipped} omitido(s){plannedText}, {failed} con error[/] [dim]en {elapsed.TotalSeconds:F2}s[/]");
+    }
+
+    private enum BatchStatus
+    {
+        Created,
+        Skipped,
+        Planned,
+        Failed
+    }
+
+    private sealed class BatchProject
+    {
+        public BatchProject(string name, string path, string author, string framework)
+        {
+            Name = name;
+            Path = path;
+            Author = author;
+            Framework = framework;
         }
+
+        public string Name { get; }
+        public string Path { get; }
+        public string Author { get; }
+        public string Framework { get; }
     }
 
-    private void DisplaySuccessSummary(string projectPath, string projectName)
+    private sealed class BatchResult
+    {
+        public BatchResult(BatchProject project, BatchStatus status, string message, TimeSpan elapsed)
+        {
+            Project = project;
+            Status = status;
+            Message = message;
+            Elapsed = elapsed;
+        }
+
+        public BatchProject Project { get; }
+        public BatchStatus Status { get; }
+        public string Message { get; }
+        public TimeSpan Elapsed { get; }
+    }
+
+    #endregion
+
+    private void DisplaySuccessSummary(string projectPath, string projectName, GenerationPlan plan)
     {
         AnsiConsole.WriteLine();
 
@@ -248,6 +603,22 @@ public class InitCommand : Command<InitCommand.Settings>
         AnsiConsole.Write(table);
         AnsiConsole.WriteLine();
 
+        // Archivos escritos y editados conservados: con --force puede que no se haya reescrito nada
+        AnsiConsole.MarkupLine($"[dim]{FormatPlanSummary(plan)}[/]");
+        var kept = plan.Files.Where(f => f.Action == PlannedFileAction.KeepModified).ToList();
+        if (kept.Count > 0)
+        {
+            foreach (var file in kept)
+            {
+                AnsiConsole.MarkupLine($"  {FormatAction(file.Action)} [cyan]{Markup.Escape(file.RelativePath)}[/]");
+            }
+
+            AnsiConsole.MarkupLine("[yellow]Usa --force --overwrite-modified para reemplazar los archivos editados[/]");
+        }
+
+        DisplayMissingManifestWarning(plan);
+        AnsiConsole.WriteLine();
+
         // Panel con próximos pasos
         var nextStepsPanel = new Panel(
             Align.Left(new Markup(
@@ -1,4 +1,5 @@
 using System.ComponentModel;
+using System.Diagnostics.CodeAnalysis;
 using System.Reflection;
 using System.Runtime.InteropServices;
 using Spectre.Console;
@@ -11,7 +12,13 @@ namespace MjCuadrado.NetSdk.Commands;
 /// </summary>
 public class VersionCommand : Command<VersionCommand.Settings>
 {
-    public class Settings : CommandSettings
+    // Spectre.Console.Cli enlaza los settings por reflexión: conservarlos al recortar (trimming/AOT)
+    [DynamicDependency(DynamicallyAccessedMemberTypes.PublicConstructors | DynamicallyAccessedMemberTypes.PublicProperties, typeof(Settings))]
+    public VersionCommand()
+    {
+    }
+
+    public class Settings : GlobalSettings
     {
         [CommandOption("--verbose")]
         [Description("Muestra información detallada de la versión")]
@@ -0,0 +1,79 @@
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+
+namespace MjCuadrado.NetSdk;
+
+/// <summary>
+/// Fuente de trazas (ActivitySource) e instrumentos de métricas (Meter) del SDK.
+/// Sin listeners registrados (el caso normal, sin --timings) los spans no se crean y las mediciones no cuestan nada.
+/// </summary>
+public static class SdkTelemetry
+{
+    /// <summary>
+    /// Nombre común del ActivitySource y del Meter
+    /// </summary>
+    public const string SourceName = "MjCuadrado.NetSdk";
+
+    public static readonly ActivitySource ActivitySource = new(SourceName, "0.1.0");
+
+    public static readonly Meter Meter = new(SourceName, "0.1.0");
+
+    /// <summary>
+    /// Tiempo de renderizado de cada template (tag: template)
+    /// </summary>
+    public static readonly Histogram<double> TemplateRenderDuration =
+        Meter.CreateHistogram<double>("mjcuadrado.template.render.duration", "ms", "Tiempo de renderizado de un template");
+
+    /// <summary>
+    /// Archivos escritos en disco
+    /// </summary>
+    public static readonly Counter<long> FilesWritten =
+        Meter.CreateCounter<long>("mjcuadrado.files.written", "{file}", "Archivos escritos");
+
+    /// <summary>
+    /// Bytes escritos en disco (UTF-8)
+    /// </summary>
+    public static readonly Counter<long> BytesWritten =
+        Meter.CreateCounter<long>("mjcuadrado.bytes.written", "By", "Bytes escritos");
+
+    /// <summary>
+    /// Latencia de arranque de procesos externos, hasta que Process.Start retorna (tag: process)
+    /// </summary>
+    public static readonly Histogram<double> ProcessSpawnDuration =
+        Meter.CreateHistogram<double>("mjcuadrado.process.spawn.duration", "ms", "Latencia de arranque de un proceso externo");
+
+    /// <summary>
+    /// Sondas de doctor (dotnet, git) resueltas desde la caché en disco, sin lanzar procesos (tag: tool)
+    /// </summary>
+    public static readonly Counter<long> ProbeCacheHits =
+        Meter.CreateCounter<long>("mjcuadrado.probe.cache.hits", "{probe}", "Sondas resueltas desde la caché");
+
+    /// <summary>
+    /// Sondas de doctor que tuvieron que ejecutarse (tag: tool)
+    /// </summary>
+    public static readonly Counter<long> ProbeCacheMisses =
+        Meter.CreateCounter<long>("mjcuadrado.probe.cache.misses", "{probe}", "Sondas ejecutadas por falta de entrada vigente");
+
+    /// <summary>
+    /// Tiempo de carga de config.json (tag: cache.hit)
+    /// </summary>
+    public static readonly Histogram<double> ConfigLoadDuration =
+        Meter.CreateHistogram<double>("mjcuadrado.config.load.duration", "ms", "Tiempo de carga de config.json");
+
+    /// <summary>
+    /// Tiempo de validación de una configuración
+    /// </summary>
+    public static readonly Histogram<double> ConfigValidateDuration =
+        Meter.CreateHistogram<double>("mjcuadrado.config.validate.duration", "ms", "Tiempo de validación de la configuración");
+
+    /// <summary>
+    /// Inicia un span del SDK; devuelve null si nadie está escuchando
+    /// </summary>
+    public static Activity? StartActivity(string name) => ActivitySource.StartActivity(name);
+
+    /// <summary>
+    /// Milisegundos transcurridos desde un <see cref="Stopwatch.GetTimestamp"/>
+    /// </summary>
+    public static double ElapsedMilliseconds(long startTimestamp) =>
+        Stopwatch.GetElapsedTime(startTimestamp).TotalMilliseconds;
+}
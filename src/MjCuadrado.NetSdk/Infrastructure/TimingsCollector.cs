@@ -0,0 +1,204 @@
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+using System.Text.Json;
+
+namespace MjCuadrado.NetSdk;
+
+/// <summary>
+/// Escucha los spans y las métricas de <see cref="SdkTelemetry"/> durante la ejecución de un comando (--timings)
+/// </summary>
+public sealed class TimingsCollector : IDisposable
+{
+    private const string ThreadIdProperty = "mjcuadrado.thread.id";
+
+    private readonly ActivityListener _activityListener;
+    private readonly MeterListener _meterListener;
+    private readonly ConcurrentQueue<Activity> _spans = new();
+    private readonly ConcurrentDictionary<string, MetricSummary> _metrics = new(StringComparer.Ordinal);
+
+    public TimingsCollector()
+    {
+        _activityListener = new ActivityListener
+        {
+            ShouldListenTo = source => source.Name == SdkTelemetry.SourceName,
+            Sample = (ref ActivityCreationOptions<ActivityContext> _) => ActivitySamplingResult.AllDataAndRecorded,
+            ActivityStarted = activity => activity.SetCustomProperty(ThreadIdProperty, Environment.CurrentManagedThreadId),
+            ActivityStopped = activity => _spans.Enqueue(activity)
+        };
+        ActivitySource.AddActivityListener(_activityListener);
+
+        _meterListener = new MeterListener
+        {
+            InstrumentPublished = (instrument, listener) =>
+            {
+                if (instrument.Meter.Name == SdkTelemetry.SourceName)
+                {
+                    listener.EnableMeasurementEvents(instrument);
+                }
+            }
+        };
+        _meterListener.SetMeasurementEventCallback<long>((instrument, value, _, _) => Record(instrument, value));
+        _meterListener.SetMeasurementEventCallback<double>((instrument, value, _, _) => Record(instrument, value));
+        _meterListener.Start();
+    }
+
+    /// <summary>
+    /// Spans terminados, ordenados por inicio
+    /// </summary>
+    public IReadOnlyList<Activity> Spans => _spans.OrderBy(s => s.StartTimeUtc).ToList();
+
+    /// <summary>
+    /// Resumen de cada instrumento que recibió mediciones, ordenado por nombre
+    /// </summary>
+    public IReadOnlyList<MetricSummary> Metrics => _metrics.Values.OrderBy(m => m.Name, StringComparer.Ordinal).ToList();
+
+    /// <summary>
+    /// Escribe los spans en formato Chrome trace (chrome://tracing, Perfetto) con las métricas en la clave "metrics"
+    /// </summary>
+    public void WriteChromeTrace(string path)
+    {
+        if (string.IsNullOrWhiteSpace(path))
+        {
+            throw new ArgumentException("La ruta no puede estar vacía", nameof(path));
+        }
+
+        var spans = Spans;
+        var origin = spans.Count > 0 ? spans[0].StartTimeUtc : DateTime.UtcNow;
+        var processId = Environment.ProcessId;
+
+        try
+        {
+            var directory = Path.GetDirectoryName(Path.GetFullPath(path));
+            if (!string.IsNullOrEmpty(directory))
+            {
+                Directory.CreateDirectory(directory);
+            }
+
+            using var stream = File.Create(path);
+            using var writer = new Utf8JsonWriter(stream, new JsonWriterOptions { Indented = true });
+
+            writer.WriteStartObject();
+            writer.WriteString("displayTimeUnit", "ms");
+
+            writer.WriteStartArray("traceEvents");
+            foreach (var span in spans)
+            {
+                writer.WriteStartObject();
+                writer.WriteString("name", span.OperationName);
+                writer.WriteString("cat", SdkTelemetry.SourceName);
+                writer.WriteString("ph", "X");
+                writer.WriteNumber("ts", Math.Round((span.StartTimeUtc - origin).TotalMicroseconds, 1));
+                writer.WriteNumber("dur", Math.Round(span.Duration.TotalMicroseconds, 1));
+                writer.WriteNumber("pid", processId);
+                writer.WriteNumber("tid", span.GetCustomProperty(ThreadIdProperty) as int? ?? 0);
+
+                writer.WriteStartObject("args");
+                foreach (var tag in span.TagObjects)
+                {
+                    writer.WriteString(tag.Key, Convert.ToString(tag.Value, System.Globalization.CultureInfo.InvariantCulture));
+                }
+
+                if (span.Status == ActivityStatusCode.Error)
+                {
+                    writer.WriteString("error", span.StatusDescription ?? "error");
+                }
+
+                writer.WriteEndObject();
+                writer.WriteEndObject();
+            }
+
+            writer.WriteEndArray();
+
+            writer.WriteStartArray("metrics");
+            foreach (var metric in Metrics)
+            {
+                writer.WriteStartObject();
+                writer.WriteString("name", metric.Name);
+                writer.WriteString("unit", metric.Unit);
+                writer.WriteString("kind", metric.IsHistogram ? "histogram" : "counter");
+                writer.WriteNumber("count", metric.Count);
+                writer.WriteNumber("sum", Math.Round(metric.Sum, 3));
+                writer.WriteEndObject();
+            }
+
+            writer.WriteEndArray();
+            writer.WriteEndObject();
+        }
+        catch (Exception ex) when (ex is UnauthorizedAccessException or IOException)
+        {
+            throw new IOException($"Error al escribir el trace: {path}", ex);
+        }
+    }
+
+    public void Dispose()
+    {
+        _activityListener.Dispose();
+        _meterListener.Dispose();
+    }
+
+    #region Helper Methods
+
+    private void Record(Instrument instrument, double value)
+    {
+        var summary = _metrics.GetOrAdd(
+            instrument.Name,
+            _ => new MetricSummary(instrument.Name, instrument.Unit ?? string.Empty, instrument is Histogram<double> or Histogram<long>));
+
+        summary.Add(value);
+    }
+
+    #endregion
+}
+
+/// <summary>
+/// Agregado de las mediciones de un instrumento: número de mediciones y suma
+/// </summary>
+public sealed class MetricSummary
+{
+    private readonly object _lock = new();
+    private long _count;
+    private double _sum;
+
+    public MetricSummary(string name, string unit, bool isHistogram)
+    {
+        Name = name;
+        Unit = unit;
+        IsHistogram = isHistogram;
+    }
+
+    public string Name { get; }
+    public string Unit { get; }
+    public bool IsHistogram { get; }
+
+    public long Count
+    {
+        get
+        {
+            lock (_lock)
+            {
+                return _count;
+            }
+        }
+    }
+
+    public double Sum
+    {
+        get
+        {
+            lock (_lock)
+            {
+                return _sum;
+            }
+        }
+    }
+
+    public void Add(double value)
+    {
+        lock (_lock)
+        {
+            _count++;
+            _sum += value;
+        }
+    }
+}
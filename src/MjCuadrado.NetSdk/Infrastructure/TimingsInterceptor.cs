@@ -0,0 +1,168 @@
+using System.Diagnostics;
+using MjCuadrado.NetSdk.Commands;
+using Spectre.Console;
+using Spectre.Console.Cli;
+
+namespace MjCuadrado.NetSdk;
+
+/// <summary>
+/// Activa <see cref="TimingsCollector"/> cuando el comando recibe --timings o --timings-file y, al terminar,
+/// muestra el desglose por fase en stderr (para no mezclarse con salidas como --json)
+/// </summary>
+public sealed class TimingsInterceptor : ICommandInterceptor
+{
+    private readonly IAnsiConsole _console;
+    private TimingsCollector? _collector;
+    private Activity? _commandActivity;
+    private string? _tracePath;
+
+    public TimingsInterceptor(IAnsiConsole? console = null)
+    {
+        _console = console ?? AnsiConsole.Create(new AnsiConsoleSettings
+        {
+            Out = new AnsiConsoleOutput(Console.Error)
+        });
+    }
+
+    public void Intercept(CommandContext context, CommandSettings settings)
+    {
+        if (settings is not GlobalSettings global || (!global.Timings && global.TimingsFile == null))
+        {
+            return;
+        }
+
+        _tracePath = string.IsNullOrWhiteSpace(global.TimingsFile) ? null : global.TimingsFile;
+        _collector = new TimingsCollector();
+
+        // Span raíz: los spans de los servicios cuelgan de él vía Activity.Current
+        _commandActivity = SdkTelemetry.StartActivity(context.Name);
+    }
+
+    public void InterceptResult(CommandContext context, CommandSettings settings, ref int result)
+    {
+        if (_collector == null)
+        {
+            return;
+        }
+
+        _commandActivity?.SetTag("exit.code", result);
+        _commandActivity?.Dispose();
+
+        using (_collector)
+        {
+            Render(_console, _collector);
+
+            if (_tracePath != null)
+            {
+                try
+                {
+                    _collector.WriteChromeTrace(_tracePath);
+                    _console.MarkupLine($"[dim]Trace escrito en {Markup.Escape(Path.GetFullPath(_tracePath))}[/]");
+                }
+                catch (IOException ex)
+                {
+                    _console.MarkupLine($"[red]✗ {Markup.Escape(ex.Message)}[/]");
+                }
+            }
+        }
+
+        _collector = null;
+        _commandActivity = null;
+    }
+
+    /// <summary>
+    /// Muestra la tabla de fases (spans hermanos con el mismo nombre agregados) y la de métricas
+    /// </summary>
+    public static void Render(IAnsiConsole console, TimingsCollector collector)
+    {
+        if (console == null)
+        {
+            throw new ArgumentNullException(nameof(console));
+        }
+
+        if (collector == null)
+        {
+            throw new ArgumentNullException(nameof(collector));
+        }
+
+        var spans = collector.Spans;
+        if (spans.Count == 0)
+        {
+            console.MarkupLine("[dim]--timings: no se registraron fases[/]");
+            return;
+        }
+
+        var spanIds = spans.Select(s => s.SpanId).ToHashSet();
+        var children = spans.ToLookup(s => s.ParentSpanId);
+        var roots = spans.Where(s => !spanIds.Contains(s.ParentSpanId)).ToList();
+        var totalMs = roots.Sum(s => s.Duration.TotalMilliseconds);
+
+        var phases = new Table()
+            .Border(TableBorder.Rounded)
+            .Title("[bold]Timings[/]")
+            .AddColumn("[bold]Fase[/]")
+            .AddColumn(new TableColumn("[bold]Tiempo[/]").RightAligned())
+            .AddColumn(new TableColumn("[bold]%[/]").RightAligned());
+
+        AddPhaseRows(phases, roots, children, 0, totalMs);
+        console.Write(phases);
+
+        var metrics = collector.Metrics;
+        if (metrics.Count == 0)
+        {
+            return;
+        }
+
+        var metricsTable = new Table()
+            .Border(TableBorder.Rounded)
+            .AddColumn("[bold]Métrica[/]")
+            .AddColumn(new TableColumn("[bold]Valor[/]").RightAligned());
+
+        foreach (var metric in metrics)
+        {
+            var value = metric.IsHistogram
+                ? $"{metric.Count} × {metric.Sum / metric.Count:F2} {metric.Unit} (total {metric.Sum:F1} {metric.Unit})"
+                : $"{metric.Sum:0.##} {metric.Unit}";
+
+            metricsTable.AddRow(Markup.Escape(metric.Name), Markup.Escape(value));
+        }
+
+        console.Write(metricsTable);
+    }
+
+    #region Helper Methods
+
+    /// <summary>
+    /// Agrega una fila por nombre de span; las fases repetidas (ej: un doctor.check por check)
+    /// muestran el número de ejecuciones y la suma de sus duraciones
+    /// </summary>
+    private static void AddPhaseRows(
+        Table table,
+        IReadOnlyList<Activity> spans,
+        ILookup<ActivitySpanId, Activity> children,
+        int depth,
+        double totalMs)
+    {
+        foreach (var group in spans.GroupBy(s => s.OperationName))
+        {
+            var members = group.ToList();
+            var durationMs = members.Sum(s => s.Duration.TotalMilliseconds);
+            var name = new string(' ', depth * 2) + group.Key + (members.Count > 1 ? $" ×{members.Count}" : string.Empty);
+            var percent = totalMs > 0 ? durationMs / totalMs * 100 : 0;
+
+            table.AddRow(Markup.Escape(name), $"{durationMs:F1} ms", $"{percent:F0}%");
+
+            var nested = members
+                .SelectMany(s => children[s.SpanId])
+                .OrderBy(s => s.StartTimeUtc)
+                .ToList();
+
+            if (nested.Count > 0)
+            {
+                AddPhaseRows(table, nested, children, depth + 1, totalMs);
+            }
+        }
+    }
+
+    #endregion
+}
@@ -1,10 +1,14 @@
+using System.Diagnostics.CodeAnalysis;
 using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.DependencyInjection.Extensions;
 using Spectre.Console.Cli;
 
 namespace MjCuadrado.NetSdk;
 
 /// <summary>
-/// Adaptador entre Spectre.Console.Cli y Microsoft.Extensions.DependencyInjection
+/// Adaptador entre Spectre.Console.Cli y Microsoft.Extensions.DependencyInjection.
+/// Las registraciones explícitas hechas en Program.cs tienen prioridad sobre las que Spectre
+/// hace por reflexión al descubrir comandos, de modo que el grafo de la app es seguro para trimming/AOT.
 /// </summary>
 public class TypeRegistrar : ITypeRegistrar
 {
@@ -20,9 +24,11 @@ public class TypeRegistrar : ITypeRegistrar
         return new TypeResolver(_services.BuildServiceProvider());
     }
 
-    public void Register(Type service, Type implementation)
+    public void Register(
+        Type service,
+        [DynamicallyAccessedMembers(DynamicallyAccessedMemberTypes.PublicConstructors)] Type implementation)
     {
-        _services.AddSingleton(service, implementation);
+        _services.TryAddSingleton(service, implementation);
     }
 
     public void RegisterInstance(Type service, object implementation)
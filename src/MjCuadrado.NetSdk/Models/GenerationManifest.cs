@@ -0,0 +1,46 @@
+using System.Text.Json.Serialization;
+
+namespace MjCuadrado.NetSdk.Models;
+
+/// <summary>
+/// Registro de los archivos generados por init (.mjcuadrado-net-sdk/generated.json).
+/// Permite que init --force reescriba solo lo que cambió y respete las ediciones del usuario.
+/// </summary>
+public class GenerationManifest
+{
+    /// <summary>
+    /// Versión del SDK que escribió el manifiesto
+    /// </summary>
+    [JsonPropertyName("sdk_version")]
+    public string SdkVersion { get; set; } = "0.1.0";
+
+    /// <summary>
+    /// Fecha de creación original del proyecto (se reutiliza en regeneraciones)
+    /// </summary>
+    [JsonPropertyName("created")]
+    public string? Created { get; set; }
+
+    /// <summary>
+    /// Archivos generados, indexados por ruta relativa al proyecto (separador '/')
+    /// </summary>
+    [JsonPropertyName("files")]
+    public Dictionary<string, GeneratedFileEntry> Files { get; set; } = new(StringComparer.Ordinal);
+}
+
+/// <summary>
+/// Archivo generado individual
+/// </summary>
+public class GeneratedFileEntry
+{
+    /// <summary>
+    /// Template del que se generó el archivo
+    /// </summary>
+    [JsonPropertyName("template")]
+    public string Template { get; set; } = string.Empty;
+
+    /// <summary>
+    /// SHA-256 (hex) del contenido escrito
+    /// </summary>
+    [JsonPropertyName("hash")]
+    public string Hash { get; set; } = string.Empty;
+}
@@ -0,0 +1,104 @@
+namespace MjCuadrado.NetSdk.Models;
+
+/// <summary>
+/// Escrituras planificadas para generar (o re-sincronizar) la estructura de un proyecto
+/// </summary>
+public class GenerationPlan
+{
+    /// <summary>
+    /// Ruta base del proyecto
+    /// </summary>
+    public string BasePath { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Fecha de creación usada para renderizar los templates
+    /// </summary>
+    public string Created { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Archivos del proyecto y la acción planificada para cada uno
+    /// </summary>
+    public List<PlannedFile> Files { get; set; } = new();
+
+    /// <summary>
+    /// Manifiesto existente antes de aplicar el plan (null si no había)
+    /// </summary>
+    public GenerationManifest? PreviousManifest { get; set; }
+
+    /// <summary>
+    /// Indica si el plan escribe al menos un archivo
+    /// </summary>
+    public bool HasWrites => Files.Any(f => f.IsWrite);
+
+    /// <summary>
+    /// Cuenta los archivos con una acción concreta
+    /// </summary>
+    public int Count(PlannedFileAction action) => Files.Count(f => f.Action == action);
+}
+
+/// <summary>
+/// Archivo individual dentro de un <see cref="GenerationPlan"/>
+/// </summary>
+public class PlannedFile
+{
+    /// <summary>
+    /// Ruta relativa al proyecto (separador '/')
+    /// </summary>
+    public string RelativePath { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Template del que se genera
+    /// </summary>
+    public string TemplateName { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Acción planificada
+    /// </summary>
+    public PlannedFileAction Action { get; set; }
+
+    /// <summary>
+    /// Contenido renderizado
+    /// </summary>
+    public string Content { get; set; } = string.Empty;
+
+    /// <summary>
+    /// SHA-256 (hex) del contenido renderizado
+    /// </summary>
+    public string Hash { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Indica si la acción escribe el archivo
+    /// </summary>
+    public bool IsWrite => Action is PlannedFileAction.Create or PlannedFileAction.Update or PlannedFileAction.Overwrite;
+}
+
+/// <summary>
+/// Acción planificada para un archivo generado
+/// </summary>
+public enum PlannedFileAction
+{
+    /// <summary>
+    /// El archivo no existe: se crea
+    /// </summary>
+    Create,
+
+    /// <summary>
+    /// El archivo no fue editado pero el template o las variables cambiaron: se reescribe
+    /// </summary>
+    Update,
+
+    /// <summary>
+    /// El contenido ya es el esperado: no se toca
+    /// </summary>
+    Unchanged,
+
+    /// <summary>
+    /// El usuario modificó el archivo: se conserva
+    /// </summary>
+    KeepModified,
+
+    /// <summary>
+    /// El usuario modificó el archivo pero se pidió sobrescribirlo (--overwrite-modified)
+    /// </summary>
+    Overwrite
+}
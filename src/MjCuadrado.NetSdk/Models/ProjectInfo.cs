@@ -36,7 +36,13 @@ public class ProjectInfo
     public string CreatedDate { get; set; } = DateTime.UtcNow.ToString("yyyy-MM-dd");
 
     /// <summary>
-    /// Indica si debe sobrescribir archivos existentes
+    /// Indica si debe sobrescribir archivos existentes.
+    /// Con manifiesto de generación solo reescribe los no editados; sin él sobrescribe los que difieren.
     /// </summary>
     public bool Force { get; set; } = false;
+
+    /// <summary>
+    /// Indica si debe sobrescribir archivos generados que el usuario modificó
+    /// </summary>
+    public bool OverwriteModified { get; set; } = false;
 }
@@ -21,6 +21,21 @@ public class SdkConfiguration
 
     [JsonPropertyName("optimization")]
     public OptimizationConfig Optimization { get; set; } = new();
+
+    /// <summary>
+    /// Crea una copia profunda de la configuración (las secciones null se reemplazan por sus valores por defecto)
+    /// </summary>
+    public SdkConfiguration Clone()
+    {
+        return new SdkConfiguration
+        {
+            Project = Project?.Clone() ?? new(),
+            Sdk = Sdk?.Clone() ?? new(),
+            Language = Language?.Clone() ?? new(),
+            GitHub = GitHub?.Clone() ?? new(),
+            Optimization = Optimization?.Clone() ?? new()
+        };
+    }
 }
 
 /// <summary>
@@ -54,6 +69,11 @@ public class ProjectConfig
 
     [JsonPropertyName("author")]
     public string Author { get; set; } = "@user";
+
+    /// <summary>
+    /// Crea una copia de la sección
+    /// </summary>
+    public ProjectConfig Clone() => (ProjectConfig)MemberwiseClone();
 }
 
 /// <summary>
@@ -66,6 +86,11 @@ public class SdkConfig
 
     [JsonPropertyName("min_dotnet_version")]
     public string MinDotNetVersion { get; set; } = "9.0.0";
+
+    /// <summary>
+    /// Crea una copia de la sección
+    /// </summary>
+    public SdkConfig Clone() => (SdkConfig)MemberwiseClone();
 }
 
 /// <summary>
@@ -78,6 +103,11 @@ public class LanguageConfig
 
     [JsonPropertyName("conversation_language_name")]
     public string ConversationLanguageName { get; set; } = "Spanish";
+
+    /// <summary>
+    /// Crea una copia de la sección
+    /// </summary>
+    public LanguageConfig Clone() => (LanguageConfig)MemberwiseClone();
 }
 
 /// <summary>
@@ -93,6 +123,11 @@ public class GitHubConfig
 
     [JsonPropertyName("auto_delete_branches")]
     public bool? AutoDeleteBranches { get; set; }
+
+    /// <summary>
+    /// Crea una copia de la sección
+    /// </summary>
+    public GitHubConfig Clone() => (GitHubConfig)MemberwiseClone();
 }
 
 /// <summary>
@@ -105,4 +140,9 @@ public class OptimizationConfig
 
     [JsonPropertyName("template_synced")]
     public bool TemplateSynced { get; set; } = false;
+
+    /// <summary>
+    /// Crea una copia de la sección
+    /// </summary>
+    public OptimizationConfig Clone() => (OptimizationConfig)MemberwiseClone();
 }
@@ -0,0 +1,23 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace MjCuadrado.NetSdk.Models;
+
+/// <summary>
+/// Contexto de System.Text.Json generado en compilación para los modelos del SDK.
+/// Evita la serialización por reflexión (arranque más rápido y compatible con trimming).
+/// </summary>
+[JsonSourceGenerationOptions(
+    PropertyNamingPolicy = JsonKnownNamingPolicy.CamelCase,
+    WriteIndented = true,
+    DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+    ReadCommentHandling = JsonCommentHandling.Skip,
+    AllowTrailingCommas = true)]
+[JsonSerializable(typeof(SdkConfiguration))]
+[JsonSerializable(typeof(WorkspaceManifest))]
+[JsonSerializable(typeof(GenerationManifest))]
+[JsonSerializable(typeof(WorkspaceDiagnosticResult))]
+[JsonSerializable(typeof(ToolProbeCacheFile))]
+public partial class SdkJsonContext : JsonSerializerContext
+{
+}
@@ -0,0 +1,99 @@
+using System.Text.Json.Serialization;
+
+namespace MjCuadrado.NetSdk.Models;
+
+/// <summary>
+/// Caché en disco de las sondas de herramientas de doctor (dotnet, git).
+/// Evita lanzar procesos cuando el ejecutable y su configuración no cambiaron.
+/// </summary>
+public class ToolProbeCacheFile
+{
+    /// <summary>
+    /// Entradas indexadas por herramienta y rutas de su huella
+    /// </summary>
+    [JsonPropertyName("entries")]
+    public Dictionary<string, ToolProbeEntry> Entries { get; set; } = new(StringComparer.Ordinal);
+}
+
+/// <summary>
+/// Resultado cacheado de una sonda junto con la huella de los archivos de los que depende
+/// </summary>
+public class ToolProbeEntry
+{
+    /// <summary>
+    /// Herramienta sondeada (dotnet, git)
+    /// </summary>
+    [JsonPropertyName("tool")]
+    public string Tool { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Estado del ejecutable resuelto y de los archivos de configuración que afectan al resultado
+    /// </summary>
+    [JsonPropertyName("stamps")]
+    public List<FileStamp> Stamps { get; set; } = new();
+
+    [JsonPropertyName("success")]
+    public bool Success { get; set; }
+
+    [JsonPropertyName("version")]
+    public string Version { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Solo git: user.name y user.email configurados
+    /// </summary>
+    [JsonPropertyName("configured")]
+    public bool Configured { get; set; }
+
+    /// <summary>
+    /// Momento de la sonda; las entradas más antiguas que la edad máxima se descartan
+    /// </summary>
+    [JsonPropertyName("probed_at")]
+    public DateTime ProbedAtUtc { get; set; }
+}
+
+/// <summary>
+/// Estado de un archivo o directorio: ruta, existencia, tamaño y fecha de escritura
+/// </summary>
+public class FileStamp
+{
+    [JsonPropertyName("path")]
+    public string Path { get; set; } = string.Empty;
+
+    [JsonPropertyName("exists")]
+    public bool Exists { get; set; }
+
+    [JsonPropertyName("length")]
+    public long Length { get; set; }
+
+    [JsonPropertyName("mtime")]
+    public DateTime LastWriteTimeUtc { get; set; }
+
+    /// <summary>
+    /// Captura el estado actual de un archivo o directorio (un directorio tiene tamaño 0)
+    /// </summary>
+    public static FileStamp Capture(string path)
+    {
+        var file = new FileInfo(path);
+        if (file.Exists)
+        {
+            return new FileStamp { Path = file.FullName, Exists = true, Length = file.Length, LastWriteTimeUtc = file.LastWriteTimeUtc };
+        }
+
+        var directory = new DirectoryInfo(path);
+        if (directory.Exists)
+        {
+            return new FileStamp { Path = directory.FullName, Exists = true, LastWriteTimeUtc = directory.LastWriteTimeUtc };
+        }
+
+        return new FileStamp { Path = file.FullName };
+    }
+
+    public bool Matches(FileStamp other)
+    {
+        return other != null
+            && string.Equals(Path, other.Path, StringComparison.Ordinal)
+            && Exists == other.Exists
+            && Length == other.Length
+            && LastWriteTimeUtc == other.LastWriteTimeUtc;
+    }
+}
@@ -0,0 +1,45 @@
+using System.Text.Json.Serialization;
+
+namespace MjCuadrado.NetSdk.Models;
+
+/// <summary>
+/// Resultado del diagnóstico recursivo de un workspace (doctor --recursive)
+/// </summary>
+public class WorkspaceDiagnosticResult
+{
+    public string RootPath { get; set; } = string.Empty;
+    public bool AllProjectsHealthy => Projects.All(p => p.Success);
+    public List<ProjectDiagnostic> Projects { get; set; } = new();
+
+    [JsonIgnore]
+    public TimeSpan Duration { get; set; }
+
+    [JsonPropertyName("durationMs")]
+    public double DurationMilliseconds => Math.Round(Duration.TotalMilliseconds, 1);
+}
+
+/// <summary>
+/// Diagnóstico de un proyecto dentro de un workspace
+/// </summary>
+public class ProjectDiagnostic
+{
+    /// <summary>
+    /// Ruta del proyecto relativa a la raíz del workspace
+    /// </summary>
+    public string Path { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Nombre del proyecto según su config.json (null si no se pudo leer)
+    /// </summary>
+    public string? Name { get; set; }
+
+    public bool Success => MissingItems.Count == 0 && ConfigErrors.Count == 0;
+    public List<string> MissingItems { get; set; } = new();
+    public List<string> ConfigErrors { get; set; } = new();
+
+    [JsonIgnore]
+    public TimeSpan Duration { get; set; }
+
+    [JsonPropertyName("durationMs")]
+    public double DurationMilliseconds => Math.Round(Duration.TotalMilliseconds, 1);
+}
@@ -0,0 +1,63 @@
+using System.Text.Json.Serialization;
+
+namespace MjCuadrado.NetSdk.Models;
+
+/// <summary>
+/// Manifiesto de workspace para inicializar varios proyectos en un solo proceso (init --manifest)
+/// </summary>
+public class WorkspaceManifest
+{
+    /// <summary>
+    /// Carpeta base de los proyectos, relativa al manifiesto (default: carpeta del manifiesto)
+    /// </summary>
+    [JsonPropertyName("root")]
+    public string? Root { get; set; }
+
+    /// <summary>
+    /// Autor por defecto de los proyectos
+    /// </summary>
+    [JsonPropertyName("author")]
+    public string? Author { get; set; }
+
+    /// <summary>
+    /// Framework por defecto de los proyectos
+    /// </summary>
+    [JsonPropertyName("framework")]
+    public string? Framework { get; set; }
+
+    /// <summary>
+    /// Proyectos a inicializar
+    /// </summary>
+    [JsonPropertyName("projects")]
+    public List<WorkspaceProject> Projects { get; set; } = new();
+}
+
+/// <summary>
+/// Proyecto individual dentro de un <see cref="WorkspaceManifest"/>
+/// </summary>
+public class WorkspaceProject
+{
+    /// <summary>
+    /// Nombre del proyecto
+    /// </summary>
+    [JsonPropertyName("name")]
+    public string Name { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Ruta del proyecto relativa al root del manifiesto (default: el nombre)
+    /// </summary>
+    [JsonPropertyName("path")]
+    public string? Path { get; set; }
+
+    /// <summary>
+    /// Autor (sobrescribe el del manifiesto)
+    /// </summary>
+    [JsonPropertyName("author")]
+    public string? Author { get; set; }
+
+    /// <summary>
+    /// Framework (sobrescribe el del manifiesto)
+    /// </summary>
+    [JsonPropertyName("framework")]
+    public string? Framework { get; set; }
+}
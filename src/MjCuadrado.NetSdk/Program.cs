@@ -10,8 +10,15 @@ var services = new ServiceCollection();
 services.AddSingleton<IFileSystemService, FileSystemService>();
 services.AddSingleton<IConfigurationService, ConfigurationService>();
 services.AddSingleton<ITemplateService, TemplateService>();
+services.AddSingleton<ToolProbeCache>();
 services.AddSingleton<IDoctorService, DoctorService>();
 
+// Comandos registrados con genéricos (constructores preservados para trimming/AOT);
+// TypeRegistrar no los reemplaza con la registración por reflexión de Spectre
+services.AddSingleton<InitCommand>();
+services.AddSingleton<DoctorCommand>();
+services.AddSingleton<VersionCommand>();
+
 var registrar = new TypeRegistrar(services);
 var app = new CommandApp(registrar);
 
@@ -20,7 +27,13 @@ app.Configure(config =>
     config.SetApplicationName("mjcuadrado-net-sdk");
     config.SetApplicationVersion("0.1.0");
 
+    // --timings / --timings-file: desglose de tiempos por fase de cualquier comando
+    config.SetInterceptor(new TimingsInterceptor());
+
+#if DEBUG
+    // Validar los ejemplos recorre todo el modelo de comandos: solo en desarrollo, no en cada arranque
     config.ValidateExamples();
+#endif
 
     // Comando init
     config.AddCommand<InitCommand>("init")
@@ -33,7 +46,11 @@ app.Configure(config =>
     config.AddCommand<DoctorCommand>("doctor")
         .WithDescription("Verifica las dependencias del sistema y la salud del proyecto")
         .WithExample(new[] { "doctor" })
-        .WithExample(new[] { "doctor", "--verbose" });
+        .WithExample(new[] { "doctor", "--verbose" })
+        .WithExample(new[] { "doctor", "--no-cache" })
+        .WithExample(new[] { "doctor", "--recursive", "." })
+        .WithExample(new[] { "doctor", "--recursive", ".", "--json" })
+        .WithExample(new[] { "doctor", "--timings-file", "doctor-trace.json" });
 
     // Comando version
     config.AddCommand<VersionCommand>("version")
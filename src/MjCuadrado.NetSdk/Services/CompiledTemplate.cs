@@ -0,0 +1,217 @@
+namespace MjCuadrado.NetSdk.Services;
+
+/// <summary>
+/// Template parseado en segmentos (texto literal y variables <c>{{NOMBRE}}</c>) listo para renderizar en una sola pasada.
+/// Es inmutable y puede compartirse entre hilos.
+/// </summary>
+public sealed class CompiledTemplate
+{
+    private readonly TemplateSegment[] _segments;
+
+    private CompiledTemplate(string name, string source, TemplateSegment[] segments, IReadOnlyList<string> variables)
+    {
+        Name = name;
+        Source = source;
+        _segments = segments;
+        Variables = variables;
+    }
+
+    /// <summary>
+    /// Nombre del template (ej: "config.json.template")
+    /// </summary>
+    public string Name { get; }
+
+    /// <summary>
+    /// Contenido original del template
+    /// </summary>
+    public string Source { get; }
+
+    /// <summary>
+    /// Variables distintas que usa el template, en orden de aparición
+    /// </summary>
+    public IReadOnlyList<string> Variables { get; }
+
+    /// <summary>
+    /// Parsea el contenido de un template.
+    /// Las variables tienen la forma <c>{{NOMBRE}}</c> (letras, números y '_');
+    /// <c>\{{</c> se emite literalmente como <c>{{</c>.
+    /// </summary>
+    /// <param name="name">Nombre del template</param>
+    /// <param name="source">Contenido del template</param>
+    public static CompiledTemplate Parse(string name, string source)
+    {
+        if (name == null)
+        {
+            throw new ArgumentNullException(nameof(name));
+        }
+
+        if (source == null)
+        {
+            throw new ArgumentNullException(nameof(source));
+        }
+
+        var segments = new List<TemplateSegment>();
+        var variables = new List<string>();
+        var literalStart = 0;
+        var index = 0;
+
+        while (index < source.Length)
+        {
+            var open = source.IndexOf("{{", index, StringComparison.Ordinal);
+            if (open < 0)
+            {
+                break;
+            }
+
+            // Escape: \{{ se emite como {{ sin interpretarse como variable
+            if (open > 0 && source[open - 1] == '\\')
+            {
+                AddLiteral(segments, source, literalStart, open - 1);
+                literalStart = open;
+                index = open + 2;
+                continue;
+            }
+
+            var nameEnd = open + 2;
+            while (nameEnd < source.Length && IsVariableChar(source[nameEnd]))
+            {
+                nameEnd++;
+            }
+
+            var isVariable = nameEnd > open + 2
+                && nameEnd + 1 < source.Length
+                && source[nameEnd] == '}'
+                && source[nameEnd + 1] == '}';
+
+            if (!isVariable)
+            {
+                index = open + 2;
+                continue;
+            }
+
+            AddLiteral(segments, source, literalStart, open);
+
+            var variable = source.Substring(open + 2, nameEnd - open - 2);
+            segments.Add(TemplateSegment.Variable(variable));
+            if (!variables.Contains(variable))
+            {
+                variables.Add(variable);
+            }
+
+            index = nameEnd + 2;
+            literalStart = index;
+        }
+
+        AddLiteral(segments, source, literalStart, source.Length);
+
+        return new CompiledTemplate(name, source, segments.ToArray(), variables.AsReadOnly());
+    }
+
+    /// <summary>
+    /// Devuelve las variables del template que no tienen valor en el diccionario
+    /// </summary>
+    public List<string> FindMissingVariables(IReadOnlyDictionary<string, string> variables)
+    {
+        if (variables == null)
+        {
+            throw new ArgumentNullException(nameof(variables));
+        }
+
+        return Variables.Where(v => !variables.ContainsKey(v)).ToList();
+    }
+
+    /// <summary>
+    /// Renderiza el template en un único string del tamaño exacto
+    /// </summary>
+    /// <param name="variables">Valores de las variables</param>
+    /// <param name="allowMissing">Si es true, las variables sin valor se dejan como <c>{{NOMBRE}}</c></param>
+    /// <exception cref="InvalidOperationException">Si falta alguna variable y <paramref name="allowMissing"/> es false</exception>
+    public string Render(IReadOnlyDictionary<string, string> variables, bool allowMissing = false)
+    {
+        EnsureVariables(variables, allowMissing);
+
+        var length = 0;
+        foreach (var segment in _segments)
+        {
+            length += ResolveSegment(segment, variables).Length;
+        }
+
+        return string.Create(length, (Template: this, Variables: variables), static (span, state) =>
+        {
+            foreach (var segment in state.Template._segments)
+            {
+                var text = state.Template.ResolveSegment(segment, state.Variables);
+                text.Span.CopyTo(span);
+                span = span[text.Length..];
+            }
+        });
+    }
+
+    #region Helper Methods
+
+    private void EnsureVariables(IReadOnlyDictionary<string, string> variables, bool allowMissing)
+    {
+        if (variables == null)
+        {
+            throw new ArgumentNullException(nameof(variables));
+        }
+
+        if (allowMissing)
+        {
+            return;
+        }
+
+        var missing = FindMissingVariables(variables);
+        if (missing.Count > 0)
+        {
+            throw new InvalidOperationException(
+                $"El template '{Name}' usa variables sin valor: {string.Join(", ", missing.Select(v => $"{{{{{v}}}}}"))}");
+        }
+    }
+
+    private ReadOnlyMemory<char> ResolveSegment(TemplateSegment segment, IReadOnlyDictionary<string, string> variables)
+    {
+        if (!segment.IsVariable)
+        {
+            return segment.Literal;
+        }
+
+        return variables.TryGetValue(segment.Name!, out var value)
+            ? (value ?? string.Empty).AsMemory()
+            : segment.Placeholder.AsMemory();
+    }
+
+    private static void AddLiteral(List<TemplateSegment> segments, string source, int start, int end)
+    {
+        if (end > start)
+        {
+            segments.Add(TemplateSegment.Text(source.AsMemory(start, end - start)));
+        }
+    }
+
+    private static bool IsVariableChar(char c) => char.IsAsciiLetterOrDigit(c) || c == '_';
+
+    #endregion
+
+    /// <summary>
+    /// Segmento de un template: texto literal (slice del original) o nombre de variable
+    /// </summary>
+    private readonly struct TemplateSegment
+    {
+        private TemplateSegment(ReadOnlyMemory<char> literal, string? name)
+        {
+            Literal = literal;
+            Name = name;
+            Placeholder = name == null ? string.Empty : $"{{{{{name}}}}}";
+        }
+
+        public ReadOnlyMemory<char> Literal { get; }
+        public string? Name { get; }
+        public string Placeholder { get; }
+        public bool IsVariable => Name != null;
+
+        public static TemplateSegment Text(ReadOnlyMemory<char> literal) => new(literal, null);
+
+        public static TemplateSegment Variable(string name) => new(ReadOnlyMemory<char>.Empty, name);
+    }
+}
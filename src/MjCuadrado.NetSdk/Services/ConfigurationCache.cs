@@ -0,0 +1,79 @@
+using System.Collections.Concurrent;
+using MjCuadrado.NetSdk.Models;
+
+namespace MjCuadrado.NetSdk.Services;
+
+/// <summary>
+/// Caché de configuración compartida por el proceso: configuraciones parseadas,
+/// invalidadas por fecha de escritura y tamaño del archivo.
+/// </summary>
+public sealed class ConfigurationCache
+{
+    /// <summary>
+    /// Instancia compartida por todo el proceso
+    /// </summary>
+    public static ConfigurationCache Shared { get; } = new();
+
+    private readonly ConcurrentDictionary<string, CachedConfiguration> _configurations = new(PathComparer);
+
+    /// <summary>
+    /// Comparador de rutas del sistema operativo (sin distinguir mayúsculas en Windows y macOS)
+    /// </summary>
+    public static StringComparer PathComparer =>
+        OperatingSystem.IsWindows() || OperatingSystem.IsMacOS() ? StringComparer.OrdinalIgnoreCase : StringComparer.Ordinal;
+
+    /// <summary>
+    /// Busca una configuración parseada que siga vigente para el estado actual del archivo
+    /// </summary>
+    public bool TryGetConfiguration(string fullPath, DateTime lastWriteTimeUtc, long length, out SdkConfiguration configuration)
+    {
+        if (_configurations.TryGetValue(fullPath, out var cached)
+            && cached.LastWriteTimeUtc == lastWriteTimeUtc
+            && cached.Length == length)
+        {
+            configuration = cached.Configuration;
+            return true;
+        }
+
+        configuration = null!;
+        return false;
+    }
+
+    /// <summary>
+    /// Guarda una configuración parseada junto con el estado del archivo del que se leyó
+    /// </summary>
+    public void SetConfiguration(string fullPath, DateTime lastWriteTimeUtc, long length, SdkConfiguration configuration)
+    {
+        _configurations[fullPath] = new CachedConfiguration(lastWriteTimeUtc, length, configuration);
+    }
+
+    /// <summary>
+    /// Descarta la configuración cacheada de un archivo
+    /// </summary>
+    public void Invalidate(string fullPath)
+    {
+        _configurations.TryRemove(fullPath, out _);
+    }
+
+    /// <summary>
+    /// Vacía la caché
+    /// </summary>
+    public void Clear()
+    {
+        _configurations.Clear();
+    }
+
+    private sealed class CachedConfiguration
+    {
+        public CachedConfiguration(DateTime lastWriteTimeUtc, long length, SdkConfiguration configuration)
+        {
+            LastWriteTimeUtc = lastWriteTimeUtc;
+            Length = length;
+            Configuration = configuration;
+        }
+
+        public DateTime LastWriteTimeUtc { get; }
+        public long Length { get; }
+        public SdkConfiguration Configuration { get; }
+    }
+}
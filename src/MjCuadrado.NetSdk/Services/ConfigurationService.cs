@@ -1,5 +1,5 @@
+using System.Diagnostics;
 using System.Text.Json;
-using System.Text.Json.Serialization;
 using System.Text.RegularExpressions;
 using MjCuadrado.NetSdk.Models;
 
@@ -8,17 +8,21 @@ namespace MjCuadrado.NetSdk.Services;
 /// <summary>
 /// Implementación del servicio de configuración
 /// </summary>
-public class ConfigurationService : IConfigurationService
+public partial class ConfigurationService : IConfigurationService
 {
     private static readonly string[] SupportedLanguages = { "es", "en", "pt", "fr" };
-    private static readonly JsonSerializerOptions JsonOptions = new()
+
+    private readonly ConfigurationCache _cache;
+
+    public ConfigurationService()
+        : this(ConfigurationCache.Shared)
+    {
+    }
+
+    public ConfigurationService(ConfigurationCache cache)
     {
-        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
-        WriteIndented = true,
-        DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
-        ReadCommentHandling = JsonCommentHandling.Skip,
-        AllowTrailingCommas = true
-    };
+        _cache = cache ?? throw new ArgumentNullException(nameof(cache));
+    }
 
     /// <summary>
     /// Carga la configuración desde un archivo
@@ -30,22 +34,35 @@ public class ConfigurationService : IConfigurationService
             throw new ArgumentException("La ruta no puede estar vacía", nameof(path));
         }
 
-        if (!File.Exists(path))
+        using var activity = SdkTelemetry.StartActivity("config.load");
+        var start = Stopwatch.GetTimestamp();
+
+        var fileInfo = new FileInfo(path);
+        if (!fileInfo.Exists)
         {
             throw new FileNotFoundException($"El archivo de configuración no existe: {path}");
         }
 
+        // Devolver siempre una copia: la instancia cacheada nunca sale del servicio
+        if (_cache.TryGetConfiguration(fileInfo.FullName, fileInfo.LastWriteTimeUtc, fileInfo.Length, out var cached))
+        {
+            RecordLoad(activity, start, cacheHit: true);
+            return cached.Clone();
+        }
+
         try
         {
             var json = File.ReadAllText(path);
-            var config = JsonSerializer.Deserialize<SdkConfiguration>(json, JsonOptions);
+            var config = JsonSerializer.Deserialize(json, SdkJsonContext.Default.SdkConfiguration);
 
             if (config == null)
             {
                 throw new InvalidOperationException($"El archivo de configuración está vacío o es inválido: {path}");
             }
 
-            return config;
+            _cache.SetConfiguration(fileInfo.FullName, fileInfo.LastWriteTimeUtc, fileInfo.Length, config);
+            RecordLoad(activity, start, cacheHit: false);
+            return config.Clone();
         }
         catch (JsonException ex)
         {
@@ -92,8 +109,9 @@ public class ConfigurationService : IConfigurationService
             // Actualizar fecha de modificación
             config.Project.Updated = DateTime.UtcNow.ToString("yyyy-MM-dd");
 
-            var json = JsonSerializer.Serialize(config, JsonOptions);
+            var json = JsonSerializer.Serialize(config, SdkJsonContext.Default.SdkConfiguration);
             File.WriteAllText(path, json);
+            _cache.Invalidate(Path.GetFullPath(path));
 
             return true;
         }
@@ -111,6 +129,18 @@ public class ConfigurationService : IConfigurationService
     /// Valida una configuración
     /// </summary>
     public ValidationResult ValidateConfiguration(SdkConfiguration config)
+    {
+        using var activity = SdkTelemetry.StartActivity("config.validate");
+        var start = Stopwatch.GetTimestamp();
+
+        var result = ValidateConfigurationCore(config);
+
+        SdkTelemetry.ConfigValidateDuration.Record(SdkTelemetry.ElapsedMilliseconds(start));
+        activity?.SetTag("config.valid", result.IsValid);
+        return result;
+    }
+
+    private static ValidationResult ValidateConfigurationCore(SdkConfiguration config)
     {
         var result = new ValidationResult();
 
@@ -273,9 +303,7 @@ public class ConfigurationService : IConfigurationService
             return baseConfig;
         }
 
-        // Crear una copia profunda usando serialización
-        var json = JsonSerializer.Serialize(baseConfig, JsonOptions);
-        var merged = JsonSerializer.Deserialize<SdkConfiguration>(json, JsonOptions)!;
+        var merged = baseConfig.Clone();
 
         // Merge Project
         if (overrides.Project != null)
@@ -354,7 +382,9 @@ public class ConfigurationService : IConfigurationService
             return null;
         }
 
-        var currentDir = new DirectoryInfo(startPath);
+        // Sin caché de rutas: validar un resultado cacheado exige comprobar los mismos directorios
+        // más cercanos que recorre la búsqueda (un config.json creado después debe ganar)
+        var currentDir = new DirectoryInfo(Path.GetFullPath(startPath));
 
         while (currentDir != null)
         {
@@ -370,6 +400,108 @@ public class ConfigurationService : IConfigurationService
         return null;
     }
 
+    /// <summary>
+    /// Carga un manifiesto de workspace (init --manifest)
+    /// </summary>
+    public WorkspaceManifest LoadWorkspaceManifest(string path)
+    {
+        if (string.IsNullOrWhiteSpace(path))
+        {
+            throw new ArgumentException("La ruta no puede estar vacía", nameof(path));
+        }
+
+        if (!File.Exists(path))
+        {
+            throw new FileNotFoundException($"El manifiesto de workspace no existe: {path}");
+        }
+
+        try
+        {
+            var json = File.ReadAllText(path);
+            var manifest = JsonSerializer.Deserialize(json, SdkJsonContext.Default.WorkspaceManifest);
+
+            if (manifest == null)
+            {
+                throw new InvalidOperationException($"El manifiesto de workspace está vacío o es inválido: {path}");
+            }
+
+            return manifest;
+        }
+        catch (JsonException ex)
+        {
+            throw new InvalidOperationException($"Error al parsear el archivo JSON: {path}", ex);
+        }
+        catch (Exception ex) when (ex is not ArgumentException && ex is not FileNotFoundException && ex is not InvalidOperationException)
+        {
+            throw new IOException($"Error al leer el manifiesto de workspace: {path}", ex);
+        }
+    }
+
+    /// <summary>
+    /// Valida un manifiesto de workspace.
+    /// Las rutas duplicadas se detectan ya resueltas ("a", "./a" y "b/../a" son la misma carpeta).
+    /// </summary>
+    public ValidationResult ValidateWorkspaceManifest(WorkspaceManifest manifest, string? manifestDirectory = null)
+    {
+        var result = new ValidationResult();
+
+        if (manifest == null)
+        {
+            result.AddError("manifest", "El manifiesto no puede ser null");
+            return result;
+        }
+
+        if (manifest.Projects == null || manifest.Projects.Count == 0)
+        {
+            result.AddError("projects", "El manifiesto debe incluir al menos un proyecto");
+            return result;
+        }
+
+        var workspaceRoot = Path.GetFullPath(Path.Combine(
+            string.IsNullOrWhiteSpace(manifestDirectory) ? Directory.GetCurrentDirectory() : manifestDirectory,
+            manifest.Root ?? string.Empty));
+        var seenPaths = new HashSet<string>(ConfigurationCache.PathComparer);
+        for (var i = 0; i < manifest.Projects.Count; i++)
+        {
+            var project = manifest.Projects[i];
+            var field = $"projects[{i}]";
+
+            if (project == null)
+            {
+                result.AddError(field, "La entrada del proyecto no puede ser null");
+                continue;
+            }
+
+            if (string.IsNullOrWhiteSpace(project.Name))
+            {
+                result.AddError($"{field}.name", "El nombre del proyecto es requerido");
+                continue;
+            }
+
+            if (!IsValidProjectName(project.Name))
+            {
+                result.AddError($"{field}.name", $"El nombre del proyecto contiene caracteres inválidos: {project.Name}");
+            }
+
+            var relativePath = project.Path ?? project.Name;
+            var fullPath = Path.TrimEndingDirectorySeparator(Path.GetFullPath(Path.Combine(workspaceRoot, relativePath)));
+            if (!seenPaths.Add(fullPath))
+            {
+                result.AddError($"{field}.path", $"Ruta de proyecto duplicada: {relativePath}");
+            }
+        }
+
+        return result;
+    }
+
+    private static void RecordLoad(Activity? activity, long startTimestamp, bool cacheHit)
+    {
+        SdkTelemetry.ConfigLoadDuration.Record(
+            SdkTelemetry.ElapsedMilliseconds(startTimestamp),
+            new KeyValuePair<string, object?>("cache.hit", cacheHit));
+        activity?.SetTag("cache.hit", cacheHit);
+    }
+
     #region Validación helpers
 
     /// <summary>
@@ -382,9 +514,7 @@ public class ConfigurationService : IConfigurationService
             return false;
         }
 
-        // Regex simplificado para semver: major.minor.patch con optional -prerelease+metadata
-        var semverPattern = @"^\d+\.\d+\.\d+(-[0-9A-Za-z-]+(\.[0-9A-Za-z-]+)*)?(\+[0-9A-Za-z-]+(\.[0-9A-Za-z-]+)*)?$";
-        return Regex.IsMatch(version, semverPattern);
+        return SemverRegex().IsMatch(version);
     }
 
     /// <summary>
@@ -411,9 +541,7 @@ public class ConfigurationService : IConfigurationService
             return false;
         }
 
-        // Permitir letras, números, guiones, underscores y puntos
-        var validNamePattern = @"^[a-zA-Z0-9._-]+$";
-        return Regex.IsMatch(name, validNamePattern);
+        return ProjectNameRegex().IsMatch(name);
     }
 
     /// <summary>
@@ -429,5 +557,13 @@ public class ConfigurationService : IConfigurationService
         return SupportedLanguages.Contains(language.ToLowerInvariant());
     }
 
+    // Regex simplificado para semver: major.minor.patch con optional -prerelease+metadata
+    [GeneratedRegex(@"^\d+\.\d+\.\d+(-[0-9A-Za-z-]+(\.[0-9A-Za-z-]+)*)?(\+[0-9A-Za-z-]+(\.[0-9A-Za-z-]+)*)?$")]
+    private static partial Regex SemverRegex();
+
+    // Permitir letras, números, guiones, underscores y puntos
+    [GeneratedRegex(@"^[a-zA-Z0-9._-]+$")]
+    private static partial Regex ProjectNameRegex();
+
     #endregion
 }
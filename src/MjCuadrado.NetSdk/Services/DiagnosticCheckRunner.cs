@@ -0,0 +1,114 @@
+using System.Diagnostics;
+
+namespace MjCuadrado.NetSdk.Services;
+
+/// <summary>
+/// Ejecuta checks de diagnóstico independientes en paralelo, cada uno con su propio timeout
+/// </summary>
+public class DiagnosticCheckRunner
+{
+    /// <summary>
+    /// Timeout por defecto de cada check
+    /// </summary>
+    public static readonly TimeSpan DefaultTimeout = TimeSpan.FromSeconds(10);
+
+    private readonly TimeSpan _timeout;
+
+    public DiagnosticCheckRunner(TimeSpan? timeout = null)
+    {
+        var value = timeout ?? DefaultTimeout;
+        if (value <= TimeSpan.Zero)
+        {
+            throw new ArgumentOutOfRangeException(nameof(timeout), "El timeout debe ser mayor que cero");
+        }
+
+        _timeout = value;
+    }
+
+    /// <summary>
+    /// Ejecuta todos los checks en paralelo y combina sus resultados en el orden recibido
+    /// </summary>
+    public async Task<DiagnosticResult> RunAsync(IEnumerable<IDiagnosticCheck> checks, CancellationToken cancellationToken = default)
+    {
+        if (checks == null)
+        {
+            throw new ArgumentNullException(nameof(checks));
+        }
+
+        var stopwatch = Stopwatch.StartNew();
+        var outcomes = await Task.WhenAll(checks.Select(check => RunCheckAsync(check, cancellationToken)));
+
+        var result = new DiagnosticResult();
+        foreach (var outcome in outcomes)
+        {
+            result.Checks.Add(outcome.Check);
+            result.Warnings.AddRange(outcome.Warnings);
+            result.Suggestions.AddRange(outcome.Suggestions);
+        }
+
+        result.Duration = stopwatch.Elapsed;
+        return result;
+    }
+
+    #region Helper Methods
+
+    /// <summary>
+    /// Ejecuta un check aislado: mide su duración y convierte timeouts y excepciones en un check fallido
+    /// </summary>
+    private async Task<DiagnosticCheckOutcome> RunCheckAsync(IDiagnosticCheck check, CancellationToken cancellationToken)
+    {
+        using var activity = SdkTelemetry.StartActivity("doctor.check");
+        activity?.SetTag("check.name", check.Name);
+
+        using var timeoutCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        timeoutCts.CancelAfter(_timeout);
+
+        var stopwatch = Stopwatch.StartNew();
+        DiagnosticCheckOutcome outcome;
+
+        try
+        {
+            // Task.Run evita que un check con trabajo síncrono bloquee el arranque de los demás
+            var run = Task.Run(() => check.RunAsync(timeoutCts.Token), timeoutCts.Token);
+            outcome = await run.WaitAsync(timeoutCts.Token);
+        }
+        catch (OperationCanceledException) when (!cancellationToken.IsCancellationRequested)
+        {
+            outcome = new DiagnosticCheckOutcome
+            {
+                Check = new DiagnosticCheck
+                {
+                    Name = check.Name,
+                    Success = false,
+                    TimedOut = true,
+                    Message = "Timed out",
+                    Details = $"No response after {_timeout.TotalSeconds:0.#}s"
+                }
+            };
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            outcome = new DiagnosticCheckOutcome
+            {
+                Check = new DiagnosticCheck
+                {
+                    Name = check.Name,
+                    Success = false,
+                    Message = "Error",
+                    Details = ex.Message
+                }
+            };
+        }
+
+        stopwatch.Stop();
+        outcome.Check.Name = string.IsNullOrEmpty(outcome.Check.Name) ? check.Name : outcome.Check.Name;
+        outcome.Check.Duration = stopwatch.Elapsed;
+
+        activity?.SetTag("check.success", outcome.Check.Success);
+        activity?.SetTag("check.timed_out", outcome.Check.TimedOut);
+
+        return outcome;
+    }
+
+    #endregion
+}
@@ -1,5 +1,6 @@
 using System.Diagnostics;
 using System.Text.RegularExpressions;
+using MjCuadrado.NetSdk.Models;
 
 namespace MjCuadrado.NetSdk.Services;
 
@@ -10,51 +11,67 @@ public class DoctorService : IDoctorService
 {
     private readonly IFileSystemService _fileSystemService;
     private readonly IConfigurationService _configurationService;
+    private readonly ToolProbeCache? _probeCache;
+
+    // Carpetas que el diagnóstico recursivo no recorre (dependencias, builds y metadatos de git)
+    private static readonly string[] WorkspaceExcludedFolders = { ".git", "node_modules", "bin", "obj" };
 
     public DoctorService(
         IFileSystemService fileSystemService,
-        IConfigurationService configurationService)
+        IConfigurationService configurationService,
+        ToolProbeCache? probeCache = null)
     {
         _fileSystemService = fileSystemService ?? throw new ArgumentNullException(nameof(fileSystemService));
         _configurationService = configurationService ?? throw new ArgumentNullException(nameof(configurationService));
+        _probeCache = probeCache;
     }
 
+    /// <summary>
+    /// Tiempo máximo que puede tardar cada check antes de marcarse como fallido
+    /// </summary>
+    public TimeSpan CheckTimeout { get; set; } = DiagnosticCheckRunner.DefaultTimeout;
+
+    /// <summary>
+    /// Ignora la caché de sondas: dotnet y git se ejecutan siempre (y sus resultados refrescan la caché)
+    /// </summary>
+    public bool BypassProbeCache { get; set; }
+
     /// <summary>
     /// Verifica la versión de .NET SDK instalada
     /// </summary>
     public (bool Success, string Version) CheckDotNetVersion()
     {
+        using var cts = new CancellationTokenSource(CheckTimeout);
         try
         {
-            var result = ExecuteCommand("dotnet", "--version");
-            if (!result.success)
-            {
-                return (false, "Not installed");
-            }
-
-            var version = result.output.Trim();
-
-            // Parsear versión (formato: 10.0.100 o 9.0.101)
-            var match = Regex.Match(version, @"^(\d+)\.(\d+)");
-            if (!match.Success)
-            {
-                return (false, version);
-            }
+            return CheckDotNetVersionAsync(cts.Token).GetAwaiter().GetResult();
+        }
+        catch (OperationCanceledException)
+        {
+            return (false, "Timed out");
+        }
+    }
 
-            var major = int.Parse(match.Groups[1].Value);
+    /// <summary>
+    /// Verifica la versión de .NET SDK instalada de forma asíncrona
+    /// </summary>
+    public async Task<(bool Success, string Version)> CheckDotNetVersionAsync(CancellationToken cancellationToken = default)
+    {
+        var stamps = CaptureProbeStamps(ToolProbeCache.DotNetTool);
+        if (stamps != null && TryGetCachedProbe(ToolProbeCache.DotNetTool, stamps, out var cached))
+        {
+            return (cached.Success, cached.Version);
+        }
 
-            // Verificar que sea >= 9.0
-            if (major >= 9)
-            {
-                return (true, version);
-            }
+        var result = await ProbeDotNetVersionAsync(cancellationToken);
 
-            return (false, $"{version} (required >= 9.0)");
-        }
-        catch (Exception)
+        // Solo se cachean los resultados correctos: un fallo se vuelve a sondear en la siguiente ejecución
+        if (stamps != null && result.Success)
         {
-            return (false, "Not installed");
+            _probeCache!.Set(ToolProbeCache.DotNetTool, stamps, result.Success, result.Version);
         }
+
+        return result;
     }
 
     /// <summary>
@@ -62,35 +79,36 @@ public class DoctorService : IDoctorService
     /// </summary>
     public (bool Success, string Version, bool Configured) CheckGitInstallation()
     {
+        using var cts = new CancellationTokenSource(CheckTimeout);
         try
         {
-            // Verificar que git esté instalado
-            var versionResult = ExecuteCommand("git", "--version");
-            if (!versionResult.success)
-            {
-                return (false, "Not installed", false);
-            }
-
-            var version = versionResult.output.Trim();
-
-            // Extraer número de versión (formato: "git version 2.39.3")
-            var match = Regex.Match(version, @"(\d+\.\d+\.\d+)");
-            var versionNumber = match.Success ? match.Groups[1].Value : version;
+            return CheckGitInstallationAsync(cts.Token).GetAwaiter().GetResult();
+        }
+        catch (OperationCanceledException)
+        {
+            return (false, "Timed out", false);
+        }
+    }
 
-            // Verificar configuración
-            var nameResult = ExecuteCommand("git", "config user.name");
-            var emailResult = ExecuteCommand("git", "config user.email");
+    /// <summary>
+    /// Verifica si Git está instalado y configurado de forma asíncrona
+    /// </summary>
+    public async Task<(bool Success, string Version, bool Configured)> CheckGitInstallationAsync(CancellationToken cancellationToken = default)
+    {
+        var stamps = CaptureProbeStamps(ToolProbeCache.GitTool);
+        if (stamps != null && TryGetCachedProbe(ToolProbeCache.GitTool, stamps, out var cached))
+        {
+            return (cached.Success, cached.Version, cached.Configured);
+        }
 
-            var configured = nameResult.success && emailResult.success &&
-                           !string.IsNullOrWhiteSpace(nameResult.output) &&
-                           !string.IsNullOrWhiteSpace(emailResult.output);
+        var result = await ProbeGitInstallationAsync(cancellationToken);
 
-            return (true, versionNumber, configured);
-        }
-        catch (Exception)
+        if (stamps != null && result.Success)
         {
-            return (false, "Not installed", false);
+            _probeCache!.Set(ToolProbeCache.GitTool, stamps, result.Success, result.Version, result.Configured);
         }
+
+        return result;
     }
 
     /// <summary>
@@ -98,79 +116,54 @@ public class DoctorService : IDoctorService
     /// </summary>
     public (bool Success, List<string> MissingItems) CheckProjectStructure()
     {
-        var missingItems = new List<string>();
         var currentDir = _fileSystemService.GetCurrentDirectory();
+        var missingItems = InspectProject(currentDir, _fileSystemService.DirectoryExists, out _);
 
-        // Verificar carpeta principal
-        var sdkDir = Path.Combine(currentDir, ".mjcuadrado-net-sdk");
-        if (!_fileSystemService.DirectoryExists(sdkDir))
-        {
-            missingItems.Add(".mjcuadrado-net-sdk/");
-            // Si no existe la carpeta principal, no es un proyecto inicializado
-            return (false, missingItems);
-        }
+        return (missingItems.Count == 0, missingItems);
+    }
 
-        // Verificar config.json
-        var configPath = Path.Combine(sdkDir, "config.json");
-        if (!_fileSystemService.FileExists(configPath))
+    /// <summary>
+    /// Busca todos los proyectos bajo una raíz y valida su estructura y config.json en paralelo
+    /// </summary>
+    public WorkspaceDiagnosticResult CheckWorkspace(string rootPath)
+    {
+        if (string.IsNullOrWhiteSpace(rootPath))
         {
-            missingItems.Add("config.json");
-        }
-        else
-        {
-            // Validar que el config.json sea válido
-            try
-            {
-                var config = _configurationService.LoadConfiguration(currentDir);
-                if (config == null)
-                {
-                    missingItems.Add("config.json (invalid)");
-                }
-            }
-            catch
-            {
-                missingItems.Add("config.json (invalid)");
-            }
+            throw new ArgumentException("La ruta raíz no puede estar vacía", nameof(rootPath));
         }
 
-        // Verificar carpetas requeridas
-        var requiredFolders = new[]
-        {
-            "memory",
-            "reports",
-            "specs"
-        };
+        using var activity = SdkTelemetry.StartActivity("doctor.workspace");
+        var stopwatch = Stopwatch.StartNew();
+        var root = Path.GetFullPath(rootPath);
 
-        foreach (var folder in requiredFolders)
-        {
-            var folderPath = Path.Combine(sdkDir, folder);
-            if (!_fileSystemService.DirectoryExists(folderPath))
-            {
-                missingItems.Add($"{folder}/");
-            }
-        }
+        // Una sola enumeración del árbol: descubre los proyectos y sirve de snapshot
+        // para validar su estructura sin volver a consultar el disco carpeta por carpeta
+        var directories = new HashSet<string>(
+            _fileSystemService.EnumerateDirectories(root, WorkspaceExcludedFolders),
+            StringComparer.Ordinal);
 
-        // Verificar carpeta .claude
-        var claudeDir = Path.Combine(currentDir, ".claude");
-        if (!_fileSystemService.DirectoryExists(claudeDir))
-        {
-            missingItems.Add(".claude/");
-        }
-        else
+        var projectPaths = directories
+            .Where(d => Path.GetFileName(d) == ProjectLayout.SdkFolder)
+            .Select(d => Path.GetDirectoryName(d)!)
+            .OrderBy(p => p, StringComparer.Ordinal)
+            .ToArray();
+
+        activity?.SetTag("projects.found", projectPaths.Length);
+
+        var projects = new ProjectDiagnostic[projectPaths.Length];
+        var options = new ParallelOptions { MaxDegreeOfParallelism = Environment.ProcessorCount };
+
+        Parallel.For(0, projectPaths.Length, options, i =>
         {
-            // Verificar subcarpetas de Claude
-            var claudeFolders = new[] { "agents", "commands", "skills", "hooks" };
-            foreach (var folder in claudeFolders)
-            {
-                var folderPath = Path.Combine(claudeDir, folder);
-                if (!_fileSystemService.DirectoryExists(folderPath))
-                {
-                    missingItems.Add($".claude/{folder}/");
-                }
-            }
-        }
+            projects[i] = CheckWorkspaceProject(root, projectPaths[i], directories);
+        });
 
-        return (missingItems.Count == 0, missingItems);
+        return new WorkspaceDiagnosticResult
+        {
+            RootPath = root,
+            Projects = projects.ToList(),
+            Duration = stopwatch.Elapsed
+        };
     }
 
     /// <summary>
@@ -214,139 +207,421 @@ public class DoctorService : IDoctorService
     /// </summary>
     public DiagnosticResult RunFullDiagnostic()
     {
-        var result = new DiagnosticResult();
+        return RunFullDiagnosticAsync().GetAwaiter().GetResult();
+    }
 
-        // 1. Check .NET SDK
-        var dotnetCheck = CheckDotNetVersion();
-        result.Checks.Add(new DiagnosticCheck
+    /// <summary>
+    /// Ejecuta todos los checks en paralelo, cada uno con su propio timeout
+    /// </summary>
+    public Task<DiagnosticResult> RunFullDiagnosticAsync(CancellationToken cancellationToken = default)
+    {
+        var runner = new DiagnosticCheckRunner(CheckTimeout);
+        return runner.RunAsync(CreateChecks(), cancellationToken);
+    }
+
+    /// <summary>
+    /// Crea el pipeline de checks que ejecuta el diagnóstico completo
+    /// </summary>
+    public IReadOnlyList<IDiagnosticCheck> CreateChecks()
+    {
+        return new IDiagnosticCheck[]
         {
-            Name = ".NET SDK",
-            Success = dotnetCheck.Success,
-            Message = dotnetCheck.Success ? "Installed" : "Not found or outdated",
-            Details = dotnetCheck.Version
-        });
+            new DelegateDiagnosticCheck(".NET SDK", RunDotNetCheckAsync),
+            new DelegateDiagnosticCheck("Git", RunGitCheckAsync),
+            new DelegateDiagnosticCheck("Project Structure", _ => Task.FromResult(RunProjectStructureCheck())),
+            new DelegateDiagnosticCheck("Disk Space", _ => Task.FromResult(RunDiskSpaceCheck())),
+            new DelegateDiagnosticCheck("Write Permissions", _ => Task.FromResult(RunWritePermissionsCheck()))
+        };
+    }
+
+    #region Checks
+
+    private async Task<DiagnosticCheckOutcome> RunDotNetCheckAsync(CancellationToken cancellationToken)
+    {
+        var dotnetCheck = await CheckDotNetVersionAsync(cancellationToken);
+        var outcome = new DiagnosticCheckOutcome
+        {
+            Check = new DiagnosticCheck
+            {
+                Name = ".NET SDK",
+                Success = dotnetCheck.Success,
+                Message = dotnetCheck.Success ? "Installed" : "Not found or outdated",
+                Details = dotnetCheck.Version
+            }
+        };
 
         if (!dotnetCheck.Success)
         {
-            result.Suggestions.Add("Install .NET SDK 9.0 or higher from https://dotnet.microsoft.com/download");
+            outcome.Suggestions.Add("Install .NET SDK 9.0 or higher from https://dotnet.microsoft.com/download");
         }
 
-        // 2. Check Git
-        var gitCheck = CheckGitInstallation();
-        result.Checks.Add(new DiagnosticCheck
+        return outcome;
+    }
+
+    private async Task<DiagnosticCheckOutcome> RunGitCheckAsync(CancellationToken cancellationToken)
+    {
+        var gitCheck = await CheckGitInstallationAsync(cancellationToken);
+        var outcome = new DiagnosticCheckOutcome
         {
-            Name = "Git",
-            Success = gitCheck.Success,
-            Message = gitCheck.Success ? "Installed" : "Not found",
-            Details = gitCheck.Version
-        });
+            Check = new DiagnosticCheck
+            {
+                Name = "Git",
+                Success = gitCheck.Success,
+                Message = gitCheck.Success ? "Installed" : "Not found",
+                Details = gitCheck.Version
+            }
+        };
 
         if (gitCheck.Success && !gitCheck.Configured)
         {
-            result.Warnings.Add("Git is not configured");
-            result.Suggestions.Add("Configure Git with: git config --global user.name \"Your Name\"");
-            result.Suggestions.Add("Configure Git with: git config --global user.email \"your@email.com\"");
+            outcome.Warnings.Add("Git is not configured");
+            outcome.Suggestions.Add("Configure Git with: git config --global user.name \"Your Name\"");
+            outcome.Suggestions.Add("Configure Git with: git config --global user.email \"your@email.com\"");
         }
 
         if (!gitCheck.Success)
         {
-            result.Suggestions.Add("Install Git from https://git-scm.com/downloads");
+            outcome.Suggestions.Add("Install Git from https://git-scm.com/downloads");
         }
 
-        // 3. Check project structure
+        return outcome;
+    }
+
+    private DiagnosticCheckOutcome RunProjectStructureCheck()
+    {
         var structureCheck = CheckProjectStructure();
         var structureSuccess = structureCheck.Success;
         var missingCount = structureCheck.MissingItems.Count;
 
-        result.Checks.Add(new DiagnosticCheck
+        var outcome = new DiagnosticCheckOutcome
         {
-            Name = "Project Structure",
-            Success = structureSuccess,
-            Message = structureSuccess ? "Complete" : $"{missingCount} items missing",
-            Details = structureSuccess ? "All folders present" : string.Join(", ", structureCheck.MissingItems)
-        });
+            Check = new DiagnosticCheck
+            {
+                Name = "Project Structure",
+                Success = structureSuccess,
+                Message = structureSuccess ? "Complete" : $"{missingCount} items missing",
+                Details = structureSuccess ? "All folders present" : string.Join(", ", structureCheck.MissingItems)
+            }
+        };
 
         if (!structureSuccess)
         {
             if (structureCheck.MissingItems.Contains(".mjcuadrado-net-sdk/"))
             {
-                result.Suggestions.Add("Initialize project with: mjcuadrado-net-sdk init");
+                outcome.Suggestions.Add("Initialize project with: mjcuadrado-net-sdk init");
             }
             else
             {
-                result.Warnings.Add($"Missing: {string.Join(", ", structureCheck.MissingItems)}");
-                result.Suggestions.Add("Run 'mjcuadrado-net-sdk init --force' to recreate missing structure");
+                outcome.Warnings.Add($"Missing: {string.Join(", ", structureCheck.MissingItems)}");
+                outcome.Suggestions.Add("Run 'mjcuadrado-net-sdk init --force' to recreate missing structure");
             }
         }
 
-        // 4. Check disk space
+        return outcome;
+    }
+
+    private DiagnosticCheckOutcome RunDiskSpaceCheck()
+    {
         var diskCheck = CheckDiskSpace();
         var diskMB = diskCheck.AvailableBytes / (1024.0 * 1024.0);
-        result.Checks.Add(new DiagnosticCheck
+        var outcome = new DiagnosticCheckOutcome
         {
-            Name = "Disk Space",
-            Success = diskCheck.Success,
-            Message = diskCheck.Success ? "Sufficient" : "Insufficient",
-            Details = $"{diskMB:F2} MB available"
-        });
+            Check = new DiagnosticCheck
+            {
+                Name = "Disk Space",
+                Success = diskCheck.Success,
+                Message = diskCheck.Success ? "Sufficient" : "Insufficient",
+                Details = $"{diskMB:F2} MB available"
+            }
+        };
 
         if (!diskCheck.Success)
         {
-            result.Suggestions.Add("Free up at least 100 MB of disk space");
+            outcome.Suggestions.Add("Free up at least 100 MB of disk space");
         }
 
-        // 5. Check write permissions
+        return outcome;
+    }
+
+    private DiagnosticCheckOutcome RunWritePermissionsCheck()
+    {
         var permissionsCheck = CheckWritePermissions();
-        result.Checks.Add(new DiagnosticCheck
+        var outcome = new DiagnosticCheckOutcome
         {
-            Name = "Write Permissions",
-            Success = permissionsCheck,
-            Message = permissionsCheck ? "OK" : "Denied",
-            Details = permissionsCheck ? "Can write to current directory" : "Cannot write to current directory"
-        });
+            Check = new DiagnosticCheck
+            {
+                Name = "Write Permissions",
+                Success = permissionsCheck,
+                Message = permissionsCheck ? "OK" : "Denied",
+                Details = permissionsCheck ? "Can write to current directory" : "Cannot write to current directory"
+            }
+        };
 
         if (!permissionsCheck)
         {
-            result.Suggestions.Add("Check directory permissions or run with appropriate privileges");
+            outcome.Suggestions.Add("Check directory permissions or run with appropriate privileges");
         }
 
-        return result;
+        return outcome;
     }
 
+    #endregion
+
     #region Helper Methods
 
     /// <summary>
-    /// Ejecuta un comando externo y captura su salida
+    /// Huella actual de una herramienta para la caché de sondas (null si no hay caché o no es cacheable)
     /// </summary>
-    private (bool success, string output) ExecuteCommand(string command, string arguments)
+    private IReadOnlyList<FileStamp>? CaptureProbeStamps(string tool)
+    {
+        if (_probeCache == null)
+        {
+            return null;
+        }
+
+        return ToolProbeCache.CaptureStamps(tool, _fileSystemService.GetCurrentDirectory());
+    }
+
+    private bool TryGetCachedProbe(string tool, IReadOnlyList<FileStamp> stamps, out ToolProbeEntry entry)
+    {
+        var tag = new KeyValuePair<string, object?>("tool", tool);
+
+        if (!BypassProbeCache && _probeCache!.TryGet(tool, stamps, out entry))
+        {
+            SdkTelemetry.ProbeCacheHits.Add(1, tag);
+            return true;
+        }
+
+        SdkTelemetry.ProbeCacheMisses.Add(1, tag);
+        entry = null!;
+        return false;
+    }
+
+    private async Task<(bool Success, string Version)> ProbeDotNetVersionAsync(CancellationToken cancellationToken)
     {
         try
         {
-            var processStartInfo = new ProcessStartInfo
+            var result = await ExecuteCommandAsync("dotnet", "--version", cancellationToken);
+            if (!result.success)
+            {
+                return (false, "Not installed");
+            }
+
+            var version = result.output.Trim();
+
+            // Parsear versión (formato: 10.0.100 o 9.0.101)
+            var match = Regex.Match(version, @"^(\d+)\.(\d+)");
+            if (!match.Success)
             {
-                FileName = command,
-                Arguments = arguments,
-                RedirectStandardOutput = true,
-                RedirectStandardError = true,
-                UseShellExecute = false,
-                CreateNoWindow = true
-            };
-
-            using var process = Process.Start(processStartInfo);
-            if (process == null)
+                return (false, version);
+            }
+
+            var major = int.Parse(match.Groups[1].Value);
+
+            // Verificar que sea >= 9.0
+            if (major >= 9)
             {
-                return (false, string.Empty);
+                return (true, version);
             }
 
-            var output = process.StandardOutput.ReadToEnd();
-            process.WaitForExit();
+            return (false, $"{version} (required >= 9.0)");
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            return (false, "Not installed");
+        }
+    }
 
-            return (process.ExitCode == 0, output);
+    private async Task<(bool Success, string Version, bool Configured)> ProbeGitInstallationAsync(CancellationToken cancellationToken)
+    {
+        try
+        {
+            // Verificar que git esté instalado
+            var versionResult = await ExecuteCommandAsync("git", "--version", cancellationToken);
+            if (!versionResult.success)
+            {
+                return (false, "Not installed", false);
+            }
+
+            var version = versionResult.output.Trim();
+
+            // Extraer número de versión (formato: "git version 2.39.3")
+            var match = Regex.Match(version, @"(\d+\.\d+\.\d+)");
+            var versionNumber = match.Success ? match.Groups[1].Value : version;
+
+            // Verificar configuración (ambas consultas son independientes)
+            var nameTask = ExecuteCommandAsync("git", "config user.name", cancellationToken);
+            var emailTask = ExecuteCommandAsync("git", "config user.email", cancellationToken);
+            await Task.WhenAll(nameTask, emailTask);
+
+            var nameResult = await nameTask;
+            var emailResult = await emailTask;
+
+            var configured = nameResult.success && emailResult.success &&
+                           !string.IsNullOrWhiteSpace(nameResult.output) &&
+                           !string.IsNullOrWhiteSpace(emailResult.output);
+
+            return (true, versionNumber, configured);
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            return (false, "Not installed", false);
+        }
+    }
+
+    /// <summary>
+    /// Valida la estructura y el config.json de un proyecto.
+    /// La existencia de carpetas se resuelve con <paramref name="directoryExists"/> (disco o snapshot enumerado).
+    /// </summary>
+    private List<string> InspectProject(string projectPath, Func<string, bool> directoryExists, out SdkConfiguration? config)
+    {
+        config = null;
+        var missingItems = ProjectLayout.FindMissingFolders(projectPath, directoryExists);
+
+        // Si no existe la carpeta principal, no es un proyecto inicializado
+        if (missingItems.Contains(ProjectLayout.SdkFolder + "/"))
+        {
+            return new List<string> { ProjectLayout.SdkFolder + "/" };
+        }
+
+        var configPath = ProjectLayout.GetConfigPath(projectPath);
+        if (!_fileSystemService.FileExists(configPath))
+        {
+            missingItems.Insert(0, ProjectLayout.ConfigFileName);
+            return missingItems;
+        }
+
+        try
+        {
+            config = _configurationService.LoadConfiguration(configPath);
+        }
+        catch
+        {
+            config = null;
+        }
+
+        if (config == null)
+        {
+            missingItems.Insert(0, $"{ProjectLayout.ConfigFileName} (invalid)");
+        }
+
+        return missingItems;
+    }
+
+    private ProjectDiagnostic CheckWorkspaceProject(string rootPath, string projectPath, HashSet<string> directories)
+    {
+        using var activity = SdkTelemetry.StartActivity("doctor.project");
+        activity?.SetTag("project.path", projectPath);
+
+        var stopwatch = Stopwatch.StartNew();
+        var diagnostic = new ProjectDiagnostic
+        {
+            Path = Path.GetRelativePath(rootPath, projectPath),
+            MissingItems = InspectProject(projectPath, directories.Contains, out var config)
+        };
+
+        if (config != null)
+        {
+            diagnostic.Name = config.Project.Name;
+
+            var validation = _configurationService.ValidateConfiguration(config);
+            if (validation is { IsValid: false })
+            {
+                diagnostic.ConfigErrors.AddRange(validation.Errors.Select(e => e.ToString()));
+            }
+        }
+
+        diagnostic.Duration = stopwatch.Elapsed;
+        return diagnostic;
+    }
+
+    /// <summary>
+    /// Ejecuta un comando externo y captura su salida.
+    /// Si se cancela, mata el proceso y propaga la cancelación.
+    /// </summary>
+    private static async Task<(bool success, string output)> ExecuteCommandAsync(
+        string command,
+        string arguments,
+        CancellationToken cancellationToken)
+    {
+        var processStartInfo = new ProcessStartInfo
+        {
+            FileName = command,
+            Arguments = arguments,
+            RedirectStandardOutput = true,
+            RedirectStandardError = true,
+            UseShellExecute = false,
+            CreateNoWindow = true
+        };
+
+        using var activity = SdkTelemetry.StartActivity("process.run");
+        activity?.SetTag("process.command", $"{command} {arguments}");
+
+        Process? process;
+        var spawnStart = Stopwatch.GetTimestamp();
+        try
+        {
+            process = Process.Start(processStartInfo);
         }
         catch (Exception)
+        {
+            activity?.SetStatus(ActivityStatusCode.Error, "No se pudo iniciar el proceso");
+            return (false, string.Empty);
+        }
+        finally
+        {
+            SdkTelemetry.ProcessSpawnDuration.Record(
+                SdkTelemetry.ElapsedMilliseconds(spawnStart),
+                new KeyValuePair<string, object?>("process", command));
+        }
+
+        if (process == null)
         {
             return (false, string.Empty);
         }
+
+        using (process)
+        {
+            try
+            {
+                // Drenar stdout y stderr a la vez: si stderr llena su buffer el proceso se bloquea
+                var outputTask = process.StandardOutput.ReadToEndAsync(cancellationToken);
+                var errorTask = process.StandardError.ReadToEndAsync(cancellationToken);
+
+                await process.WaitForExitAsync(cancellationToken);
+                var output = await outputTask;
+                await errorTask;
+
+                return (process.ExitCode == 0, output);
+            }
+            catch (OperationCanceledException)
+            {
+                TryKill(process);
+                throw;
+            }
+            catch (Exception)
+            {
+                return (false, string.Empty);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Mata un proceso (y sus hijos) ignorando errores si ya terminó
+    /// </summary>
+    private static void TryKill(Process process)
+    {
+        try
+        {
+            if (!process.HasExited)
+            {
+                process.Kill(entireProcessTree: true);
+            }
+        }
+        catch
+        {
+            // El proceso pudo terminar entre la comprobación y el Kill
+        }
     }
 
     #endregion
@@ -1,3 +1,6 @@
+using System.IO.Enumeration;
+using System.Text;
+
 namespace MjCuadrado.NetSdk.Services;
 
 /// <summary>
@@ -197,6 +200,13 @@ public class FileSystemService : IFileSystemService
             }
 
             File.WriteAllText(normalizedPath, content);
+
+            SdkTelemetry.FilesWritten.Add(1);
+            if (SdkTelemetry.BytesWritten.Enabled)
+            {
+                SdkTelemetry.BytesWritten.Add(Encoding.UTF8.GetByteCount(content));
+            }
+
             return true;
         }
         catch (UnauthorizedAccessException ex)
@@ -365,6 +375,49 @@ public class FileSystemService : IFileSystemService
         }
     }
 
+    /// <summary>
+    /// Enumera recursivamente todas las carpetas bajo una raíz en una sola pasada
+    /// </summary>
+    public IReadOnlyList<string> EnumerateDirectories(string rootPath, IEnumerable<string>? excludedFolderNames = null)
+    {
+        if (string.IsNullOrWhiteSpace(rootPath))
+        {
+            throw new ArgumentException("La ruta raíz no puede estar vacía", nameof(rootPath));
+        }
+
+        var normalizedRoot = NormalizePath(rootPath);
+        if (!Directory.Exists(normalizedRoot))
+        {
+            throw new DirectoryNotFoundException($"El directorio no existe: {rootPath}");
+        }
+
+        var excluded = new HashSet<string>(excludedFolderNames ?? Array.Empty<string>(), StringComparer.OrdinalIgnoreCase);
+        var options = new EnumerationOptions
+        {
+            RecurseSubdirectories = true,
+            IgnoreInaccessible = true,
+            AttributesToSkip = FileAttributes.ReparsePoint
+        };
+
+        try
+        {
+            var enumerable = new FileSystemEnumerable<string>(
+                normalizedRoot,
+                (ref FileSystemEntry entry) => entry.ToFullPath(),
+                options)
+            {
+                ShouldIncludePredicate = (ref FileSystemEntry entry) => entry.IsDirectory,
+                ShouldRecursePredicate = (ref FileSystemEntry entry) => !excluded.Contains(entry.FileName.ToString())
+            };
+
+            return enumerable.ToList();
+        }
+        catch (IOException ex)
+        {
+            throw new IOException($"Error al recorrer el directorio: {rootPath}", ex);
+        }
+    }
+
     /// <summary>
     /// Normaliza una ruta para funcionar en cualquier sistema operativo
     /// </summary>
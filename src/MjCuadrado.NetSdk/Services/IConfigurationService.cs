@@ -50,4 +50,19 @@ public interface IConfigurationService
     /// <param name="startPath">Directorio donde iniciar la búsqueda</param>
     /// <returns>Ruta del config.json encontrado, o null si no existe</returns>
     string? FindConfigurationFile(string startPath);
+
+    /// <summary>
+    /// Carga un manifiesto de workspace para inicializar varios proyectos
+    /// </summary>
+    /// <param name="path">Ruta del manifiesto JSON</param>
+    /// <returns>Manifiesto cargado</returns>
+    WorkspaceManifest LoadWorkspaceManifest(string path);
+
+    /// <summary>
+    /// Valida un manifiesto de workspace
+    /// </summary>
+    /// <param name="manifest">Manifiesto a validar</param>
+    /// <param name="manifestDirectory">Carpeta del manifiesto, base de las rutas relativas (default: directorio actual)</param>
+    /// <returns>Resultado de la validación</returns>
+    ValidationResult ValidateWorkspaceManifest(WorkspaceManifest manifest, string? manifestDirectory = null);
 }
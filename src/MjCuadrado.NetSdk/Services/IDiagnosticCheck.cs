@@ -0,0 +1,52 @@
+namespace MjCuadrado.NetSdk.Services;
+
+/// <summary>
+/// Check individual del pipeline de diagnóstico
+/// </summary>
+public interface IDiagnosticCheck
+{
+    /// <summary>
+    /// Nombre del check (se muestra en la tabla de resultados)
+    /// </summary>
+    string Name { get; }
+
+    /// <summary>
+    /// Ejecuta el check
+    /// </summary>
+    /// <param name="cancellationToken">Token que se cancela al expirar el timeout del check</param>
+    /// <returns>Resultado del check con sus warnings y sugerencias</returns>
+    Task<DiagnosticCheckOutcome> RunAsync(CancellationToken cancellationToken);
+}
+
+/// <summary>
+/// Resultado de ejecutar un <see cref="IDiagnosticCheck"/>
+/// </summary>
+public class DiagnosticCheckOutcome
+{
+    public DiagnosticCheck Check { get; set; } = new();
+    public List<string> Warnings { get; set; } = new();
+    public List<string> Suggestions { get; set; } = new();
+}
+
+/// <summary>
+/// Check de diagnóstico definido a partir de un delegado
+/// </summary>
+public sealed class DelegateDiagnosticCheck : IDiagnosticCheck
+{
+    private readonly Func<CancellationToken, Task<DiagnosticCheckOutcome>> _run;
+
+    public DelegateDiagnosticCheck(string name, Func<CancellationToken, Task<DiagnosticCheckOutcome>> run)
+    {
+        if (string.IsNullOrWhiteSpace(name))
+        {
+            throw new ArgumentException("El nombre del check no puede estar vacío", nameof(name));
+        }
+
+        Name = name;
+        _run = run ?? throw new ArgumentNullException(nameof(run));
+    }
+
+    public string Name { get; }
+
+    public Task<DiagnosticCheckOutcome> RunAsync(CancellationToken cancellationToken) => _run(cancellationToken);
+}
@@ -1,3 +1,5 @@
+using MjCuadrado.NetSdk.Models;
+
 namespace MjCuadrado.NetSdk.Services;
 
 /// <summary>
@@ -5,24 +7,56 @@ namespace MjCuadrado.NetSdk.Services;
 /// </summary>
 public interface IDoctorService
 {
+    /// <summary>
+    /// Tiempo máximo que puede tardar cada check antes de marcarse como fallido
+    /// </summary>
+    TimeSpan CheckTimeout { get; set; }
+
+    /// <summary>
+    /// Ignora la caché de sondas: dotnet y git se ejecutan siempre (y sus resultados refrescan la caché)
+    /// </summary>
+    bool BypassProbeCache { get; set; }
+
     /// <summary>
     /// Verifica la versión de .NET SDK instalada
     /// </summary>
     /// <returns>Tupla con éxito y versión encontrada</returns>
     (bool Success, string Version) CheckDotNetVersion();
 
+    /// <summary>
+    /// Verifica la versión de .NET SDK instalada de forma asíncrona
+    /// </summary>
+    /// <param name="cancellationToken">Token de cancelación (mata el proceso si se cancela)</param>
+    /// <returns>Tupla con éxito y versión encontrada</returns>
+    Task<(bool Success, string Version)> CheckDotNetVersionAsync(CancellationToken cancellationToken = default);
+
     /// <summary>
     /// Verifica que Git está instalado y configurado
     /// </summary>
     /// <returns>Tupla con éxito, versión y si está configurado</returns>
     (bool Success, string Version, bool Configured) CheckGitInstallation();
 
+    /// <summary>
+    /// Verifica que Git está instalado y configurado de forma asíncrona
+    /// </summary>
+    /// <param name="cancellationToken">Token de cancelación (mata los procesos si se cancela)</param>
+    /// <returns>Tupla con éxito, versión y si está configurado</returns>
+    Task<(bool Success, string Version, bool Configured)> CheckGitInstallationAsync(CancellationToken cancellationToken = default);
+
     /// <summary>
     /// Verifica la estructura del proyecto actual
     /// </summary>
     /// <returns>Tupla con éxito y lista de elementos faltantes</returns>
     (bool Success, List<string> MissingItems) CheckProjectStructure();
 
+    /// <summary>
+    /// Busca todos los proyectos bajo una raíz (una sola enumeración del árbol)
+    /// y valida la estructura y el config.json de cada uno en paralelo
+    /// </summary>
+    /// <param name="rootPath">Carpeta raíz del workspace</param>
+    /// <returns>Diagnóstico de cada proyecto encontrado, ordenado por ruta</returns>
+    WorkspaceDiagnosticResult CheckWorkspace(string rootPath);
+
     /// <summary>
     /// Verifica el espacio disponible en disco
     /// </summary>
@@ -40,6 +74,19 @@ public interface IDoctorService
     /// </summary>
     /// <returns>Resultado del diagnóstico</returns>
     DiagnosticResult RunFullDiagnostic();
+
+    /// <summary>
+    /// Ejecuta todos los checks en paralelo, cada uno con su propio timeout
+    /// </summary>
+    /// <param name="cancellationToken">Token de cancelación</param>
+    /// <returns>Resultado del diagnóstico</returns>
+    Task<DiagnosticResult> RunFullDiagnosticAsync(CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Crea el pipeline de checks que ejecuta el diagnóstico completo
+    /// </summary>
+    /// <returns>Checks independientes, en el orden en que se reportan</returns>
+    IReadOnlyList<IDiagnosticCheck> CreateChecks();
 }
 
 /// <summary>
@@ -51,6 +98,7 @@ public class DiagnosticResult
     public List<DiagnosticCheck> Checks { get; set; } = new();
     public List<string> Warnings { get; set; } = new();
     public List<string> Suggestions { get; set; } = new();
+    public TimeSpan Duration { get; set; }
 }
 
 /// <summary>
@@ -62,4 +110,6 @@ public class DiagnosticCheck
     public bool Success { get; set; }
     public string Message { get; set; } = string.Empty;
     public string? Details { get; set; }
+    public TimeSpan Duration { get; set; }
+    public bool TimedOut { get; set; }
 }
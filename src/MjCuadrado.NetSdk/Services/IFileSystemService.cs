@@ -83,4 +83,12 @@ public interface IFileSystemService
     /// <param name="path">Ruta para verificar</param>
     /// <returns>Bytes disponibles</returns>
     long GetAvailableDiskSpace(string path);
+
+    /// <summary>
+    /// Enumera recursivamente todas las carpetas bajo una raíz en una sola pasada
+    /// </summary>
+    /// <param name="rootPath">Carpeta raíz</param>
+    /// <param name="excludedFolderNames">Nombres de carpeta en los que no se entra (ej: ".git", "node_modules")</param>
+    /// <returns>Rutas completas de las carpetas encontradas (sin incluir la raíz)</returns>
+    IReadOnlyList<string> EnumerateDirectories(string rootPath, IEnumerable<string>? excludedFolderNames = null);
 }
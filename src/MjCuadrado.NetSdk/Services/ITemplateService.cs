@@ -14,6 +14,19 @@ public interface ITemplateService
     /// <returns>True si se generó exitosamente</returns>
     bool GenerateProjectStructure(ProjectInfo projectInfo);
 
+    /// <summary>
+    /// Calcula las escrituras necesarias para generar o re-sincronizar el proyecto, sin escribir nada
+    /// </summary>
+    /// <param name="projectInfo">Información del proyecto</param>
+    /// <returns>Plan con la acción de cada archivo</returns>
+    GenerationPlan PlanProjectStructure(ProjectInfo projectInfo);
+
+    /// <summary>
+    /// Aplica un plan de generación y actualiza el manifiesto de archivos generados
+    /// </summary>
+    /// <param name="plan">Plan calculado con <see cref="PlanProjectStructure"/></param>
+    void ApplyGenerationPlan(GenerationPlan plan);
+
     /// <summary>
     /// Genera el archivo config.json
     /// </summary>
@@ -38,7 +51,14 @@ public interface ITemplateService
     string GetTemplateContent(string templateName);
 
     /// <summary>
-    /// Reemplaza variables en un template
+    /// Obtiene un template compilado y cacheado
+    /// </summary>
+    /// <param name="templateName">Nombre del template (ej: "config.json.template")</param>
+    /// <returns>Template listo para renderizar</returns>
+    CompiledTemplate GetTemplate(string templateName);
+
+    /// <summary>
+    /// Reemplaza variables en un template, con la misma sintaxis de escape que los templates embebidos
     /// </summary>
     /// <param name="content">Contenido del template</param>
     /// <param name="variables">Diccionario de variables a reemplazar</param>
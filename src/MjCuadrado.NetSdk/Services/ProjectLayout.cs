@@ -0,0 +1,88 @@
+namespace MjCuadrado.NetSdk.Services;
+
+/// <summary>
+/// Estructura esperada de un proyecto mjcuadrado-net-sdk.
+/// Es la única fuente de verdad: TemplateService la genera y DoctorService la valida.
+/// </summary>
+public static class ProjectLayout
+{
+    /// <summary>
+    /// Carpeta principal del SDK en la raíz del proyecto
+    /// </summary>
+    public const string SdkFolder = ".mjcuadrado-net-sdk";
+
+    /// <summary>
+    /// Carpeta de configuración de Claude en la raíz del proyecto
+    /// </summary>
+    public const string ClaudeFolder = ".claude";
+
+    /// <summary>
+    /// Nombre del archivo de configuración dentro de <see cref="SdkFolder"/>
+    /// </summary>
+    public const string ConfigFileName = "config.json";
+
+    /// <summary>
+    /// Carpetas del proyecto relativas a su raíz, cada padre antes que sus hijos
+    /// </summary>
+    public static IReadOnlyList<string> Folders { get; } = new[]
+    {
+        SdkFolder,
+        $"{SdkFolder}/memory",
+        $"{SdkFolder}/reports",
+        $"{SdkFolder}/specs",
+        ClaudeFolder,
+        $"{ClaudeFolder}/agents",
+        $"{ClaudeFolder}/commands",
+        $"{ClaudeFolder}/skills",
+        $"{ClaudeFolder}/hooks"
+    };
+
+    /// <summary>
+    /// Ruta del config.json de un proyecto
+    /// </summary>
+    public static string GetConfigPath(string projectPath)
+    {
+        return Path.Combine(projectPath, SdkFolder, ConfigFileName);
+    }
+
+    /// <summary>
+    /// Devuelve las carpetas que faltan en un proyecto según <see cref="Folders"/>.
+    /// Si falta una carpeta no se reportan sus hijas; las de <see cref="SdkFolder"/> se reportan
+    /// relativas a ella (ej: "memory/") y el resto relativas a la raíz (ej: ".claude/agents/").
+    /// </summary>
+    /// <param name="projectPath">Raíz del proyecto</param>
+    /// <param name="directoryExists">Comprobación de existencia (disco o un snapshot ya enumerado)</param>
+    public static List<string> FindMissingFolders(string projectPath, Func<string, bool> directoryExists)
+    {
+        if (projectPath == null)
+        {
+            throw new ArgumentNullException(nameof(projectPath));
+        }
+
+        if (directoryExists == null)
+        {
+            throw new ArgumentNullException(nameof(directoryExists));
+        }
+
+        var missingFolders = new List<string>();
+        var missingItems = new List<string>();
+
+        foreach (var folder in Folders)
+        {
+            if (missingFolders.Any(parent => folder.StartsWith(parent + "/", StringComparison.Ordinal)))
+            {
+                continue;
+            }
+
+            if (!directoryExists(Path.Combine(projectPath, folder.Replace('/', Path.DirectorySeparatorChar))))
+            {
+                missingFolders.Add(folder);
+                missingItems.Add(folder.StartsWith(SdkFolder + "/", StringComparison.Ordinal)
+                    ? folder[(SdkFolder.Length + 1)..] + "/"
+                    : folder + "/");
+            }
+        }
+
+        return missingItems;
+    }
+}
@@ -0,0 +1,91 @@
+using System.Collections.Concurrent;
+using System.Reflection;
+using System.Text;
+
+namespace MjCuadrado.NetSdk.Services;
+
+/// <summary>
+/// Carga y compila los templates embebidos una sola vez, cacheándolos por nombre de recurso
+/// </summary>
+public class TemplateEngine
+{
+    private const string ResourcePrefix = "MjCuadrado.NetSdk.Templates.";
+    private const int MaxCompiledSources = 64;
+
+    private readonly Assembly _assembly;
+    private readonly ConcurrentDictionary<string, Lazy<CompiledTemplate>> _cache = new(StringComparer.Ordinal);
+    private readonly ConcurrentDictionary<string, CompiledTemplate> _sourceCache = new(StringComparer.Ordinal);
+
+    public TemplateEngine(Assembly assembly)
+    {
+        _assembly = assembly ?? throw new ArgumentNullException(nameof(assembly));
+    }
+
+    /// <summary>
+    /// Obtiene un template compilado; la primera llamada lee y parsea el recurso embebido
+    /// </summary>
+    /// <param name="templateName">Nombre del template (ej: "config.json.template")</param>
+    /// <exception cref="FileNotFoundException">Si el template no existe</exception>
+    public CompiledTemplate GetTemplate(string templateName)
+    {
+        if (string.IsNullOrWhiteSpace(templateName))
+        {
+            throw new ArgumentException("El nombre del template no puede estar vacío", nameof(templateName));
+        }
+
+        var resourceName = ResourcePrefix + templateName;
+        var entry = _cache.GetOrAdd(resourceName, key => new Lazy<CompiledTemplate>(() => Load(templateName, key)));
+
+        try
+        {
+            return entry.Value;
+        }
+        catch
+        {
+            // No cachear fallos: un template inexistente debe seguir fallando con su excepción original
+            _cache.TryRemove(new KeyValuePair<string, Lazy<CompiledTemplate>>(resourceName, entry));
+            throw;
+        }
+    }
+
+    /// <summary>
+    /// Compila un contenido que no es un recurso embebido (ej: el de <see cref="TemplateService.ReplaceVariables"/>),
+    /// cacheado por contenido. La caché está acotada: al llenarse se vacía para no crecer con contenidos de un solo uso.
+    /// </summary>
+    /// <param name="source">Contenido del template</param>
+    public CompiledTemplate Compile(string source)
+    {
+        if (source == null)
+        {
+            throw new ArgumentNullException(nameof(source));
+        }
+
+        if (_sourceCache.TryGetValue(source, out var cached))
+        {
+            return cached;
+        }
+
+        if (_sourceCache.Count >= MaxCompiledSources)
+        {
+            _sourceCache.Clear();
+        }
+
+        return _sourceCache.GetOrAdd(source, key => CompiledTemplate.Parse(string.Empty, key));
+    }
+
+    #region Helper Methods
+
+    private CompiledTemplate Load(string templateName, string resourceName)
+    {
+        using var stream = _assembly.GetManifestResourceStream(resourceName);
+        if (stream == null)
+        {
+            throw new FileNotFoundException($"Template no encontrado: {templateName}. Recurso: {resourceName}");
+        }
+
+        using var reader = new StreamReader(stream, Encoding.UTF8);
+        return CompiledTemplate.Parse(templateName, reader.ReadToEnd());
+    }
+
+    #endregion
+}
@@ -1,5 +1,8 @@
+using System.Diagnostics;
 using System.Reflection;
+using System.Security.Cryptography;
 using System.Text;
+using System.Text.Json;
 using MjCuadrado.NetSdk.Models;
 
 namespace MjCuadrado.NetSdk.Services;
@@ -10,32 +13,64 @@ namespace MjCuadrado.NetSdk.Services;
 public class TemplateService : ITemplateService
 {
     private readonly IFileSystemService _fileSystemService;
-    private readonly Assembly _assembly;
-
-    // Estructura de carpetas completa del proyecto
-    private static readonly string[] ProjectFolders = new[]
-    {
-        ".mjcuadrado-net-sdk",
-        ".mjcuadrado-net-sdk/memory",
-        ".mjcuadrado-net-sdk/reports",
-        ".mjcuadrado-net-sdk/specs",
-        ".claude",
-        ".claude/agents",
-        ".claude/commands",
-        ".claude/skills",
-        ".claude/hooks"
+    private readonly TemplateEngine _templateEngine;
+
+    // Archivos generados desde templates: (carpeta, archivo, template)
+    private static readonly (string SubPath, string FileName, string TemplateName)[] ProjectFiles = new[]
+    {
+        (".mjcuadrado-net-sdk", "config.json", "config.json.template"),
+
+        // Documentación base en .mjcuadrado-net-sdk
+        (".mjcuadrado-net-sdk", "product.md", "product.md.template"),
+        (".mjcuadrado-net-sdk", "structure.md", "structure.md.template"),
+        (".mjcuadrado-net-sdk", "tech.md", "tech.md.template"),
+
+        // READMEs de subcarpetas
+        (".mjcuadrado-net-sdk/specs", "README.md", "specs-README.md.template"),
+        (".mjcuadrado-net-sdk/memory", "README.md", "memory-README.md.template"),
+        (".mjcuadrado-net-sdk/reports", "README.md", "reports-README.md.template"),
+
+        // READMEs de Claude
+        (".claude/agents", "README.md", "claude-agents-README.md.template"),
+        (".claude/commands", "README.md", "claude-commands-README.md.template"),
+        (".claude/skills", "README.md", "claude-skills-README.md.template"),
+        (".claude/hooks", "README.md", "claude-hooks-README.md.template")
     };
 
+    /// <summary>
+    /// Ruta (relativa al proyecto) del manifiesto de archivos generados
+    /// </summary>
+    public const string GenerationManifestPath = ".mjcuadrado-net-sdk/generated.json";
+
     public TemplateService(IFileSystemService fileSystemService)
     {
         _fileSystemService = fileSystemService ?? throw new ArgumentNullException(nameof(fileSystemService));
-        _assembly = Assembly.GetExecutingAssembly();
+        _templateEngine = new TemplateEngine(Assembly.GetExecutingAssembly());
     }
 
     /// <summary>
-    /// Genera la estructura completa del proyecto
+    /// Genera la estructura completa del proyecto.
+    /// Solo escribe los archivos nuevos o cuyo template/variables cambiaron; los editados por el usuario se conservan.
     /// </summary>
     public bool GenerateProjectStructure(ProjectInfo projectInfo)
+    {
+        var plan = PlanProjectStructure(projectInfo);
+
+        try
+        {
+            ApplyGenerationPlan(plan);
+            return true;
+        }
+        catch (Exception ex)
+        {
+            throw new IOException($"Error al generar la estructura del proyecto en: {projectInfo.BasePath}", ex);
+        }
+    }
+
+    /// <summary>
+    /// Calcula qué archivos hay que crear, actualizar o conservar sin escribir nada
+    /// </summary>
+    public GenerationPlan PlanProjectStructure(ProjectInfo projectInfo)
     {
         if (projectInfo == null)
         {
@@ -47,27 +82,111 @@ public class TemplateService : ITemplateService
             throw new ArgumentException("La ruta base del proyecto es requerida", nameof(projectInfo));
         }
 
+        using var activity = SdkTelemetry.StartActivity("template.plan");
+
         try
         {
-            // Crear todas las carpetas
-            foreach (var folder in ProjectFolders)
+            var previousManifest = LoadGenerationManifest(projectInfo.BasePath);
+            var variables = CreateVariablesDictionary(projectInfo);
+
+            // Re-sincronizar no debe cambiar la fecha de creación original
+            if (!string.IsNullOrWhiteSpace(previousManifest?.Created))
             {
-                var fullPath = Path.Combine(projectInfo.BasePath, folder);
-                _fileSystemService.CreateDirectory(fullPath);
+                variables["DATE"] = previousManifest.Created;
             }
 
-            // Generar config.json
-            var configPath = Path.Combine(projectInfo.BasePath, ".mjcuadrado-net-sdk", "config.json");
-            GenerateConfigFile(configPath, projectInfo);
+            var plan = new GenerationPlan
+            {
+                BasePath = projectInfo.BasePath,
+                Created = variables["DATE"],
+                PreviousManifest = previousManifest
+            };
 
-            // Generar archivos de documentación base
-            GenerateReadmeFiles(projectInfo.BasePath, projectInfo);
+            foreach (var (subPath, fileName, templateName) in ProjectFiles)
+            {
+                var relativePath = $"{subPath}/{fileName}";
+                var renderStart = Stopwatch.GetTimestamp();
+                var content = GetTemplate(templateName).Render(variables);
+                SdkTelemetry.TemplateRenderDuration.Record(
+                    SdkTelemetry.ElapsedMilliseconds(renderStart),
+                    new KeyValuePair<string, object?>("template", templateName));
+
+                var hash = ComputeHash(content);
+
+                GeneratedFileEntry? recorded = null;
+                previousManifest?.Files.TryGetValue(relativePath, out recorded);
+
+                plan.Files.Add(new PlannedFile
+                {
+                    RelativePath = relativePath,
+                    TemplateName = templateName,
+                    Content = content,
+                    Hash = hash,
+                    Action = DetermineAction(Path.Combine(projectInfo.BasePath, relativePath), hash, recorded, previousManifest != null, projectInfo)
+                });
+            }
 
-            return true;
+            activity?.SetTag("files.planned", plan.Files.Count);
+            activity?.SetTag("files.to_write", plan.Files.Count(f => f.IsWrite));
+            return plan;
         }
-        catch (Exception ex)
+        catch (Exception ex) when (ex is not ArgumentException && ex is not ArgumentNullException)
         {
-            throw new IOException($"Error al generar la estructura del proyecto en: {projectInfo.BasePath}", ex);
+            throw new IOException($"Error al planificar la estructura del proyecto en: {projectInfo.BasePath}", ex);
+        }
+    }
+
+    /// <summary>
+    /// Aplica un plan: crea las carpetas, escribe solo los archivos que cambian y actualiza el manifiesto
+    /// </summary>
+    public void ApplyGenerationPlan(GenerationPlan plan)
+    {
+        if (plan == null)
+        {
+            throw new ArgumentNullException(nameof(plan));
+        }
+
+        using var activity = SdkTelemetry.StartActivity("template.apply");
+
+        // Crear todas las carpetas
+        foreach (var folder in ProjectLayout.Folders)
+        {
+            var fullPath = Path.Combine(plan.BasePath, folder);
+            _fileSystemService.CreateDirectory(fullPath);
+        }
+
+        var manifest = new GenerationManifest { Created = plan.Created };
+
+        foreach (var file in plan.Files)
+        {
+            if (file.IsWrite)
+            {
+                _fileSystemService.WriteTextFile(Path.Combine(plan.BasePath, file.RelativePath), file.Content);
+            }
+
+            if (file.Action == PlannedFileAction.KeepModified)
+            {
+                // Conservar la entrada anterior para seguir detectando la edición en próximas ejecuciones
+                if (plan.PreviousManifest?.Files.TryGetValue(file.RelativePath, out var previous) == true)
+                {
+                    manifest.Files[file.RelativePath] = previous;
+                }
+
+                continue;
+            }
+
+            manifest.Files[file.RelativePath] = new GeneratedFileEntry
+            {
+                Template = file.TemplateName,
+                Hash = file.Hash
+            };
+        }
+
+        // Evitar tocar el manifiesto (y su mtime) si nada cambió
+        if (!ManifestEquals(plan.PreviousManifest, manifest))
+        {
+            var manifestPath = Path.Combine(plan.BasePath, GenerationManifestPath);
+            _fileSystemService.WriteTextFile(manifestPath, JsonSerializer.Serialize(manifest, SdkJsonContext.Default.GenerationManifest));
         }
     }
 
@@ -88,9 +207,9 @@ public class TemplateService : ITemplateService
 
         try
         {
-            var template = GetTemplateContent("config.json.template");
+            var template = GetTemplate("config.json.template");
             var variables = CreateVariablesDictionary(projectInfo);
-            var content = ReplaceVariables(template, variables);
+            var content = template.Render(variables);
 
             _fileSystemService.WriteTextFile(path, content);
             return true;
@@ -120,21 +239,16 @@ public class TemplateService : ITemplateService
         {
             var variables = CreateVariablesDictionary(projectInfo);
 
-            // Documentación base en .mjcuadrado-net-sdk
-            GenerateFile(basePath, ".mjcuadrado-net-sdk", "product.md", "product.md.template", variables);
-            GenerateFile(basePath, ".mjcuadrado-net-sdk", "structure.md", "structure.md.template", variables);
-            GenerateFile(basePath, ".mjcuadrado-net-sdk", "tech.md", "tech.md.template", variables);
-
-            // READMEs de subcarpetas
-            GenerateFile(basePath, ".mjcuadrado-net-sdk/specs", "README.md", "specs-README.md.template", variables);
-            GenerateFile(basePath, ".mjcuadrado-net-sdk/memory", "README.md", "memory-README.md.template", variables);
-            GenerateFile(basePath, ".mjcuadrado-net-sdk/reports", "README.md", "reports-README.md.template", variables);
+            // Documentación base y READMEs (config.json se genera con GenerateConfigFile)
+            foreach (var (subPath, fileName, templateName) in ProjectFiles)
+            {
+                if (templateName == "config.json.template")
+                {
+                    continue;
+                }
 
-            // READMEs de Claude
-            GenerateFile(basePath, ".claude/agents", "README.md", "claude-agents-README.md.template", variables);
-            GenerateFile(basePath, ".claude/commands", "README.md", "claude-commands-README.md.template", variables);
-            GenerateFile(basePath, ".claude/skills", "README.md", "claude-skills-README.md.template", variables);
-            GenerateFile(basePath, ".claude/hooks", "README.md", "claude-hooks-README.md.template", variables);
+                GenerateFile(basePath, subPath, fileName, templateName, variables);
+            }
 
             return true;
         }
@@ -148,6 +262,14 @@ public class TemplateService : ITemplateService
     /// Obtiene el contenido de un template embebido
     /// </summary>
     public string GetTemplateContent(string templateName)
+    {
+        return GetTemplate(templateName).Source;
+    }
+
+    /// <summary>
+    /// Obtiene un template embebido ya compilado (se lee y parsea una sola vez)
+    /// </summary>
+    public CompiledTemplate GetTemplate(string templateName)
     {
         if (string.IsNullOrWhiteSpace(templateName))
         {
@@ -156,17 +278,7 @@ public class TemplateService : ITemplateService
 
         try
         {
-            // Los recursos embebidos usan puntos en lugar de separadores de carpetas
-            var resourceName = $"MjCuadrado.NetSdk.Templates.{templateName}";
-
-            using var stream = _assembly.GetManifestResourceStream(resourceName);
-            if (stream == null)
-            {
-                throw new FileNotFoundException($"Template no encontrado: {templateName}. Recurso: {resourceName}");
-            }
-
-            using var reader = new StreamReader(stream, Encoding.UTF8);
-            return reader.ReadToEnd();
+            return _templateEngine.GetTemplate(templateName);
         }
         catch (Exception ex) when (ex is not ArgumentException && ex is not FileNotFoundException)
         {
@@ -175,7 +287,8 @@ public class TemplateService : ITemplateService
     }
 
     /// <summary>
-    /// Reemplaza variables en un template
+    /// Reemplaza variables en un template con la misma sintaxis que los templates embebidos
+    /// (<c>\{{</c> se emite como <c>{{</c>); las variables sin valor se dejan tal cual
     /// </summary>
     public string ReplaceVariables(string content, Dictionary<string, string> variables)
     {
@@ -189,14 +302,8 @@ public class TemplateService : ITemplateService
             throw new ArgumentNullException(nameof(variables));
         }
 
-        var result = content;
-        foreach (var variable in variables)
-        {
-            var placeholder = $"{{{{{variable.Key}}}}}";
-            result = result.Replace(placeholder, variable.Value);
-        }
-
-        return result;
+        // Mismo resultado que GetTemplate(nombre).Render para el contenido de GetTemplateContent(nombre)
+        return _templateEngine.Compile(content).Render(variables, allowMissing: true);
     }
 
     /// <summary>
@@ -227,11 +334,93 @@ public class TemplateService : ITemplateService
     /// </summary>
     private void GenerateFile(string basePath, string subPath, string fileName, string templateName, Dictionary<string, string> variables)
     {
-        var template = GetTemplateContent(templateName);
-        var content = ReplaceVariables(template, variables);
+        var template = GetTemplate(templateName);
+        var content = template.Render(variables);
         var fullPath = Path.Combine(basePath, subPath, fileName);
         _fileSystemService.WriteTextFile(fullPath, content);
     }
 
+    /// <summary>
+    /// Decide la acción para un archivo comparando el hash del disco, el registrado y el nuevo contenido
+    /// </summary>
+    private PlannedFileAction DetermineAction(string fullPath, string newHash, GeneratedFileEntry? recorded, bool hasManifest, ProjectInfo projectInfo)
+    {
+        if (!_fileSystemService.FileExists(fullPath))
+        {
+            return PlannedFileAction.Create;
+        }
+
+        var diskHash = ComputeHash(_fileSystemService.ReadTextFile(fullPath));
+        if (diskHash == newHash)
+        {
+            return PlannedFileAction.Unchanged;
+        }
+
+        // Sin editar desde la última generación: es seguro reescribirlo
+        if (recorded != null && diskHash == recorded.Hash)
+        {
+            return PlannedFileAction.Update;
+        }
+
+        // Sin manifiesto (proyecto creado antes de generated.json) no se puede detectar una edición:
+        // --force mantiene su comportamiento anterior y sobrescribe
+        if (!hasManifest && projectInfo.Force)
+        {
+            return PlannedFileAction.Overwrite;
+        }
+
+        return projectInfo.OverwriteModified ? PlannedFileAction.Overwrite : PlannedFileAction.KeepModified;
+    }
+
+    /// <summary>
+    /// Carga el manifiesto de archivos generados, o null si no existe o no se puede leer
+    /// </summary>
+    private GenerationManifest? LoadGenerationManifest(string basePath)
+    {
+        var manifestPath = Path.Combine(basePath, GenerationManifestPath);
+        if (!_fileSystemService.FileExists(manifestPath))
+        {
+            return null;
+        }
+
+        try
+        {
+            return JsonSerializer.Deserialize(_fileSystemService.ReadTextFile(manifestPath), SdkJsonContext.Default.GenerationManifest);
+        }
+        catch (JsonException)
+        {
+            // Un manifiesto corrupto equivale a no tenerlo: los archivos editados se tratan como modificados
+            return null;
+        }
+    }
+
+    private static bool ManifestEquals(GenerationManifest? previous, GenerationManifest current)
+    {
+        if (previous == null
+            || previous.Created != current.Created
+            || previous.SdkVersion != current.SdkVersion
+            || previous.Files.Count != current.Files.Count)
+        {
+            return false;
+        }
+
+        foreach (var (path, entry) in current.Files)
+        {
+            if (!previous.Files.TryGetValue(path, out var other)
+                || other.Hash != entry.Hash
+                || other.Template != entry.Template)
+            {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
+    private static string ComputeHash(string content)
+    {
+        return Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(content))).ToLowerInvariant();
+    }
+
     #endregion
 }
@@ -0,0 +1,396 @@
+using System.Text.Json;
+using MjCuadrado.NetSdk.Models;
+
+namespace MjCuadrado.NetSdk.Services;
+
+/// <summary>
+/// Caché persistente (en el directorio de caché del usuario) de las sondas de doctor.
+/// Cada entrada se valida contra la huella actual: ruta, tamaño y fecha del ejecutable resuelto
+/// y de los archivos de configuración que afectan al resultado. Una huella distinta invalida la entrada.
+/// </summary>
+public sealed class ToolProbeCache
+{
+    public const string DotNetTool = "dotnet";
+    public const string GitTool = "git";
+
+    /// <summary>
+    /// Edad máxima de una entrada aunque su huella siga coincidiendo
+    /// </summary>
+    public static readonly TimeSpan DefaultMaxAge = TimeSpan.FromDays(7);
+
+    /// <summary>
+    /// Máximo de entradas guardadas (al superarlo se descartan las más antiguas)
+    /// </summary>
+    public const int MaxEntries = 32;
+
+    private readonly object _lock = new();
+    private ToolProbeCacheFile? _cache;
+
+    public ToolProbeCache()
+        : this(GetDefaultCachePath())
+    {
+    }
+
+    public ToolProbeCache(string cacheFilePath)
+    {
+        if (string.IsNullOrWhiteSpace(cacheFilePath))
+        {
+            throw new ArgumentException("La ruta de la caché no puede estar vacía", nameof(cacheFilePath));
+        }
+
+        CacheFilePath = Path.GetFullPath(cacheFilePath);
+    }
+
+    /// <summary>
+    /// Archivo JSON donde se persiste la caché
+    /// </summary>
+    public string CacheFilePath { get; }
+
+    /// <summary>
+    /// Edad máxima de una entrada antes de volver a sondear
+    /// </summary>
+    public TimeSpan MaxAge { get; set; } = DefaultMaxAge;
+
+    /// <summary>
+    /// Ruta por defecto: %LOCALAPPDATA% en Windows, ~/Library/Caches en macOS y $XDG_CACHE_HOME (o ~/.cache) en Linux
+    /// </summary>
+    public static string GetDefaultCachePath()
+    {
+        var home = Environment.GetFolderPath(Environment.SpecialFolder.UserProfile);
+        string baseDirectory;
+
+        if (OperatingSystem.IsWindows())
+        {
+            baseDirectory = Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData);
+        }
+        else if (OperatingSystem.IsMacOS())
+        {
+            baseDirectory = Path.Combine(home, "Library", "Caches");
+        }
+        else
+        {
+            var xdgCache = Environment.GetEnvironmentVariable("XDG_CACHE_HOME");
+            baseDirectory = !string.IsNullOrEmpty(xdgCache) && Path.IsPathRooted(xdgCache)
+                ? xdgCache
+                : Path.Combine(home, ".cache");
+        }
+
+        return Path.Combine(baseDirectory, "mjcuadrado-net-sdk", "probes.json");
+    }
+
+    /// <summary>
+    /// Calcula la huella actual de una herramienta desde un directorio de trabajo.
+    /// Devuelve null si el ejecutable no está en el PATH o el resultado no se puede cachear.
+    /// </summary>
+    public static IReadOnlyList<FileStamp>? CaptureStamps(string tool, string workingDirectory)
+    {
+        if (string.IsNullOrWhiteSpace(tool))
+        {
+            throw new ArgumentException("La herramienta no puede estar vacía", nameof(tool));
+        }
+
+        try
+        {
+            var executable = ResolveExecutable(tool);
+            if (executable == null)
+            {
+                return null;
+            }
+
+            var stamps = new List<FileStamp> { FileStamp.Capture(executable) };
+            var executableDirectory = Path.GetDirectoryName(executable)!;
+
+            switch (tool)
+            {
+                case DotNetTool:
+                    // dotnet --version depende de los SDKs instalados junto al host y del global.json más cercano
+                    stamps.Add(FileStamp.Capture(Path.Combine(executableDirectory, "sdk")));
+
+                    var globalJson = FindUpwards(workingDirectory, "global.json", out _);
+                    if (globalJson != null)
+                    {
+                        stamps.Add(FileStamp.Capture(globalJson));
+                    }
+
+                    break;
+
+                case GitTool:
+                    if (!AddGitConfigStamps(stamps, executableDirectory, workingDirectory))
+                    {
+                        return null;
+                    }
+
+                    break;
+            }
+
+            return stamps;
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException or ArgumentException)
+        {
+            return null;
+        }
+    }
+
+    /// <summary>
+    /// Busca un resultado cacheado cuya huella coincida exactamente con la actual y no haya caducado
+    /// </summary>
+    public bool TryGet(string tool, IReadOnlyList<FileStamp> stamps, out ToolProbeEntry entry)
+    {
+        if (stamps == null)
+        {
+            throw new ArgumentNullException(nameof(stamps));
+        }
+
+        lock (_lock)
+        {
+            _cache ??= Load();
+
+            if (_cache.Entries.TryGetValue(BuildKey(tool, stamps), out var cached)
+                && !IsExpired(cached, DateTime.UtcNow)
+                && StampsMatch(cached.Stamps, stamps))
+            {
+                entry = cached;
+                return true;
+            }
+        }
+
+        entry = null!;
+        return false;
+    }
+
+    /// <summary>
+    /// Guarda el resultado de una sonda y persiste la caché, descartando las entradas caducadas.
+    /// Los errores de escritura se ignoran: la caché es solo una optimización.
+    /// </summary>
+    public void Set(string tool, IReadOnlyList<FileStamp> stamps, bool success, string version, bool configured = false)
+    {
+        if (stamps == null)
+        {
+            throw new ArgumentNullException(nameof(stamps));
+        }
+
+        lock (_lock)
+        {
+            // Releer el archivo para no pisar lo que otro proceso haya guardado desde la primera lectura
+            _cache = Load();
+
+            var now = DateTime.UtcNow;
+            _cache.Entries[BuildKey(tool, stamps)] = new ToolProbeEntry
+            {
+                Tool = tool,
+                Stamps = stamps.ToList(),
+                Success = success,
+                Version = version,
+                Configured = configured,
+                ProbedAtUtc = now
+            };
+
+            var evicted = _cache.Entries
+                .Where(e => IsExpired(e.Value, now))
+                .Select(e => e.Key)
+                .Concat(_cache.Entries
+                    .OrderByDescending(e => e.Value.ProbedAtUtc)
+                    .Skip(MaxEntries)
+                    .Select(e => e.Key))
+                .ToList();
+
+            foreach (var key in evicted)
+            {
+                _cache.Entries.Remove(key);
+            }
+
+            Save(_cache);
+        }
+    }
+
+    #region Helper Methods
+
+    private ToolProbeCacheFile Load()
+    {
+        try
+        {
+            if (File.Exists(CacheFilePath))
+            {
+                var cache = JsonSerializer.Deserialize(File.ReadAllText(CacheFilePath), SdkJsonContext.Default.ToolProbeCacheFile);
+                if (cache != null)
+                {
+                    cache.Entries = new Dictionary<string, ToolProbeEntry>(cache.Entries, StringComparer.Ordinal);
+                    return cache;
+                }
+            }
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException or JsonException)
+        {
+            // Una caché ilegible equivale a una caché vacía
+        }
+
+        return new ToolProbeCacheFile();
+    }
+
+    private void Save(ToolProbeCacheFile cache)
+    {
+        var tempPath = $"{CacheFilePath}.{Guid.NewGuid():N}.tmp";
+
+        try
+        {
+            Directory.CreateDirectory(Path.GetDirectoryName(CacheFilePath)!);
+
+            // Escribir aparte y renombrar: un doctor concurrente nunca lee un archivo a medias
+            File.WriteAllText(tempPath, JsonSerializer.Serialize(cache, SdkJsonContext.Default.ToolProbeCacheFile));
+            File.Move(tempPath, CacheFilePath, overwrite: true);
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            TryDelete(tempPath);
+        }
+    }
+
+    private bool IsExpired(ToolProbeEntry entry, DateTime now)
+    {
+        var age = now - entry.ProbedAtUtc;
+        return age < TimeSpan.Zero || age > MaxAge;
+    }
+
+    private static bool StampsMatch(List<FileStamp> cached, IReadOnlyList<FileStamp> current)
+    {
+        if (cached.Count != current.Count)
+        {
+            return false;
+        }
+
+        for (var i = 0; i < cached.Count; i++)
+        {
+            if (!cached[i].Matches(current[i]))
+            {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
+    /// <summary>
+    /// La clave identifica el contexto (herramienta y rutas de la huella); tamaños y fechas deciden si sigue vigente
+    /// </summary>
+    private static string BuildKey(string tool, IReadOnlyList<FileStamp> stamps)
+    {
+        return $"{tool}|{string.Join("|", stamps.Select(s => s.Path))}";
+    }
+
+    /// <summary>
+    /// Resuelve el ejecutable como lo haría Process.Start (PATH y, en Windows, PATHEXT), siguiendo symlinks
+    /// </summary>
+    private static string? ResolveExecutable(string tool)
+    {
+        var searchPath = Environment.GetEnvironmentVariable("PATH");
+        if (string.IsNullOrEmpty(searchPath))
+        {
+            return null;
+        }
+
+        var extensions = OperatingSystem.IsWindows()
+            ? (Environment.GetEnvironmentVariable("PATHEXT") ?? ".EXE;.CMD;.BAT").Split(';', StringSplitOptions.RemoveEmptyEntries)
+            : new[] { string.Empty };
+
+        foreach (var directory in searchPath.Split(Path.PathSeparator, StringSplitOptions.RemoveEmptyEntries))
+        {
+            foreach (var extension in extensions)
+            {
+                var candidate = Path.Combine(directory.Trim('"'), tool + extension);
+                if (!File.Exists(candidate))
+                {
+                    continue;
+                }
+
+                var target = File.ResolveLinkTarget(candidate, returnFinalTarget: true);
+                return target?.FullName ?? Path.GetFullPath(candidate);
+            }
+        }
+
+        return null;
+    }
+
+    /// <summary>
+    /// Añade los archivos de configuración que lee git config (sistema, global, XDG y repositorio).
+    /// Los que no existen también cuentan: crearlos invalida la entrada.
+    /// </summary>
+    private static bool AddGitConfigStamps(List<FileStamp> stamps, string executableDirectory, string workingDirectory)
+    {
+        var home = Environment.GetFolderPath(Environment.SpecialFolder.UserProfile);
+
+        var systemConfig = OperatingSystem.IsWindows()
+            ? Path.GetFullPath(Path.Combine(executableDirectory, "..", "etc", "gitconfig"))
+            : "/etc/gitconfig";
+
+        var globalConfig = Environment.GetEnvironmentVariable("GIT_CONFIG_GLOBAL");
+        if (string.IsNullOrEmpty(globalConfig))
+        {
+            globalConfig = Path.Combine(home, ".gitconfig");
+        }
+
+        var xdgConfigHome = Environment.GetEnvironmentVariable("XDG_CONFIG_HOME");
+        var xdgConfig = Path.Combine(string.IsNullOrEmpty(xdgConfigHome) ? Path.Combine(home, ".config") : xdgConfigHome, "git", "config");
+
+        stamps.Add(FileStamp.Capture(systemConfig));
+        stamps.Add(FileStamp.Capture(globalConfig));
+        stamps.Add(FileStamp.Capture(xdgConfig));
+
+        var gitEntry = FindUpwards(workingDirectory, ".git", out var isDirectory);
+        if (gitEntry == null)
+        {
+            return true;
+        }
+
+        // Worktrees y submódulos apuntan a su config desde un archivo .git: no se cachean
+        if (!isDirectory)
+        {
+            return false;
+        }
+
+        stamps.Add(FileStamp.Capture(Path.Combine(gitEntry, "config")));
+        return true;
+    }
+
+    /// <summary>
+    /// Busca un archivo o carpeta en el directorio indicado y sus ancestros
+    /// </summary>
+    private static string? FindUpwards(string startDirectory, string name, out bool isDirectory)
+    {
+        var current = string.IsNullOrWhiteSpace(startDirectory) ? null : new DirectoryInfo(startDirectory);
+
+        while (current != null)
+        {
+            var candidate = Path.Combine(current.FullName, name);
+            if (Directory.Exists(candidate))
+            {
+                isDirectory = true;
+                return candidate;
+            }
+
+            if (File.Exists(candidate))
+            {
+                isDirectory = false;
+                return candidate;
+            }
+
+            current = current.Parent;
+        }
+
+        isDirectory = false;
+        return null;
+    }
+
+    private static void TryDelete(string path)
+    {
+        try
+        {
+            File.Delete(path);
+        }
+        catch
+        {
+            // Un temporal huérfano no afecta a la caché
+        }
+    }
+
+    #endregion
+}
@@ -1,5 +1,6 @@
 using FluentAssertions;
 using MjCuadrado.NetSdk.Commands;
+using MjCuadrado.NetSdk.Models;
 using MjCuadrado.NetSdk.Services;
 using NSubstitute;
 using Spectre.Console.Cli;
@@ -229,6 +230,144 @@ public class DoctorCommandTests
         settings.Verbose.Should().BeTrue();
     }
 
+    [Fact]
+    public void Settings_DefaultTimeout_IsNull()
+    {
+        // Arrange & Act
+        var settings = new DoctorCommand.Settings();
+
+        // Assert
+        settings.Timeout.Should().BeNull();
+        settings.Validate().Successful.Should().BeTrue();
+    }
+
+    [Fact]
+    public void Settings_WithNonPositiveTimeout_FailsValidation()
+    {
+        // Arrange & Act
+        var settings = new DoctorCommand.Settings { Timeout = 0 };
+
+        // Assert
+        settings.Validate().Successful.Should().BeFalse();
+    }
+
+    [Fact]
+    public void Execute_WithTimeout_SetsCheckTimeout()
+    {
+        // Arrange
+        var settings = new DoctorCommand.Settings { Timeout = 3 };
+        var context = new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), "doctor", null);
+        _doctorService.RunFullDiagnostic().Returns(new DiagnosticResult());
+
+        // Act
+        _command.Execute(context, settings);
+
+        // Assert
+        _doctorService.Received().CheckTimeout = TimeSpan.FromSeconds(3);
+    }
+
+    [Fact]
+    public void Execute_WithNoCache_BypassesProbeCache()
+    {
+        // Arrange
+        var settings = new DoctorCommand.Settings { NoCache = true };
+        var context = new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), "doctor", null);
+        _doctorService.RunFullDiagnostic().Returns(new DiagnosticResult());
+
+        // Act
+        _command.Execute(context, settings);
+
+        // Assert
+        _doctorService.Received().BypassProbeCache = true;
+    }
+
+    #endregion
+
+    #region Recursive Tests
+
+    [Fact]
+    public void Settings_WithJsonWithoutRecursive_FailsValidation()
+    {
+        // Arrange & Act
+        var settings = new DoctorCommand.Settings { Json = true };
+
+        // Assert
+        settings.Validate().Successful.Should().BeFalse();
+    }
+
+    [Fact]
+    public void Settings_WithTimeoutAndRecursive_FailsValidation()
+    {
+        // Arrange & Act
+        var settings = new DoctorCommand.Settings { Recursive = ".", Timeout = 5 };
+
+        // Assert
+        settings.Validate().Successful.Should().BeFalse();
+    }
+
+    [Fact]
+    public void Settings_WithNoCacheAndRecursive_FailsValidation()
+    {
+        // Arrange & Act
+        var settings = new DoctorCommand.Settings { Recursive = ".", NoCache = true };
+
+        // Assert
+        settings.Validate().Successful.Should().BeFalse();
+    }
+
+    [Fact]
+    public void Execute_WithRecursive_ChecksWorkspaceInsteadOfSystem()
+    {
+        // Arrange
+        var settings = new DoctorCommand.Settings { Recursive = "." };
+        var context = new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), "doctor", null);
+
+        var result = new WorkspaceDiagnosticResult { RootPath = "/workspace" };
+        result.Projects.Add(new ProjectDiagnostic { Path = "api", Name = "api" });
+        _doctorService.CheckWorkspace(".").Returns(result);
+
+        // Act
+        var exitCode = _command.Execute(context, settings);
+
+        // Assert
+        exitCode.Should().Be(0);
+        _doctorService.Received(1).CheckWorkspace(".");
+        _doctorService.DidNotReceive().RunFullDiagnostic();
+    }
+
+    [Fact]
+    public void Execute_WithRecursiveAndUnhealthyProject_ReturnsOne()
+    {
+        // Arrange
+        var settings = new DoctorCommand.Settings { Recursive = ".", Json = true };
+        var context = new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), "doctor", null);
+
+        var result = new WorkspaceDiagnosticResult { RootPath = "/workspace" };
+        result.Projects.Add(new ProjectDiagnostic { Path = "api", MissingItems = new List<string> { "config.json" } });
+        _doctorService.CheckWorkspace(".").Returns(result);
+
+        // Act
+        var exitCode = _command.Execute(context, settings);
+
+        // Assert
+        exitCode.Should().Be(1);
+    }
+
+    [Fact]
+    public void Execute_WithRecursiveAndMissingRoot_ReturnsOne()
+    {
+        // Arrange
+        var settings = new DoctorCommand.Settings { Recursive = "missing" };
+        var context = new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), "doctor", null);
+        _doctorService.CheckWorkspace("missing").Returns(_ => throw new DirectoryNotFoundException());
+
+        // Act
+        var exitCode = _command.Execute(context, settings);
+
+        // Assert
+        exitCode.Should().Be(1);
+    }
+
     #endregion
 
     #region Integration Tests
@@ -85,14 +85,14 @@ public class InitCommandTests : IDisposable
         _fileSystemService.DirectoryExists(Arg.Any<string>()).Returns(false);
         _fileSystemService.HasWritePermissions(Arg.Any<string>()).Returns(true);
         _fileSystemService.GetAvailableDiskSpace(Arg.Any<string>()).Returns(100L * 1024 * 1024); // 100 MB
-        _templateService.GenerateProjectStructure(Arg.Any<ProjectInfo>()).Returns(true);
+        _templateService.PlanProjectStructure(Arg.Any<ProjectInfo>()).Returns(new GenerationPlan());
 
         // Act
         var result = _command.Execute(context, settings);
 
         // Assert
         result.Should().Be(0);
-        _templateService.Received(1).GenerateProjectStructure(Arg.Is<ProjectInfo>(p =>
+        _templateService.Received(1).PlanProjectStructure(Arg.Is<ProjectInfo>(p =>
             p.Name == "test-project" &&
             p.BasePath == Path.Combine(_tempDir, "test-project")
         ));
@@ -114,7 +114,7 @@ public class InitCommandTests : IDisposable
         _fileSystemService.FileExists(Arg.Any<string>()).Returns(false); // config.json no existe
         _fileSystemService.HasWritePermissions(_tempDir).Returns(true);
         _fileSystemService.GetAvailableDiskSpace(_tempDir).Returns(100L * 1024 * 1024);
-        _templateService.GenerateProjectStructure(Arg.Any<ProjectInfo>()).Returns(true);
+        _templateService.PlanProjectStructure(Arg.Any<ProjectInfo>()).Returns(new GenerationPlan());
 
         // Act
         var result = _command.Execute(context, settings);
@@ -122,7 +122,7 @@ public class InitCommandTests : IDisposable
         // Assert
         result.Should().Be(0);
         var expectedDirName = Path.GetFileName(_tempDir);
-        _templateService.Received(1).GenerateProjectStructure(Arg.Is<ProjectInfo>(p =>
+        _templateService.Received(1).PlanProjectStructure(Arg.Is<ProjectInfo>(p =>
             p.Name == expectedDirName &&
             p.BasePath == _tempDir
         ));
@@ -152,7 +152,7 @@ public class InitCommandTests : IDisposable
 
         // Assert
         result.Should().Be(1);
-        _templateService.DidNotReceive().GenerateProjectStructure(Arg.Any<ProjectInfo>());
+        _templateService.DidNotReceive().ApplyGenerationPlan(Arg.Any<GenerationPlan>());
     }
 
     [Fact]
@@ -174,19 +174,57 @@ public class InitCommandTests : IDisposable
         _fileSystemService.FileExists(configPath).Returns(true);
         _fileSystemService.HasWritePermissions(projectPath).Returns(true);
         _fileSystemService.GetAvailableDiskSpace(projectPath).Returns(100L * 1024 * 1024);
-        _templateService.GenerateProjectStructure(Arg.Any<ProjectInfo>()).Returns(true);
+        _templateService.PlanProjectStructure(Arg.Any<ProjectInfo>()).Returns(new GenerationPlan());
 
         // Act
         var result = _command.Execute(context, settings);
 
         // Assert
         result.Should().Be(0);
-        _templateService.Received(1).GenerateProjectStructure(Arg.Is<ProjectInfo>(p =>
+        _templateService.Received(1).PlanProjectStructure(Arg.Is<ProjectInfo>(p =>
             p.Name == "existing-project" &&
             p.Force == true
         ));
     }
 
+    [Fact]
+    public void Execute_WithForceAndEditedFiles_AppliesPlanKeepingEdits()
+    {
+        // Arrange
+        var settings = new InitCommand.Settings
+        {
+            ProjectName = "existing-project",
+            Force = true
+        };
+        var context = new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), "init", null);
+
+        var projectPath = Path.Combine(_tempDir, "existing-project");
+        var plan = new GenerationPlan
+        {
+            BasePath = projectPath,
+            PreviousManifest = new GenerationManifest(),
+            Files = new List<PlannedFile>
+            {
+                new() { RelativePath = ".mjcuadrado-net-sdk/config.json", Action = PlannedFileAction.Update },
+                new() { RelativePath = ".mjcuadrado-net-sdk/product.md", Action = PlannedFileAction.KeepModified }
+            }
+        };
+
+        _fileSystemService.GetCurrentDirectory().Returns(_tempDir);
+        _fileSystemService.DirectoryExists(projectPath).Returns(true);
+        _fileSystemService.HasWritePermissions(projectPath).Returns(true);
+        _fileSystemService.GetAvailableDiskSpace(projectPath).Returns(100L * 1024 * 1024);
+        _templateService.PlanProjectStructure(Arg.Any<ProjectInfo>()).Returns(plan);
+
+        // Act
+        var result = _command.Execute(context, settings);
+
+        // Assert
+        result.Should().Be(0);
+        _templateService.Received(1).ApplyGenerationPlan(plan);
+        _templateService.DidNotReceive().GenerateProjectStructure(Arg.Any<ProjectInfo>());
+    }
+
     #endregion
 
     #region Execute Tests - Validation Errors
@@ -218,7 +256,7 @@ public class InitCommandTests : IDisposable
 
         // Assert
         result.Should().Be(1);
-        _templateService.DidNotReceive().GenerateProjectStructure(Arg.Any<ProjectInfo>());
+        _templateService.DidNotReceive().ApplyGenerationPlan(Arg.Any<GenerationPlan>());
     }
 
     [Fact]
@@ -243,7 +281,7 @@ public class InitCommandTests : IDisposable
 
         // Assert
         result.Should().Be(1);
-        _templateService.DidNotReceive().GenerateProjectStructure(Arg.Any<ProjectInfo>());
+        _templateService.DidNotReceive().ApplyGenerationPlan(Arg.Any<GenerationPlan>());
     }
 
     [Fact]
@@ -269,7 +307,7 @@ public class InitCommandTests : IDisposable
 
         // Assert
         result.Should().Be(1);
-        _templateService.DidNotReceive().GenerateProjectStructure(Arg.Any<ProjectInfo>());
+        _templateService.DidNotReceive().ApplyGenerationPlan(Arg.Any<GenerationPlan>());
     }
 
     [Fact]
@@ -287,7 +325,9 @@ public class InitCommandTests : IDisposable
         _fileSystemService.DirectoryExists(Arg.Any<string>()).Returns(false);
         _fileSystemService.HasWritePermissions(Arg.Any<string>()).Returns(true);
         _fileSystemService.GetAvailableDiskSpace(Arg.Any<string>()).Returns(100L * 1024 * 1024);
-        _templateService.GenerateProjectStructure(Arg.Any<ProjectInfo>()).Returns(false); // Fallo
+        _templateService.PlanProjectStructure(Arg.Any<ProjectInfo>()).Returns(new GenerationPlan());
+        _templateService.When(x => x.ApplyGenerationPlan(Arg.Any<GenerationPlan>()))
+            .Do(_ => throw new IOException("Disco lleno")); // Fallo
 
         // Act
         var result = _command.Execute(context, settings);
@@ -341,6 +381,152 @@ public class InitCommandTests : IDisposable
         _fileSystemService.DirectoryExists(Arg.Any<string>()).Returns(false);
         _fileSystemService.HasWritePermissions(Arg.Any<string>()).Returns(true);
         _fileSystemService.GetAvailableDiskSpace(Arg.Any<string>()).Returns(100L * 1024 * 1024);
+        _templateService.PlanProjectStructure(Arg.Any<ProjectInfo>()).Returns(new GenerationPlan());
+
+        // Act
+        var result = _command.Execute(context, settings);
+
+        // Assert
+        result.Should().Be(0);
+        _templateService.Received(1).PlanProjectStructure(Arg.Any<ProjectInfo>());
+    }
+
+    #endregion
+
+    #region Execute Tests - Dry Run
+
+    [Fact]
+    public void Execute_WithDryRun_PlansWithoutWriting()
+    {
+        // Arrange
+        var settings = new InitCommand.Settings
+        {
+            ProjectName = "test-project",
+            Force = true,
+            OverwriteModified = true,
+            DryRun = true
+        };
+        var context = new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), "init", null);
+
+        _fileSystemService.GetCurrentDirectory().Returns(_tempDir);
+        _fileSystemService.HasWritePermissions(Arg.Any<string>()).Returns(true);
+        _fileSystemService.GetAvailableDiskSpace(Arg.Any<string>()).Returns(100L * 1024 * 1024);
+        _templateService.PlanProjectStructure(Arg.Any<ProjectInfo>()).Returns(new GenerationPlan
+        {
+            BasePath = Path.Combine(_tempDir, "test-project"),
+            Files = new List<PlannedFile>
+            {
+                new() { RelativePath = ".mjcuadrado-net-sdk/config.json", Action = PlannedFileAction.Update },
+                new() { RelativePath = ".mjcuadrado-net-sdk/product.md", Action = PlannedFileAction.Overwrite }
+            }
+        });
+
+        // Act
+        var result = _command.Execute(context, settings);
+
+        // Assert
+        result.Should().Be(0);
+        _templateService.Received(1).PlanProjectStructure(Arg.Is<ProjectInfo>(p =>
+            p.Name == "test-project" && p.Force && p.OverwriteModified));
+        _templateService.DidNotReceive().ApplyGenerationPlan(Arg.Any<GenerationPlan>());
+    }
+
+    #endregion
+
+    #region Execute Tests - Batch (--manifest)
+
+    [Fact]
+    public void Execute_WithManifest_CreatesAllProjectsWithSharedPreflight()
+    {
+        // Arrange
+        var settings = new InitCommand.Settings { Manifest = "workspace.json", Parallel = 4, Author = "@cli" };
+        var context = new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), "init", null);
+        var manifestPath = Path.Combine(_tempDir, "workspace.json");
+        var servicesDir = Path.Combine(_tempDir, "services");
+
+        _fileSystemService.GetCurrentDirectory().Returns(_tempDir);
+        _fileSystemService.HasWritePermissions(Arg.Any<string>()).Returns(true);
+        _fileSystemService.GetAvailableDiskSpace(Arg.Any<string>()).Returns(1024L * 1024 * 1024);
+        _configurationService.LoadWorkspaceManifest(manifestPath).Returns(new WorkspaceManifest
+        {
+            Root = "services",
+            Author = "@team",
+            Projects = Enumerable.Range(1, 10)
+                .Select(i => new WorkspaceProject { Name = $"svc-{i}" })
+                .ToList()
+        });
+        _configurationService.ValidateWorkspaceManifest(Arg.Any<WorkspaceManifest>(), Arg.Any<string?>()).Returns(new ValidationResult());
+        _templateService.GenerateProjectStructure(Arg.Any<ProjectInfo>()).Returns(true);
+
+        // Act
+        var result = _command.Execute(context, settings);
+
+        // Assert
+        result.Should().Be(0);
+        _templateService.Received(10).GenerateProjectStructure(Arg.Is<ProjectInfo>(p =>
+            p.BasePath == Path.Combine(servicesDir, p.Name) &&
+            p.Author == "@team"));
+
+        // Un solo probe de permisos y disco para la carpeta compartida
+        _fileSystemService.Received(1).HasWritePermissions(servicesDir);
+        _fileSystemService.Received(1).GetAvailableDiskSpace(servicesDir);
+    }
+
+    [Fact]
+    public void Execute_WithManifest_GroupsPreflightWithPathComparer()
+    {
+        // Arrange: carpetas padre que solo difieren en mayúsculas
+        var settings = new InitCommand.Settings { Manifest = "workspace.json" };
+        var context = new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), "init", null);
+        var manifestPath = Path.Combine(_tempDir, "workspace.json");
+
+        _fileSystemService.GetCurrentDirectory().Returns(_tempDir);
+        _fileSystemService.HasWritePermissions(Arg.Any<string>()).Returns(true);
+        _fileSystemService.GetAvailableDiskSpace(Arg.Any<string>()).Returns(1024L * 1024 * 1024);
+        _configurationService.LoadWorkspaceManifest(manifestPath).Returns(new WorkspaceManifest
+        {
+            Projects = new List<WorkspaceProject>
+            {
+                new() { Name = "api", Path = "Services/api" },
+                new() { Name = "web", Path = "services/web" }
+            }
+        });
+        _configurationService.ValidateWorkspaceManifest(Arg.Any<WorkspaceManifest>(), Arg.Any<string?>()).Returns(new ValidationResult());
+        _templateService.GenerateProjectStructure(Arg.Any<ProjectInfo>()).Returns(true);
+
+        // Act
+        var result = _command.Execute(context, settings);
+
+        // Assert
+        result.Should().Be(0);
+        var expectedGroups = new HashSet<string>(
+            new[] { Path.Combine(_tempDir, "Services"), Path.Combine(_tempDir, "services") },
+            ConfigurationCache.PathComparer).Count;
+        _fileSystemService.Received(expectedGroups).HasWritePermissions(Arg.Any<string>());
+    }
+
+    [Fact]
+    public void Execute_WithManifest_SkipsExistingProjects()
+    {
+        // Arrange
+        var settings = new InitCommand.Settings { Manifest = "workspace.json" };
+        var context = new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), "init", null);
+        var existingPath = Path.Combine(_tempDir, "existing");
+
+        _fileSystemService.GetCurrentDirectory().Returns(_tempDir);
+        _fileSystemService.HasWritePermissions(Arg.Any<string>()).Returns(true);
+        _fileSystemService.GetAvailableDiskSpace(Arg.Any<string>()).Returns(1024L * 1024 * 1024);
+        _fileSystemService.DirectoryExists(existingPath).Returns(true);
+        _fileSystemService.FileExists(Path.Combine(existingPath, ".mjcuadrado-net-sdk", "config.json")).Returns(true);
+        _configurationService.LoadWorkspaceManifest(Arg.Any<string>()).Returns(new WorkspaceManifest
+        {
+            Projects = new List<WorkspaceProject>
+            {
+                new() { Name = "existing" },
+                new() { Name = "fresh" }
+            }
+        });
+        _configurationService.ValidateWorkspaceManifest(Arg.Any<WorkspaceManifest>(), Arg.Any<string?>()).Returns(new ValidationResult());
         _templateService.GenerateProjectStructure(Arg.Any<ProjectInfo>()).Returns(true);
 
         // Act
@@ -349,6 +535,79 @@ public class InitCommandTests : IDisposable
         // Assert
         result.Should().Be(0);
         _templateService.Received(1).GenerateProjectStructure(Arg.Any<ProjectInfo>());
+        _templateService.Received(1).GenerateProjectStructure(Arg.Is<ProjectInfo>(p => p.Name == "fresh"));
+    }
+
+    [Fact]
+    public void Execute_WithManifest_WhenOneProjectFails_ReturnsError()
+    {
+        // Arrange
+        var settings = new InitCommand.Settings { Manifest = "workspace.json" };
+        var context = new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), "init", null);
+
+        _fileSystemService.GetCurrentDirectory().Returns(_tempDir);
+        _fileSystemService.HasWritePermissions(Arg.Any<string>()).Returns(true);
+        _fileSystemService.GetAvailableDiskSpace(Arg.Any<string>()).Returns(1024L * 1024 * 1024);
+        _configurationService.LoadWorkspaceManifest(Arg.Any<string>()).Returns(new WorkspaceManifest
+        {
+            Projects = new List<WorkspaceProject>
+            {
+                new() { Name = "ok" },
+                new() { Name = "broken" }
+            }
+        });
+        _configurationService.ValidateWorkspaceManifest(Arg.Any<WorkspaceManifest>(), Arg.Any<string?>()).Returns(new ValidationResult());
+        _templateService.GenerateProjectStructure(Arg.Any<ProjectInfo>()).Returns(true);
+        _templateService.GenerateProjectStructure(Arg.Is<ProjectInfo>(p => p.Name == "broken"))
+            .Returns(x => throw new IOException("disk error"));
+
+        // Act
+        var result = _command.Execute(context, settings);
+
+        // Assert
+        result.Should().Be(1);
+        _templateService.Received(2).GenerateProjectStructure(Arg.Any<ProjectInfo>());
+    }
+
+    [Fact]
+    public void Execute_WithInvalidManifest_ReturnsError()
+    {
+        // Arrange
+        var settings = new InitCommand.Settings { Manifest = "workspace.json" };
+        var context = new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), "init", null);
+        var validation = new ValidationResult();
+        validation.AddError("projects", "El manifiesto debe incluir al menos un proyecto");
+
+        _fileSystemService.GetCurrentDirectory().Returns(_tempDir);
+        _configurationService.LoadWorkspaceManifest(Arg.Any<string>()).Returns(new WorkspaceManifest());
+        _configurationService.ValidateWorkspaceManifest(Arg.Any<WorkspaceManifest>(), Arg.Any<string?>()).Returns(validation);
+
+        // Act
+        var result = _command.Execute(context, settings);
+
+        // Assert
+        result.Should().Be(1);
+        _templateService.DidNotReceive().GenerateProjectStructure(Arg.Any<ProjectInfo>());
+    }
+
+    [Fact]
+    public void Settings_ManifestWithProjectName_FailsValidation()
+    {
+        // Arrange
+        var settings = new InitCommand.Settings { Manifest = "workspace.json", ProjectName = "demo" };
+
+        // Act & Assert
+        settings.Validate().Successful.Should().BeFalse();
+    }
+
+    [Fact]
+    public void Settings_OverwriteModifiedWithoutForce_FailsValidation()
+    {
+        // Arrange
+        var settings = new InitCommand.Settings { OverwriteModified = true };
+
+        // Act & Assert
+        settings.Validate().Successful.Should().BeFalse();
     }
 
     #endregion
@@ -411,7 +670,7 @@ public class InitCommandTests : IDisposable
         _fileSystemService.FileExists(Arg.Any<string>()).Returns(false);
         _fileSystemService.HasWritePermissions(projectPath).Returns(true);
         _fileSystemService.GetAvailableDiskSpace(projectPath).Returns(100L * 1024 * 1024);
-        _templateService.GenerateProjectStructure(Arg.Any<ProjectInfo>()).Returns(true);
+        _templateService.PlanProjectStructure(Arg.Any<ProjectInfo>()).Returns(new GenerationPlan());
 
         // Act
         var result = _command.Execute(context, settings);
@@ -426,7 +685,7 @@ public class InitCommandTests : IDisposable
         _fileSystemService.Received(1).GetAvailableDiskSpace(projectPath);
 
         // Verificar que se llamó a TemplateService con info correcta
-        _templateService.Received(1).GenerateProjectStructure(Arg.Is<ProjectInfo>(p =>
+        _templateService.Received(1).PlanProjectStructure(Arg.Is<ProjectInfo>(p =>
             p.Name == "integration-test" &&
             p.BasePath == projectPath &&
             p.Author == "@tester" &&
@@ -0,0 +1,156 @@
+using System.Text.Json;
+using FluentAssertions;
+using MjCuadrado.NetSdk.Services;
+
+namespace MjCuadrado.NetSdk.Tests.Infrastructure;
+
+/// <summary>
+/// Tests para TimingsCollector.
+/// SdkTelemetry es global y otros tests pueden emitir spans en paralelo: las aserciones se limitan a la traza propia.
+/// </summary>
+public class TimingsCollectorTests : IDisposable
+{
+    private readonly string _tempDir;
+
+    public TimingsCollectorTests()
+    {
+        _tempDir = Path.Combine(Path.GetTempPath(), $"mjcuadrado-timings-{Guid.NewGuid()}");
+        Directory.CreateDirectory(_tempDir);
+    }
+
+    public void Dispose()
+    {
+        if (Directory.Exists(_tempDir))
+        {
+            Directory.Delete(_tempDir, true);
+        }
+    }
+
+    #region Spans Tests
+
+    [Fact]
+    public void Spans_CollectsNestedActivitiesWithParent()
+    {
+        // Arrange
+        using var collector = new TimingsCollector();
+
+        // Act
+        System.Diagnostics.Activity? root;
+        using (root = SdkTelemetry.StartActivity("timings.test.root"))
+        {
+            using (SdkTelemetry.StartActivity("timings.test.child"))
+            {
+            }
+        }
+
+        // Assert
+        root.Should().NotBeNull();
+        var spans = collector.Spans.Where(s => s.TraceId == root!.TraceId).ToList();
+        spans.Select(s => s.OperationName).Should().Equal("timings.test.root", "timings.test.child");
+        spans[1].ParentSpanId.Should().Be(root!.SpanId);
+    }
+
+    [Fact]
+    public void Spans_AfterDispose_StopsCollecting()
+    {
+        // Arrange
+        var collector = new TimingsCollector();
+        collector.Dispose();
+
+        // Act
+        using (SdkTelemetry.StartActivity("timings.test.after-dispose"))
+        {
+        }
+
+        // Assert
+        collector.Spans.Should().NotContain(s => s.OperationName == "timings.test.after-dispose");
+    }
+
+    #endregion
+
+    #region Metrics Tests
+
+    [Fact]
+    public void Metrics_AggregatesFileWrites()
+    {
+        // Arrange
+        using var collector = new TimingsCollector();
+        var fileSystem = new FileSystemService();
+
+        // Act
+        fileSystem.WriteTextFile(Path.Combine(_tempDir, "a.txt"), "hola");
+        fileSystem.WriteTextFile(Path.Combine(_tempDir, "b.txt"), "ñ");
+
+        // Assert
+        var files = collector.Metrics.Single(m => m.Name == "mjcuadrado.files.written");
+        files.IsHistogram.Should().BeFalse();
+        files.Sum.Should().BeGreaterThanOrEqualTo(2);
+
+        var bytes = collector.Metrics.Single(m => m.Name == "mjcuadrado.bytes.written");
+        bytes.Sum.Should().BeGreaterThanOrEqualTo(6);
+    }
+
+    [Fact]
+    public void Metrics_HistogramCountsMeasurements()
+    {
+        // Arrange
+        using var collector = new TimingsCollector();
+
+        // Act
+        SdkTelemetry.ConfigValidateDuration.Record(1.5);
+        SdkTelemetry.ConfigValidateDuration.Record(2.5);
+
+        // Assert
+        var metric = collector.Metrics.Single(m => m.Name == "mjcuadrado.config.validate.duration");
+        metric.IsHistogram.Should().BeTrue();
+        metric.Unit.Should().Be("ms");
+        metric.Count.Should().BeGreaterThanOrEqualTo(2);
+        metric.Sum.Should().BeGreaterThanOrEqualTo(4);
+    }
+
+    #endregion
+
+    #region WriteChromeTrace Tests
+
+    [Fact]
+    public void WriteChromeTrace_WithEmptyPath_ThrowsArgumentException()
+    {
+        // Arrange
+        using var collector = new TimingsCollector();
+
+        // Act & Assert
+        var act = () => collector.WriteChromeTrace(" ");
+        act.Should().Throw<ArgumentException>()
+            .WithParameterName("path");
+    }
+
+    [Fact]
+    public void WriteChromeTrace_WritesCompleteEventsAndMetrics()
+    {
+        // Arrange
+        using var collector = new TimingsCollector();
+        using (var activity = SdkTelemetry.StartActivity("timings.test.trace"))
+        {
+            activity?.SetTag("project.name", "demo");
+        }
+
+        SdkTelemetry.FilesWritten.Add(1);
+        var path = Path.Combine(_tempDir, "nested", "trace.json");
+
+        // Act
+        collector.WriteChromeTrace(path);
+
+        // Assert
+        using var document = JsonDocument.Parse(File.ReadAllText(path));
+        var events = document.RootElement.GetProperty("traceEvents").EnumerateArray().ToList();
+        var traceEvent = events.Single(e => e.GetProperty("name").GetString() == "timings.test.trace");
+        traceEvent.GetProperty("ph").GetString().Should().Be("X");
+        traceEvent.GetProperty("dur").GetDouble().Should().BeGreaterThanOrEqualTo(0);
+        traceEvent.GetProperty("args").GetProperty("project.name").GetString().Should().Be("demo");
+
+        document.RootElement.GetProperty("metrics").EnumerateArray()
+            .Should().Contain(m => m.GetProperty("name").GetString() == "mjcuadrado.files.written");
+    }
+
+    #endregion
+}
@@ -0,0 +1,113 @@
+using FluentAssertions;
+using MjCuadrado.NetSdk.Commands;
+using NSubstitute;
+using Spectre.Console;
+using Spectre.Console.Cli;
+
+namespace MjCuadrado.NetSdk.Tests.Infrastructure;
+
+/// <summary>
+/// Tests para TimingsInterceptor
+/// </summary>
+public class TimingsInterceptorTests : IDisposable
+{
+    private readonly string _tempDir;
+    private readonly StringWriter _output = new();
+    private readonly IAnsiConsole _console;
+
+    public TimingsInterceptorTests()
+    {
+        _tempDir = Path.Combine(Path.GetTempPath(), $"mjcuadrado-interceptor-{Guid.NewGuid()}");
+        Directory.CreateDirectory(_tempDir);
+        _console = AnsiConsole.Create(new AnsiConsoleSettings
+        {
+            Ansi = AnsiSupport.No,
+            ColorSystem = ColorSystemSupport.NoColors,
+            Out = new AnsiConsoleOutput(_output)
+        });
+    }
+
+    public void Dispose()
+    {
+        _output.Dispose();
+        if (Directory.Exists(_tempDir))
+        {
+            Directory.Delete(_tempDir, true);
+        }
+    }
+
+    #region Intercept Tests
+
+    [Fact]
+    public void InterceptResult_WithoutTimingsFlag_WritesNothing()
+    {
+        // Arrange
+        var interceptor = new TimingsInterceptor(_console);
+        var settings = new VersionCommand.Settings();
+        var context = CreateContext("version");
+        var result = 0;
+
+        // Act
+        interceptor.Intercept(context, settings);
+        interceptor.InterceptResult(context, settings, ref result);
+
+        // Assert
+        _output.ToString().Should().BeEmpty();
+        result.Should().Be(0);
+    }
+
+    [Fact]
+    public void InterceptResult_WithTimingsFlag_PrintsPhaseBreakdown()
+    {
+        // Arrange
+        var interceptor = new TimingsInterceptor(_console);
+        var settings = new VersionCommand.Settings { Timings = true };
+        var context = CreateContext("timings-test-command");
+        var result = 0;
+
+        // Act
+        interceptor.Intercept(context, settings);
+        using (SdkTelemetry.StartActivity("timings.test.phase"))
+        {
+        }
+
+        interceptor.InterceptResult(context, settings, ref result);
+
+        // Assert
+        var output = _output.ToString();
+        output.Should().Contain("timings-test-command");
+        output.Should().Contain("  timings.test.phase");
+        output.Should().Contain("ms");
+    }
+
+    [Fact]
+    public void InterceptResult_WithTimingsFile_WritesTraceFile()
+    {
+        // Arrange
+        var interceptor = new TimingsInterceptor(_console);
+        var path = Path.Combine(_tempDir, "trace.json");
+        var settings = new DoctorCommand.Settings { TimingsFile = path };
+        var context = CreateContext("doctor");
+        var result = 1;
+
+        // Act
+        interceptor.Intercept(context, settings);
+        interceptor.InterceptResult(context, settings, ref result);
+
+        // Assert
+        File.Exists(path).Should().BeTrue();
+        File.ReadAllText(path).Should().Contain("\"traceEvents\"");
+        result.Should().Be(1);
+    }
+
+    #endregion
+
+    #region Helper Methods
+
+    private static CommandContext CreateContext(string name)
+    {
+        return new CommandContext(Array.Empty<string>(), Substitute.For<IRemainingArguments>(), name, null);
+    }
+
+    #endregion
+}
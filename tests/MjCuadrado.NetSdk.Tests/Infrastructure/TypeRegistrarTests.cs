@@ -0,0 +1,67 @@
+using FluentAssertions;
+using Microsoft.Extensions.DependencyInjection;
+using MjCuadrado.NetSdk.Commands;
+using MjCuadrado.NetSdk.Services;
+using NSubstitute;
+
+namespace MjCuadrado.NetSdk.Tests.Infrastructure;
+
+/// <summary>
+/// Tests para TypeRegistrar y TypeResolver
+/// </summary>
+public class TypeRegistrarTests
+{
+    #region Register Tests
+
+    [Fact]
+    public void Register_WhenTypeAlreadyRegistered_KeepsExplicitRegistration()
+    {
+        // Arrange
+        var doctorService = Substitute.For<IDoctorService>();
+        var explicitCommand = new DoctorCommand(doctorService);
+        var services = new ServiceCollection();
+        services.AddSingleton(explicitCommand);
+        var registrar = new TypeRegistrar(services);
+
+        // Act
+        registrar.Register(typeof(DoctorCommand), typeof(DoctorCommand));
+        var resolver = registrar.Build();
+
+        // Assert
+        resolver.Resolve(typeof(DoctorCommand)).Should().BeSameAs(explicitCommand);
+    }
+
+    [Fact]
+    public void Register_WhenTypeNotRegistered_AddsIt()
+    {
+        // Arrange
+        var services = new ServiceCollection();
+        var registrar = new TypeRegistrar(services);
+
+        // Act
+        registrar.Register(typeof(VersionCommand), typeof(VersionCommand));
+        var resolver = registrar.Build();
+
+        // Assert
+        resolver.Resolve(typeof(VersionCommand)).Should().BeOfType<VersionCommand>();
+    }
+
+    #endregion
+
+    #region Resolve Tests
+
+    [Fact]
+    public void Resolve_WithNullType_ReturnsNull()
+    {
+        // Arrange
+        var resolver = new TypeRegistrar(new ServiceCollection()).Build();
+
+        // Act
+        var result = resolver.Resolve(null);
+
+        // Assert
+        result.Should().BeNull();
+    }
+
+    #endregion
+}
@@ -0,0 +1,118 @@
+using FluentAssertions;
+using MjCuadrado.NetSdk.Services;
+
+namespace MjCuadrado.NetSdk.Tests.Services;
+
+/// <summary>
+/// Tests para CompiledTemplate
+/// </summary>
+public class CompiledTemplateTests
+{
+    #region Parse Tests
+
+    [Fact]
+    public void Parse_CollectsDistinctVariablesInOrder()
+    {
+        // Act
+        var template = CompiledTemplate.Parse("test", "{{B}} {{A}} {{B}}");
+
+        // Assert
+        template.Variables.Should().Equal("B", "A");
+    }
+
+    [Fact]
+    public void Parse_IgnoresBracesThatAreNotVariables()
+    {
+        // Act
+        var template = CompiledTemplate.Parse("test", "{{ name }} {{}} {{A-B}} {{");
+
+        // Assert
+        template.Variables.Should().BeEmpty();
+        template.Render(new Dictionary<string, string>()).Should().Be("{{ name }} {{}} {{A-B}} {{");
+    }
+
+    [Fact]
+    public void Parse_WhenSourceNull_ThrowsArgumentNullException()
+    {
+        // Act & Assert
+        var act = () => CompiledTemplate.Parse("test", null!);
+        act.Should().Throw<ArgumentNullException>();
+    }
+
+    #endregion
+
+    #region Render Tests
+
+    [Fact]
+    public void Render_ReplacesVariablesInSinglePass()
+    {
+        // Arrange
+        var template = CompiledTemplate.Parse("test", "{{A}} and {{B}}");
+        var variables = new Dictionary<string, string>
+        {
+            { "A", "{{B}}" },
+            { "B", "b" }
+        };
+
+        // Act
+        var result = template.Render(variables);
+
+        // Assert
+        // Los valores no se vuelven a interpretar como template
+        result.Should().Be("{{B}} and b");
+    }
+
+    [Fact]
+    public void Render_WithEscapedPlaceholder_EmitsLiteral()
+    {
+        // Arrange
+        var template = CompiledTemplate.Parse("test", @"Use \{{FILE}} in {{PROJECT}}");
+
+        // Act
+        var result = template.Render(new Dictionary<string, string> { { "PROJECT", "demo" } });
+
+        // Assert
+        template.Variables.Should().Equal("PROJECT");
+        result.Should().Be("Use {{FILE}} in demo");
+    }
+
+    [Fact]
+    public void Render_WithMissingVariables_ThrowsInvalidOperationException()
+    {
+        // Arrange
+        var template = CompiledTemplate.Parse("missing.template", "{{A}} {{B}} {{C}}");
+
+        // Act & Assert
+        var act = () => template.Render(new Dictionary<string, string> { { "A", "a" } });
+        act.Should().Throw<InvalidOperationException>()
+            .WithMessage("*missing.template*{{B}}, {{C}}*");
+    }
+
+    [Fact]
+    public void Render_WithMissingVariablesAllowed_LeavesPlaceholders()
+    {
+        // Arrange
+        var template = CompiledTemplate.Parse("test", "{{A}} {{B}}");
+
+        // Act
+        var result = template.Render(new Dictionary<string, string> { { "A", "a" } }, allowMissing: true);
+
+        // Assert
+        result.Should().Be("a {{B}}");
+    }
+
+    [Fact]
+    public void FindMissingVariables_ReturnsOnlyUnknownNames()
+    {
+        // Arrange
+        var template = CompiledTemplate.Parse("test", "{{A}} {{B}}");
+
+        // Act
+        var missing = template.FindMissingVariables(new Dictionary<string, string> { { "B", "b" } });
+
+        // Assert
+        missing.Should().Equal("A");
+    }
+
+    #endregion
+}
@@ -613,6 +613,27 @@ public class ConfigurationServiceTests : IDisposable
         merged.GitHub.Repository.Should().Be("owner/repo");
     }
 
+    [Fact]
+    public void MergeConfigurations_WhenBaseSectionIsNull_UsesDefaults()
+    {
+        // Arrange
+        var baseConfig = CreateValidConfiguration();
+        baseConfig.Project = null!;
+        baseConfig.GitHub = null!;
+
+        var overrides = new SdkConfiguration
+        {
+            Project = new ProjectConfig { Name = "merged" }
+        };
+
+        // Act
+        var merged = _service.MergeConfigurations(baseConfig, overrides);
+
+        // Assert
+        merged.Project.Name.Should().Be("merged");
+        merged.GitHub.Should().NotBeNull();
+    }
+
     #endregion
 
     #region FindConfigurationFile Tests
@@ -689,6 +710,240 @@ public class ConfigurationServiceTests : IDisposable
         found.Should().BeNull();
     }
 
+    [Fact]
+    public void FindConfigurationFile_WhenCloserConfigIsDeleted_ReturnsParentConfig()
+    {
+        // Arrange
+        var childDir = Path.Combine(_testDirectory, "child");
+        var childConfig = Path.Combine(childDir, ".mjcuadrado-net-sdk", "config.json");
+        var parentConfig = Path.Combine(_testDirectory, ".mjcuadrado-net-sdk", "config.json");
+        Directory.CreateDirectory(Path.GetDirectoryName(childConfig)!);
+        Directory.CreateDirectory(Path.GetDirectoryName(parentConfig)!);
+        File.WriteAllText(childConfig, "{}");
+        File.WriteAllText(parentConfig, "{}");
+
+        _service.FindConfigurationFile(childDir).Should().Be(childConfig);
+
+        // Act
+        File.Delete(childConfig);
+        var result = _service.FindConfigurationFile(childDir);
+
+        // Assert
+        result.Should().Be(parentConfig);
+    }
+
+    [Fact]
+    public void FindConfigurationFile_WhenCloserConfigIsCreated_ReturnsCloserConfig()
+    {
+        // Arrange
+        var childDir = Path.Combine(_testDirectory, "child");
+        var childConfig = Path.Combine(childDir, ".mjcuadrado-net-sdk", "config.json");
+        var parentConfig = Path.Combine(_testDirectory, ".mjcuadrado-net-sdk", "config.json");
+        Directory.CreateDirectory(childDir);
+        Directory.CreateDirectory(Path.GetDirectoryName(parentConfig)!);
+        File.WriteAllText(parentConfig, "{}");
+
+        _service.FindConfigurationFile(childDir).Should().Be(parentConfig);
+
+        // Act
+        Directory.CreateDirectory(Path.GetDirectoryName(childConfig)!);
+        File.WriteAllText(childConfig, "{}");
+        var result = _service.FindConfigurationFile(childDir);
+
+        // Assert
+        result.Should().Be(childConfig);
+    }
+
+    #endregion
+
+    #region Cache Tests
+
+    [Fact]
+    public void LoadConfiguration_WhenCached_ReturnsIndependentCopies()
+    {
+        // Arrange
+        var service = new ConfigurationService(new ConfigurationCache());
+        var configPath = Path.Combine(_testDirectory, "config.json");
+        service.SaveConfiguration(configPath, CreateValidConfiguration());
+
+        // Act
+        var first = service.LoadConfiguration(configPath);
+        first.Project.Name = "mutated";
+        var second = service.LoadConfiguration(configPath);
+
+        // Assert
+        second.Should().NotBeSameAs(first);
+        second.Project.Name.Should().Be("test-project");
+    }
+
+    [Fact]
+    public void LoadConfiguration_WhenFileChanges_ReloadsConfiguration()
+    {
+        // Arrange
+        var service = new ConfigurationService(new ConfigurationCache());
+        var configPath = Path.Combine(_testDirectory, "config.json");
+        service.SaveConfiguration(configPath, CreateValidConfiguration());
+        service.LoadConfiguration(configPath);
+
+        var json = File.ReadAllText(configPath).Replace("\"test-project\"", "\"renamed-project\"");
+        File.WriteAllText(configPath, json);
+
+        // Act
+        var config = service.LoadConfiguration(configPath);
+
+        // Assert
+        config.Project.Name.Should().Be("renamed-project");
+    }
+
+    [Fact]
+    public void SaveConfiguration_InvalidatesCachedConfiguration()
+    {
+        // Arrange
+        var service = new ConfigurationService(new ConfigurationCache());
+        var configPath = Path.Combine(_testDirectory, "config.json");
+        var config = CreateValidConfiguration();
+        service.SaveConfiguration(configPath, config);
+        service.LoadConfiguration(configPath);
+
+        // Act
+        config.Project.Author = "@someone-else";
+        service.SaveConfiguration(configPath, config);
+
+        // Assert
+        service.LoadConfiguration(configPath).Project.Author.Should().Be("@someone-else");
+    }
+
+    [Fact]
+    public void SdkConfigurationClone_CreatesDeepCopy()
+    {
+        // Arrange
+        var original = CreateValidConfiguration();
+
+        // Act
+        var clone = original.Clone();
+        clone.Project.Name = "other";
+        clone.GitHub.Enabled = !original.GitHub.Enabled;
+
+        // Assert
+        clone.Should().NotBeSameAs(original);
+        clone.Project.Should().NotBeSameAs(original.Project);
+        original.Project.Name.Should().Be("test-project");
+        clone.Sdk.Should().BeEquivalentTo(original.Sdk);
+    }
+
+    #endregion
+
+    #region WorkspaceManifest Tests
+
+    [Fact]
+    public void LoadWorkspaceManifest_WhenValidFile_ReturnsManifest()
+    {
+        // Arrange
+        var manifestPath = Path.Combine(_testDirectory, "workspace.json");
+        File.WriteAllText(manifestPath, """
+            {
+              // Comentarios y comas finales permitidos
+              "root": "services",
+              "author": "@team",
+              "projects": [
+                { "name": "orders" },
+                { "name": "billing", "path": "finance/billing", "framework": "net9.0" },
+              ]
+            }
+            """);
+
+        // Act
+        var manifest = _service.LoadWorkspaceManifest(manifestPath);
+
+        // Assert
+        manifest.Root.Should().Be("services");
+        manifest.Author.Should().Be("@team");
+        manifest.Projects.Should().HaveCount(2);
+        manifest.Projects[1].Path.Should().Be("finance/billing");
+        manifest.Projects[1].Framework.Should().Be("net9.0");
+    }
+
+    [Fact]
+    public void LoadWorkspaceManifest_WhenFileDoesNotExist_ThrowsFileNotFoundException()
+    {
+        // Act & Assert
+        var act = () => _service.LoadWorkspaceManifest(Path.Combine(_testDirectory, "missing.json"));
+        act.Should().Throw<FileNotFoundException>();
+    }
+
+    [Fact]
+    public void LoadWorkspaceManifest_WhenInvalidJson_ThrowsInvalidOperationException()
+    {
+        // Arrange
+        var manifestPath = Path.Combine(_testDirectory, "workspace.json");
+        File.WriteAllText(manifestPath, "{ invalid json }");
+
+        // Act & Assert
+        var act = () => _service.LoadWorkspaceManifest(manifestPath);
+        act.Should().Throw<InvalidOperationException>();
+    }
+
+    [Fact]
+    public void ValidateWorkspaceManifest_WithoutProjects_ReturnsError()
+    {
+        // Act
+        var result = _service.ValidateWorkspaceManifest(new WorkspaceManifest());
+
+        // Assert
+        result.IsValid.Should().BeFalse();
+        result.Errors.Should().Contain(e => e.Field == "projects");
+    }
+
+    [Fact]
+    public void ValidateWorkspaceManifest_WithInvalidAndDuplicateEntries_ReturnsErrors()
+    {
+        // Arrange
+        var manifest = new WorkspaceManifest
+        {
+            Projects = new List<WorkspaceProject>
+            {
+                new() { Name = "orders" },
+                new() { Name = "orders-copy", Path = "orders" },
+                new() { Name = "bad name!" },
+                new() { Name = "" }
+            }
+        };
+
+        // Act
+        var result = _service.ValidateWorkspaceManifest(manifest);
+
+        // Assert
+        result.IsValid.Should().BeFalse();
+        result.Errors.Should().Contain(e => e.Field == "projects[1].path");
+        result.Errors.Should().Contain(e => e.Field == "projects[2].name");
+        result.Errors.Should().Contain(e => e.Field == "projects[3].name");
+        result.Errors.Should().NotContain(e => e.Field.StartsWith("projects[0]"));
+    }
+
+    [Fact]
+    public void ValidateWorkspaceManifest_WithEquivalentPaths_ReturnsDuplicateErrors()
+    {
+        // Arrange
+        var manifest = new WorkspaceManifest
+        {
+            Root = "services",
+            Projects = new List<WorkspaceProject>
+            {
+                new() { Name = "orders" },
+                new() { Name = "orders-dot", Path = "./orders" },
+                new() { Name = "orders-up", Path = "billing/../orders/" }
+            }
+        };
+
+        // Act
+        var result = _service.ValidateWorkspaceManifest(manifest, _testDirectory);
+
+        // Assert
+        result.Errors.Should().Contain(e => e.Field == "projects[1].path");
+        result.Errors.Should().Contain(e => e.Field == "projects[2].path");
+        result.Errors.Should().NotContain(e => e.Field.StartsWith("projects[0]"));
+    }
+
     #endregion
 
     #region Helper Methods
@@ -0,0 +1,160 @@
+using FluentAssertions;
+using MjCuadrado.NetSdk.Services;
+
+namespace MjCuadrado.NetSdk.Tests.Services;
+
+/// <summary>
+/// Tests para DiagnosticCheckRunner
+/// </summary>
+public class DiagnosticCheckRunnerTests
+{
+    #region Constructor Tests
+
+    [Fact]
+    public void Constructor_WithZeroTimeout_ThrowsArgumentOutOfRangeException()
+    {
+        // Act & Assert
+        var act = () => new DiagnosticCheckRunner(TimeSpan.Zero);
+        act.Should().Throw<ArgumentOutOfRangeException>()
+            .WithParameterName("timeout");
+    }
+
+    #endregion
+
+    #region RunAsync Tests
+
+    [Fact]
+    public async Task RunAsync_WithNullChecks_ThrowsArgumentNullException()
+    {
+        // Arrange
+        var runner = new DiagnosticCheckRunner();
+
+        // Act & Assert
+        var act = () => runner.RunAsync(null!);
+        await act.Should().ThrowAsync<ArgumentNullException>()
+            .WithParameterName("checks");
+    }
+
+    [Fact]
+    public async Task RunAsync_PreservesCheckOrderAndCollectsSuggestions()
+    {
+        // Arrange
+        var runner = new DiagnosticCheckRunner();
+        var checks = new IDiagnosticCheck[]
+        {
+            CreateCheck("First", delay: TimeSpan.FromMilliseconds(100), suggestion: "first"),
+            CreateCheck("Second", delay: TimeSpan.Zero, suggestion: "second")
+        };
+
+        // Act
+        var result = await runner.RunAsync(checks);
+
+        // Assert
+        result.Checks.Select(c => c.Name).Should().Equal("First", "Second");
+        result.Suggestions.Should().Equal("first", "second");
+        result.AllChecksPassed.Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task RunAsync_RunsChecksInParallel()
+    {
+        // Arrange
+        var runner = new DiagnosticCheckRunner();
+        var delay = TimeSpan.FromMilliseconds(500);
+        var checks = Enumerable.Range(0, 4)
+            .Select(i => CreateCheck($"Check {i}", delay))
+            .ToArray();
+
+        // Act
+        var result = await runner.RunAsync(checks);
+
+        // Assert
+        result.Duration.Should().BeLessThan(delay * checks.Length);
+        result.Checks.Should().OnlyContain(c => c.Duration >= TimeSpan.FromMilliseconds(400));
+    }
+
+    [Fact]
+    public async Task RunAsync_WithSlowCheck_MarksItAsTimedOut()
+    {
+        // Arrange
+        var runner = new DiagnosticCheckRunner(TimeSpan.FromMilliseconds(200));
+        var checks = new IDiagnosticCheck[]
+        {
+            CreateCheck("Slow", TimeSpan.FromSeconds(30)),
+            CreateCheck("Fast", TimeSpan.Zero)
+        };
+
+        // Act
+        var result = await runner.RunAsync(checks);
+
+        // Assert
+        var slow = result.Checks.Single(c => c.Name == "Slow");
+        slow.Success.Should().BeFalse();
+        slow.TimedOut.Should().BeTrue();
+        result.Checks.Single(c => c.Name == "Fast").Success.Should().BeTrue();
+        result.Duration.Should().BeLessThan(TimeSpan.FromSeconds(10));
+    }
+
+    [Fact]
+    public async Task RunAsync_WithBlockingCheck_DoesNotWaitForIt()
+    {
+        // Arrange
+        var runner = new DiagnosticCheckRunner(TimeSpan.FromMilliseconds(200));
+        var check = new DelegateDiagnosticCheck("Blocking", _ =>
+        {
+            Thread.Sleep(TimeSpan.FromSeconds(2));
+            return Task.FromResult(new DiagnosticCheckOutcome());
+        });
+
+        // Act
+        var result = await runner.RunAsync(new[] { check });
+
+        // Assert
+        result.Checks.Single().TimedOut.Should().BeTrue();
+        result.Duration.Should().BeLessThan(TimeSpan.FromSeconds(2));
+    }
+
+    [Fact]
+    public async Task RunAsync_WithThrowingCheck_ReportsFailure()
+    {
+        // Arrange
+        var runner = new DiagnosticCheckRunner();
+        var check = new DelegateDiagnosticCheck("Broken", _ => throw new InvalidOperationException("boom"));
+
+        // Act
+        var result = await runner.RunAsync(new[] { check });
+
+        // Assert
+        var failed = result.Checks.Single();
+        failed.Name.Should().Be("Broken");
+        failed.Success.Should().BeFalse();
+        failed.TimedOut.Should().BeFalse();
+        failed.Details.Should().Be("boom");
+    }
+
+    #endregion
+
+    #region Helper Methods
+
+    private static IDiagnosticCheck CreateCheck(string name, TimeSpan delay, string? suggestion = null)
+    {
+        return new DelegateDiagnosticCheck(name, async ct =>
+        {
+            await Task.Delay(delay, ct);
+
+            var outcome = new DiagnosticCheckOutcome
+            {
+                Check = new DiagnosticCheck { Name = name, Success = true, Message = "OK" }
+            };
+
+            if (suggestion != null)
+            {
+                outcome.Suggestions.Add(suggestion);
+            }
+
+            return outcome;
+        });
+    }
+
+    #endregion
+}
@@ -114,6 +114,50 @@ public class DoctorServiceTests : IDisposable
 
     #endregion
 
+    #region Probe Cache Tests
+
+    [Fact]
+    public void CheckDotNetVersion_WithMatchingCacheEntry_ReturnsCachedResult()
+    {
+        // Arrange
+        var cache = new ToolProbeCache(Path.Combine(_tempDir, "probes.json"));
+        var service = new DoctorService(_fileSystemService, _configurationService, cache);
+        _fileSystemService.GetCurrentDirectory().Returns(_tempDir);
+
+        var stamps = ToolProbeCache.CaptureStamps(ToolProbeCache.DotNetTool, _tempDir);
+        stamps.Should().NotBeNull("este test depende de que dotnet esté en el PATH");
+        cache.Set(ToolProbeCache.DotNetTool, stamps!, success: true, version: "99.0.100-cached");
+
+        // Act
+        var result = service.CheckDotNetVersion();
+
+        // Assert
+        result.Should().Be((true, "99.0.100-cached"));
+    }
+
+    [Fact]
+    public void CheckDotNetVersion_WithBypassProbeCache_ProbesAndRefreshesCache()
+    {
+        // Arrange
+        var cache = new ToolProbeCache(Path.Combine(_tempDir, "probes.json"));
+        var service = new DoctorService(_fileSystemService, _configurationService, cache) { BypassProbeCache = true };
+        _fileSystemService.GetCurrentDirectory().Returns(_tempDir);
+
+        var stamps = ToolProbeCache.CaptureStamps(ToolProbeCache.DotNetTool, _tempDir)!;
+        cache.Set(ToolProbeCache.DotNetTool, stamps, success: true, version: "99.0.100-cached");
+
+        // Act
+        var result = service.CheckDotNetVersion();
+
+        // Assert
+        result.Success.Should().BeTrue();
+        result.Version.Should().NotBe("99.0.100-cached");
+        cache.TryGet(ToolProbeCache.DotNetTool, stamps, out var entry).Should().BeTrue();
+        entry.Version.Should().Be(result.Version);
+    }
+
+    #endregion
+
     #region CheckProjectStructure Tests
 
     [Fact]
@@ -171,7 +215,7 @@ public class DoctorServiceTests : IDisposable
         _fileSystemService.DirectoryExists(Path.Combine(claudeDir, "hooks")).Returns(true);
         _fileSystemService.FileExists(configPath).Returns(true);
 
-        _configurationService.LoadConfiguration(_tempDir).Returns(new SdkConfiguration
+        _configurationService.LoadConfiguration(configPath).Returns(new SdkConfiguration
         {
             Project = new ProjectConfig { Name = "test", Version = "1.0.0" }
         });
@@ -195,7 +239,7 @@ public class DoctorServiceTests : IDisposable
         _fileSystemService.DirectoryExists(sdkDir).Returns(true);
         _fileSystemService.FileExists(configPath).Returns(true);
 
-        _configurationService.LoadConfiguration(_tempDir).Returns(new SdkConfiguration
+        _configurationService.LoadConfiguration(configPath).Returns(new SdkConfiguration
         {
             Project = new ProjectConfig { Name = "test", Version = "1.0.0" }
         });
@@ -216,6 +260,114 @@ public class DoctorServiceTests : IDisposable
         result.MissingItems.Should().Contain(".claude/");
     }
 
+    [Fact]
+    public void CheckProjectStructure_LoadsConfigurationFromConfigJsonPath()
+    {
+        // Arrange
+        var configPath = Path.Combine(_tempDir, ".mjcuadrado-net-sdk", "config.json");
+
+        _fileSystemService.GetCurrentDirectory().Returns(_tempDir);
+        _fileSystemService.DirectoryExists(Arg.Any<string>()).Returns(true);
+        _fileSystemService.FileExists(configPath).Returns(true);
+        _configurationService.LoadConfiguration(Arg.Any<string>()).Returns(new SdkConfiguration());
+
+        // Act
+        var result = _service.CheckProjectStructure();
+
+        // Assert
+        result.Success.Should().BeTrue();
+        _configurationService.Received(1).LoadConfiguration(configPath);
+    }
+
+    #endregion
+
+    #region CheckWorkspace Tests
+
+    [Theory]
+    [InlineData(null)]
+    [InlineData("")]
+    [InlineData("   ")]
+    public void CheckWorkspace_WithEmptyRoot_ThrowsArgumentException(string? rootPath)
+    {
+        // Act & Assert
+        var act = () => _service.CheckWorkspace(rootPath!);
+        act.Should().Throw<ArgumentException>()
+            .WithParameterName("rootPath");
+    }
+
+    [Fact]
+    public void CheckWorkspace_FindsProjectsWithSingleEnumeration()
+    {
+        // Arrange
+        var apiPath = Path.Combine(_tempDir, "services", "api");
+        var webPath = Path.Combine(_tempDir, "services", "web");
+        var directories = CompleteProjectDirectories(apiPath)
+            .Concat(CompleteProjectDirectories(webPath).Where(d => !d.EndsWith("hooks")))
+            .ToList();
+
+        _fileSystemService.EnumerateDirectories(_tempDir, Arg.Any<IEnumerable<string>>()).Returns(directories);
+        _fileSystemService.FileExists(Arg.Any<string>()).Returns(true);
+        _configurationService.LoadConfiguration(Arg.Any<string>())
+            .Returns(new SdkConfiguration { Project = new ProjectConfig { Name = "api" } });
+        _configurationService.ValidateConfiguration(Arg.Any<SdkConfiguration>()).Returns(new ValidationResult());
+
+        // Act
+        var result = _service.CheckWorkspace(_tempDir);
+
+        // Assert
+        result.Projects.Select(p => p.Path).Should().Equal(
+            Path.Combine("services", "api"),
+            Path.Combine("services", "web"));
+        result.Projects[0].Success.Should().BeTrue();
+        result.Projects[0].Name.Should().Be("api");
+        result.Projects[1].MissingItems.Should().Equal(".claude/hooks/");
+        result.AllProjectsHealthy.Should().BeFalse();
+
+        _fileSystemService.Received(1).EnumerateDirectories(_tempDir, Arg.Any<IEnumerable<string>>());
+        _fileSystemService.DidNotReceive().DirectoryExists(Arg.Any<string>());
+        _configurationService.Received(1).LoadConfiguration(Path.Combine(apiPath, ".mjcuadrado-net-sdk", "config.json"));
+    }
+
+    [Fact]
+    public void CheckWorkspace_WithInvalidConfiguration_ReportsConfigErrors()
+    {
+        // Arrange
+        var projectPath = Path.Combine(_tempDir, "api");
+        var validation = new ValidationResult();
+        validation.AddError("project.name", "El nombre del proyecto es requerido");
+
+        _fileSystemService.EnumerateDirectories(_tempDir, Arg.Any<IEnumerable<string>>())
+            .Returns(CompleteProjectDirectories(projectPath));
+        _fileSystemService.FileExists(Arg.Any<string>()).Returns(true);
+        _configurationService.LoadConfiguration(Arg.Any<string>()).Returns(new SdkConfiguration());
+        _configurationService.ValidateConfiguration(Arg.Any<SdkConfiguration>()).Returns(validation);
+
+        // Act
+        var result = _service.CheckWorkspace(_tempDir);
+
+        // Assert
+        var project = result.Projects.Single();
+        project.Success.Should().BeFalse();
+        project.MissingItems.Should().BeEmpty();
+        project.ConfigErrors.Should().ContainSingle()
+            .Which.Should().Contain("project.name");
+    }
+
+    [Fact]
+    public void CheckWorkspace_WithoutProjects_ReturnsEmptyResult()
+    {
+        // Arrange
+        _fileSystemService.EnumerateDirectories(_tempDir, Arg.Any<IEnumerable<string>>())
+            .Returns(new[] { Path.Combine(_tempDir, "src") });
+
+        // Act
+        var result = _service.CheckWorkspace(_tempDir);
+
+        // Assert
+        result.Projects.Should().BeEmpty();
+        result.AllProjectsHealthy.Should().BeTrue();
+    }
+
     #endregion
 
     #region CheckDiskSpace Tests
@@ -385,6 +537,59 @@ public class DoctorServiceTests : IDisposable
         result.Suggestions.Should().Contain(s => s.Contains("100 MB"));
     }
 
+    [Fact]
+    public async Task RunFullDiagnosticAsync_ReportsDurationPerCheck()
+    {
+        // Arrange
+        _fileSystemService.GetCurrentDirectory().Returns(_tempDir);
+        _fileSystemService.DirectoryExists(Arg.Any<string>()).Returns(false);
+        _fileSystemService.GetAvailableDiskSpace(_tempDir).Returns(200L * 1024 * 1024);
+        _fileSystemService.HasWritePermissions(_tempDir).Returns(true);
+
+        // Act
+        var result = await _service.RunFullDiagnosticAsync();
+
+        // Assert
+        result.Checks.Should().HaveCount(5);
+        result.Checks.Should().OnlyContain(c => c.Duration >= TimeSpan.Zero);
+        result.Duration.Should().BeGreaterThanOrEqualTo(result.Checks.Max(c => c.Duration));
+    }
+
+    [Fact]
+    public async Task RunFullDiagnosticAsync_WithHangingCheck_TimesOutOnlyThatCheck()
+    {
+        // Arrange
+        _service.CheckTimeout = TimeSpan.FromMilliseconds(500);
+        _fileSystemService.GetCurrentDirectory().Returns(_tempDir);
+        _fileSystemService.DirectoryExists(Arg.Any<string>()).Returns(false);
+        _fileSystemService.GetAvailableDiskSpace(_tempDir).Returns(x =>
+        {
+            Thread.Sleep(TimeSpan.FromSeconds(3));
+            return 200L * 1024 * 1024;
+        });
+        _fileSystemService.HasWritePermissions(_tempDir).Returns(true);
+
+        // Act
+        var result = await _service.RunFullDiagnosticAsync();
+
+        // Assert
+        var diskCheck = result.Checks.Single(c => c.Name == "Disk Space");
+        diskCheck.Success.Should().BeFalse();
+        diskCheck.TimedOut.Should().BeTrue();
+        result.Checks.Single(c => c.Name == "Write Permissions").Success.Should().BeTrue();
+    }
+
+    [Fact]
+    public void CreateChecks_ReturnsChecksInReportOrder()
+    {
+        // Act
+        var checks = _service.CreateChecks();
+
+        // Assert
+        checks.Select(c => c.Name).Should().Equal(
+            ".NET SDK", "Git", "Project Structure", "Disk Space", "Write Permissions");
+    }
+
     #endregion
 
     #region DiagnosticResult Tests
@@ -414,4 +619,15 @@ public class DoctorServiceTests : IDisposable
     }
 
     #endregion
+
+    #region Helper Methods
+
+    private static List<string> CompleteProjectDirectories(string projectPath)
+    {
+        return ProjectLayout.Folders
+            .Select(folder => Path.Combine(projectPath, folder.Replace('/', Path.DirectorySeparatorChar)))
+            .ToList();
+    }
+
+    #endregion
 }
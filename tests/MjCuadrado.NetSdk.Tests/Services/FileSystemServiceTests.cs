@@ -566,4 +566,59 @@ public class FileSystemServiceTests : IDisposable
     }
 
     #endregion
+
+    #region EnumerateDirectories Tests
+
+    [Fact]
+    public void EnumerateDirectories_ReturnsNestedAndHiddenDirectories()
+    {
+        // Arrange
+        Directory.CreateDirectory(Path.Combine(_testDirectory, "services", "api", ".mjcuadrado-net-sdk", "memory"));
+        File.WriteAllText(Path.Combine(_testDirectory, "services", "file.txt"), "test");
+
+        // Act
+        var result = _service.EnumerateDirectories(_testDirectory);
+
+        // Assert
+        result.Should().BeEquivalentTo(new[]
+        {
+            Path.Combine(_testDirectory, "services"),
+            Path.Combine(_testDirectory, "services", "api"),
+            Path.Combine(_testDirectory, "services", "api", ".mjcuadrado-net-sdk"),
+            Path.Combine(_testDirectory, "services", "api", ".mjcuadrado-net-sdk", "memory")
+        });
+    }
+
+    [Fact]
+    public void EnumerateDirectories_DoesNotRecurseIntoExcludedFolders()
+    {
+        // Arrange
+        Directory.CreateDirectory(Path.Combine(_testDirectory, "node_modules", "pkg", ".mjcuadrado-net-sdk"));
+        Directory.CreateDirectory(Path.Combine(_testDirectory, "src"));
+
+        // Act
+        var result = _service.EnumerateDirectories(_testDirectory, new[] { "node_modules" });
+
+        // Assert
+        result.Should().Contain(Path.Combine(_testDirectory, "src"));
+        result.Should().NotContain(d => d.Contains("pkg"));
+    }
+
+    [Fact]
+    public void EnumerateDirectories_WhenRootDoesNotExist_ThrowsDirectoryNotFoundException()
+    {
+        // Act & Assert
+        var act = () => _service.EnumerateDirectories(Path.Combine(_testDirectory, "nonexistent"));
+        act.Should().Throw<DirectoryNotFoundException>();
+    }
+
+    [Fact]
+    public void EnumerateDirectories_WhenRootEmpty_ThrowsArgumentException()
+    {
+        // Act & Assert
+        var act = () => _service.EnumerateDirectories("");
+        act.Should().Throw<ArgumentException>();
+    }
+
+    #endregion
 }
@@ -0,0 +1,92 @@
+using FluentAssertions;
+using MjCuadrado.NetSdk.Services;
+
+namespace MjCuadrado.NetSdk.Tests.Services;
+
+/// <summary>
+/// Tests para ProjectLayout
+/// </summary>
+public class ProjectLayoutTests
+{
+    private static readonly string ProjectPath = Path.Combine(Path.GetTempPath(), "project");
+
+    #region FindMissingFolders Tests
+
+    [Fact]
+    public void FindMissingFolders_WithCompleteStructure_ReturnsEmpty()
+    {
+        // Arrange
+        var existing = AllFolders();
+
+        // Act
+        var result = ProjectLayout.FindMissingFolders(ProjectPath, existing.Contains);
+
+        // Assert
+        result.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void FindMissingFolders_WithMissingParent_DoesNotReportChildren()
+    {
+        // Arrange
+        var existing = AllFolders();
+        existing.RemoveWhere(path => path.Contains(ProjectLayout.ClaudeFolder));
+
+        // Act
+        var result = ProjectLayout.FindMissingFolders(ProjectPath, existing.Contains);
+
+        // Assert
+        result.Should().Equal(".claude/");
+    }
+
+    [Fact]
+    public void FindMissingFolders_ReportsSdkSubfoldersRelativeToSdkFolder()
+    {
+        // Arrange
+        var existing = AllFolders();
+        existing.Remove(Path.Combine(ProjectPath, ProjectLayout.SdkFolder, "specs"));
+        existing.Remove(Path.Combine(ProjectPath, ProjectLayout.ClaudeFolder, "hooks"));
+
+        // Act
+        var result = ProjectLayout.FindMissingFolders(ProjectPath, existing.Contains);
+
+        // Assert
+        result.Should().Equal("specs/", ".claude/hooks/");
+    }
+
+    [Fact]
+    public void FindMissingFolders_WithNullPredicate_ThrowsArgumentNullException()
+    {
+        // Act & Assert
+        var act = () => ProjectLayout.FindMissingFolders(ProjectPath, null!);
+        act.Should().Throw<ArgumentNullException>()
+            .WithParameterName("directoryExists");
+    }
+
+    #endregion
+
+    #region GetConfigPath Tests
+
+    [Fact]
+    public void GetConfigPath_ReturnsConfigJsonInsideSdkFolder()
+    {
+        // Act
+        var result = ProjectLayout.GetConfigPath(ProjectPath);
+
+        // Assert
+        result.Should().Be(Path.Combine(ProjectPath, ".mjcuadrado-net-sdk", "config.json"));
+    }
+
+    #endregion
+
+    #region Helper Methods
+
+    private static HashSet<string> AllFolders()
+    {
+        return ProjectLayout.Folders
+            .Select(folder => Path.Combine(ProjectPath, folder.Replace('/', Path.DirectorySeparatorChar)))
+            .ToHashSet();
+    }
+
+    #endregion
+}
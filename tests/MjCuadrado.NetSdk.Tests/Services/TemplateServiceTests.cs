@@ -107,6 +107,21 @@ public class TemplateServiceTests : IDisposable
         File.Exists(Path.Combine(_testDirectory, ".claude", "hooks", "README.md")).Should().BeTrue();
     }
 
+    [Fact]
+    public void GenerateProjectStructure_KeepsEscapedPlaceholdersLiteral()
+    {
+        // Arrange
+        var projectInfo = CreateValidProjectInfo();
+
+        // Act
+        _service.GenerateProjectStructure(projectInfo);
+
+        // Assert
+        var content = File.ReadAllText(Path.Combine(_testDirectory, ".claude", "commands", "README.md"));
+        content.Should().Contain("- {{FILE}}: Archivo actual");
+        content.Should().NotContain(@"\{{");
+    }
+
     [Fact]
     public void GenerateProjectStructure_WhenProjectInfoNull_ThrowsArgumentNullException()
     {
@@ -129,6 +144,181 @@ public class TemplateServiceTests : IDisposable
 
     #endregion
 
+    #region Incremental Generation Tests
+
+    [Fact]
+    public void GenerateProjectStructure_WritesGenerationManifest()
+    {
+        // Arrange
+        var projectInfo = CreateValidProjectInfo();
+
+        // Act
+        _service.GenerateProjectStructure(projectInfo);
+
+        // Assert
+        var manifestPath = Path.Combine(_testDirectory, TemplateService.GenerationManifestPath);
+        File.Exists(manifestPath).Should().BeTrue();
+        var content = File.ReadAllText(manifestPath);
+        content.Should().Contain(".mjcuadrado-net-sdk/config.json");
+        content.Should().Contain(".claude/hooks/README.md");
+    }
+
+    [Fact]
+    public void PlanProjectStructure_OnEmptyDirectory_CreatesEverythingWithoutWriting()
+    {
+        // Arrange
+        var projectInfo = CreateValidProjectInfo();
+
+        // Act
+        var plan = _service.PlanProjectStructure(projectInfo);
+
+        // Assert
+        plan.Files.Should().HaveCount(11);
+        plan.Files.Should().OnlyContain(f => f.Action == PlannedFileAction.Create);
+        Directory.Exists(Path.Combine(_testDirectory, ".mjcuadrado-net-sdk")).Should().BeFalse();
+    }
+
+    [Fact]
+    public void GenerateProjectStructure_WhenRerun_DoesNotRewriteUnchangedFiles()
+    {
+        // Arrange
+        var projectInfo = CreateValidProjectInfo();
+        _service.GenerateProjectStructure(projectInfo);
+        var productPath = Path.Combine(_testDirectory, ".mjcuadrado-net-sdk", "product.md");
+        var manifestPath = Path.Combine(_testDirectory, TemplateService.GenerationManifestPath);
+        var past = new DateTime(2020, 1, 1, 0, 0, 0, DateTimeKind.Utc);
+        File.SetLastWriteTimeUtc(productPath, past);
+        File.SetLastWriteTimeUtc(manifestPath, past);
+
+        // Act
+        var plan = _service.PlanProjectStructure(projectInfo);
+        _service.GenerateProjectStructure(projectInfo);
+
+        // Assert
+        plan.Files.Should().OnlyContain(f => f.Action == PlannedFileAction.Unchanged);
+        plan.HasWrites.Should().BeFalse();
+        File.GetLastWriteTimeUtc(productPath).Should().Be(past);
+        File.GetLastWriteTimeUtc(manifestPath).Should().Be(past);
+    }
+
+    [Fact]
+    public void GenerateProjectStructure_WhenRerun_KeepsOriginalCreatedDate()
+    {
+        // Arrange
+        var projectInfo = CreateValidProjectInfo();
+        _service.GenerateProjectStructure(projectInfo);
+        projectInfo.CreatedDate = "2030-12-31";
+
+        // Act
+        var plan = _service.PlanProjectStructure(projectInfo);
+
+        // Assert
+        plan.Created.Should().Be("2024-01-01");
+        plan.HasWrites.Should().BeFalse();
+    }
+
+    [Fact]
+    public void GenerateProjectStructure_WhenVariablesChange_UpdatesOnlyAffectedFiles()
+    {
+        // Arrange
+        var projectInfo = CreateValidProjectInfo();
+        _service.GenerateProjectStructure(projectInfo);
+        projectInfo.Framework = "net9.0";
+
+        // Act
+        var plan = _service.PlanProjectStructure(projectInfo);
+        _service.ApplyGenerationPlan(plan);
+
+        // Assert
+        plan.Files.Where(f => f.Action == PlannedFileAction.Update)
+            .Select(f => f.RelativePath)
+            .Should().BeEquivalentTo(".mjcuadrado-net-sdk/config.json", ".mjcuadrado-net-sdk/tech.md");
+        File.ReadAllText(Path.Combine(_testDirectory, ".mjcuadrado-net-sdk", "tech.md")).Should().Contain("net9.0");
+    }
+
+    [Fact]
+    public void GenerateProjectStructure_WhenUserEditedFile_KeepsEdit()
+    {
+        // Arrange
+        var projectInfo = CreateValidProjectInfo();
+        _service.GenerateProjectStructure(projectInfo);
+        var productPath = Path.Combine(_testDirectory, ".mjcuadrado-net-sdk", "product.md");
+        File.WriteAllText(productPath, "Mi producto");
+        projectInfo.Name = "renamed-project";
+
+        // Act
+        var plan = _service.PlanProjectStructure(projectInfo);
+        _service.ApplyGenerationPlan(plan);
+
+        // Assert
+        plan.Files.Single(f => f.RelativePath == ".mjcuadrado-net-sdk/product.md")
+            .Action.Should().Be(PlannedFileAction.KeepModified);
+        File.ReadAllText(productPath).Should().Be("Mi producto");
+
+        // La edición se sigue detectando en la siguiente ejecución
+        _service.PlanProjectStructure(projectInfo).Files
+            .Single(f => f.RelativePath == ".mjcuadrado-net-sdk/product.md")
+            .Action.Should().Be(PlannedFileAction.KeepModified);
+    }
+
+    [Fact]
+    public void GenerateProjectStructure_WithOverwriteModified_ReplacesEditedFile()
+    {
+        // Arrange
+        var projectInfo = CreateValidProjectInfo();
+        _service.GenerateProjectStructure(projectInfo);
+        var productPath = Path.Combine(_testDirectory, ".mjcuadrado-net-sdk", "product.md");
+        File.WriteAllText(productPath, "Mi producto");
+        projectInfo.OverwriteModified = true;
+
+        // Act
+        _service.GenerateProjectStructure(projectInfo);
+
+        // Assert
+        File.ReadAllText(productPath).Should().Contain(projectInfo.Name);
+    }
+
+    [Fact]
+    public void PlanProjectStructure_WithoutManifestAndForce_OverwritesDifferingFiles()
+    {
+        // Arrange: proyecto creado antes de que existiera generated.json
+        var projectInfo = CreateValidProjectInfo();
+        _service.GenerateProjectStructure(projectInfo);
+        File.Delete(Path.Combine(_testDirectory, TemplateService.GenerationManifestPath));
+        var productPath = Path.Combine(_testDirectory, ".mjcuadrado-net-sdk", "product.md");
+        File.WriteAllText(productPath, "Mi producto");
+        projectInfo.Force = true;
+
+        // Act
+        var plan = _service.PlanProjectStructure(projectInfo);
+        _service.ApplyGenerationPlan(plan);
+
+        // Assert
+        plan.Files.Single(f => f.RelativePath == ".mjcuadrado-net-sdk/product.md")
+            .Action.Should().Be(PlannedFileAction.Overwrite);
+        File.ReadAllText(productPath).Should().Contain(projectInfo.Name);
+        File.Exists(Path.Combine(_testDirectory, TemplateService.GenerationManifestPath)).Should().BeTrue();
+    }
+
+    [Fact]
+    public void PlanProjectStructure_WithoutManifestOrForce_KeepsDifferingFiles()
+    {
+        // Arrange
+        var projectInfo = CreateValidProjectInfo();
+        _service.GenerateProjectStructure(projectInfo);
+        File.Delete(Path.Combine(_testDirectory, TemplateService.GenerationManifestPath));
+        File.WriteAllText(Path.Combine(_testDirectory, ".mjcuadrado-net-sdk", "product.md"), "Mi producto");
+
+        // Act
+        var plan = _service.PlanProjectStructure(projectInfo);
+
+        // Assert
+        plan.Files.Single(f => f.RelativePath == ".mjcuadrado-net-sdk/product.md")
+            .Action.Should().Be(PlannedFileAction.KeepModified);
+    }
+
+    #endregion
+
     #region GenerateConfigFile Tests
 
     [Fact]
@@ -341,6 +531,50 @@ public class TemplateServiceTests : IDisposable
         content.Should().NotBeNullOrEmpty();
     }
 
+    [Fact]
+    public void GetTemplate_ReturnsCachedInstance()
+    {
+        // Act
+        var first = _service.GetTemplate("config.json.template");
+        var second = _service.GetTemplate("config.json.template");
+
+        // Assert
+        second.Should().BeSameAs(first);
+        first.Variables.Should().Contain(new[] { "PROJECT_NAME", "DATE", "AUTHOR" });
+    }
+
+    [Fact]
+    public void GetTemplate_WhenTemplateNotFound_ThrowsFileNotFoundException()
+    {
+        // Act & Assert
+        var act = () => _service.GetTemplate("nonexistent.template");
+        act.Should().Throw<FileNotFoundException>();
+    }
+
+    [Theory]
+    [InlineData("config.json.template")]
+    [InlineData("product.md.template")]
+    [InlineData("structure.md.template")]
+    [InlineData("tech.md.template")]
+    [InlineData("specs-README.md.template")]
+    [InlineData("memory-README.md.template")]
+    [InlineData("reports-README.md.template")]
+    [InlineData("claude-agents-README.md.template")]
+    [InlineData("claude-commands-README.md.template")]
+    [InlineData("claude-skills-README.md.template")]
+    [InlineData("claude-hooks-README.md.template")]
+    public void GetTemplate_AllTemplatesUseKnownVariables(string templateName)
+    {
+        // Arrange
+        var variables = _service.CreateVariablesDictionary(CreateValidProjectInfo());
+
+        // Act
+        var missing = _service.GetTemplate(templateName).FindMissingVariables(variables);
+
+        // Assert
+        missing.Should().BeEmpty();
+    }
+
     #endregion
 
     #region ReplaceVariables Tests
@@ -395,6 +629,38 @@ public class TemplateServiceTests : IDisposable
         result.Should().Be("MyApp is a great project. Use MyApp wisely.");
     }
 
+    [Fact]
+    public void ReplaceVariables_WithEscapedPlaceholder_EmitsItLiterally()
+    {
+        // Arrange
+        var content = @"\{{PROJECT_NAME}}: {{PROJECT_NAME}}";
+        var variables = new Dictionary<string, string>
+        {
+            { "PROJECT_NAME", "MyApp" }
+        };
+
+        // Act
+        var result = _service.ReplaceVariables(content, variables);
+
+        // Assert
+        result.Should().Be("{{PROJECT_NAME}}: MyApp");
+    }
+
+    [Fact]
+    public void ReplaceVariables_OnTemplateContent_MatchesCompiledTemplateRender()
+    {
+        // Arrange
+        var variables = _service.CreateVariablesDictionary(CreateValidProjectInfo());
+        var content = _service.GetTemplateContent("claude-commands-README.md.template");
+
+        // Act
+        var result = _service.ReplaceVariables(content, variables);
+
+        // Assert
+        result.Should().Be(_service.GetTemplate("claude-commands-README.md.template").Render(variables));
+        result.Should().Contain("- {{FILE}}: Archivo actual");
+    }
+
     [Fact]
     public void ReplaceVariables_WhenContentNull_ThrowsArgumentNullException()
     {
@@ -0,0 +1,209 @@
+using FluentAssertions;
+using MjCuadrado.NetSdk.Models;
+using MjCuadrado.NetSdk.Services;
+
+namespace MjCuadrado.NetSdk.Tests.Services;
+
+/// <summary>
+/// Tests para ToolProbeCache
+/// </summary>
+public class ToolProbeCacheTests : IDisposable
+{
+    private readonly string _tempDir;
+    private readonly string _cachePath;
+
+    public ToolProbeCacheTests()
+    {
+        _tempDir = Path.Combine(Path.GetTempPath(), $"mjcuadrado-probes-{Guid.NewGuid()}");
+        Directory.CreateDirectory(_tempDir);
+        _cachePath = Path.Combine(_tempDir, "cache", "probes.json");
+    }
+
+    public void Dispose()
+    {
+        if (Directory.Exists(_tempDir))
+        {
+            Directory.Delete(_tempDir, true);
+        }
+    }
+
+    #region Constructor Tests
+
+    [Theory]
+    [InlineData(null)]
+    [InlineData("")]
+    [InlineData("   ")]
+    public void Constructor_WithEmptyPath_ThrowsArgumentException(string? path)
+    {
+        // Act & Assert
+        var act = () => new ToolProbeCache(path!);
+        act.Should().Throw<ArgumentException>()
+            .WithParameterName("cacheFilePath");
+    }
+
+    [Fact]
+    public void GetDefaultCachePath_EndsWithProbesFile()
+    {
+        // Act
+        var path = ToolProbeCache.GetDefaultCachePath();
+
+        // Assert
+        Path.IsPathRooted(path).Should().BeTrue();
+        path.Should().EndWith(Path.Combine("mjcuadrado-net-sdk", "probes.json"));
+    }
+
+    #endregion
+
+    #region TryGet / Set Tests
+
+    [Fact]
+    public void TryGet_WithoutEntries_ReturnsFalse()
+    {
+        // Arrange
+        var cache = new ToolProbeCache(_cachePath);
+
+        // Act & Assert
+        cache.TryGet(ToolProbeCache.GitTool, CreateStamps(), out _).Should().BeFalse();
+    }
+
+    [Fact]
+    public void Set_PersistsEntryForOtherInstances()
+    {
+        // Arrange
+        var stamps = CreateStamps();
+        new ToolProbeCache(_cachePath).Set(ToolProbeCache.GitTool, stamps, success: true, version: "2.43.0", configured: true);
+
+        // Act
+        var found = new ToolProbeCache(_cachePath).TryGet(ToolProbeCache.GitTool, CreateStamps(), out var entry);
+
+        // Assert
+        found.Should().BeTrue();
+        entry.Version.Should().Be("2.43.0");
+        entry.Configured.Should().BeTrue();
+    }
+
+    [Fact]
+    public void TryGet_WhenStampedFileChanges_ReturnsFalse()
+    {
+        // Arrange
+        var cache = new ToolProbeCache(_cachePath);
+        cache.Set(ToolProbeCache.GitTool, CreateStamps(), success: true, version: "2.43.0");
+
+        // Act
+        File.AppendAllText(Path.Combine(_tempDir, "tool"), " actualizado");
+
+        // Assert
+        cache.TryGet(ToolProbeCache.GitTool, CreateStamps(), out _).Should().BeFalse();
+    }
+
+    [Fact]
+    public void TryGet_WhenMissingConfigFileIsCreated_ReturnsFalse()
+    {
+        // Arrange
+        var cache = new ToolProbeCache(_cachePath);
+        cache.Set(ToolProbeCache.GitTool, CreateStamps(), success: true, version: "2.43.0", configured: false);
+
+        // Act
+        File.WriteAllText(Path.Combine(_tempDir, ".gitconfig"), "[user]\n\tname = Test");
+
+        // Assert
+        cache.TryGet(ToolProbeCache.GitTool, CreateStamps(), out _).Should().BeFalse();
+    }
+
+    [Fact]
+    public void TryGet_WithExpiredEntry_ReturnsFalse()
+    {
+        // Arrange
+        var cache = new ToolProbeCache(_cachePath);
+        cache.Set(ToolProbeCache.GitTool, CreateStamps(), success: true, version: "2.43.0");
+
+        // Act
+        cache.MaxAge = TimeSpan.Zero;
+
+        // Assert
+        cache.TryGet(ToolProbeCache.GitTool, CreateStamps(), out _).Should().BeFalse();
+    }
+
+    [Fact]
+    public void Set_EvictsExpiredEntries()
+    {
+        // Arrange
+        var cache = new ToolProbeCache(_cachePath);
+        cache.Set(ToolProbeCache.DotNetTool, CreateStamps(), success: true, version: "10.0.100");
+
+        // Act
+        cache.MaxAge = TimeSpan.FromTicks(1);
+        Thread.Sleep(10);
+        cache.Set(ToolProbeCache.GitTool, CreateStamps(), success: true, version: "2.43.0");
+
+        // Assert
+        File.ReadAllText(_cachePath).Should().NotContain("10.0.100");
+    }
+
+    [Fact]
+    public void TryGet_WithCorruptFile_ReturnsFalse()
+    {
+        // Arrange
+        Directory.CreateDirectory(Path.GetDirectoryName(_cachePath)!);
+        File.WriteAllText(_cachePath, "{ no es json");
+        var cache = new ToolProbeCache(_cachePath);
+
+        // Act & Assert
+        cache.TryGet(ToolProbeCache.GitTool, CreateStamps(), out _).Should().BeFalse();
+    }
+
+    #endregion
+
+    #region CaptureStamps Tests
+
+    [Fact]
+    public void CaptureStamps_WithUnknownTool_ReturnsNull()
+    {
+        // Act
+        var stamps = ToolProbeCache.CaptureStamps($"mjcuadrado-missing-{Guid.NewGuid():N}", _tempDir);
+
+        // Assert
+        stamps.Should().BeNull();
+    }
+
+    [Fact]
+    public void CaptureStamps_ForDotNet_IncludesNearestGlobalJson()
+    {
+        // Arrange
+        var globalJson = Path.Combine(_tempDir, "global.json");
+        File.WriteAllText(globalJson, "{}");
+        var workingDirectory = Directory.CreateDirectory(Path.Combine(_tempDir, "src", "app")).FullName;
+
+        // Act
+        var stamps = ToolProbeCache.CaptureStamps(ToolProbeCache.DotNetTool, workingDirectory);
+
+        // Assert
+        // Este test depende de que dotnet esté en el PATH
+        stamps.Should().NotBeNull();
+        stamps!.Should().Contain(s => s.Path == Path.GetFullPath(globalJson) && s.Exists);
+    }
+
+    #endregion
+
+    #region Helper Methods
+
+    /// <summary>
+    /// Huella de un ejecutable ficticio y un archivo de configuración que todavía no existe
+    /// </summary>
+    private List<FileStamp> CreateStamps()
+    {
+        var tool = Path.Combine(_tempDir, "tool");
+        if (!File.Exists(tool))
+        {
+            File.WriteAllText(tool, "binario");
+        }
+
+        return new List<FileStamp>
+        {
+            FileStamp.Capture(tool),
+            FileStamp.Capture(Path.Combine(_tempDir, ".gitconfig"))
+        };
+    }
+
+    #endregion
+}